@@ -0,0 +1,94 @@
+"""
+Benchmark evil mode guesses on a dictionary-sized word list.
+
+Plays rounds of evil mode over ``/usr/share/dict/words``, or over a
+synthetic list of the same size where there is none, guessing letters
+from the most to the least common. Times setting up the candidates at
+the start of a round and every guess, with NumPy and with the
+pure-Python fallback, which must pick the same families.
+
+A guess has to fit well within a 60 FPS frame (16.7 ms).
+
+Run from the repository root:
+    python -m benchmarks.bench_adversary
+"""
+import os
+import random
+import time
+import src.adversary as adversary
+from benchmarks.bench_sampler import make_words
+from src.adversary import AdversaryEngine
+from src.randomword import load_words_from_file
+
+DICTIONARY = '/usr/share/dict/words'
+SYNTHETIC_WORDS = 235_000
+LENGTHS = [5, 8, 11]
+GUESS_ORDER = 'ESIARNTOLCDUGPMHBYFVKWZXQJ'
+
+
+def play(words, start_word):
+    """
+    Play one evil round, guessing letters in ``GUESS_ORDER``.
+
+    Args:
+        words: The word list
+        start_word: The word the round starts from
+
+    Returns:
+        tuple: (setup seconds, list of seconds per guess, candidates at
+               the start, list of (pattern, candidates left) per guess)
+    """
+    engine = AdversaryEngine(start_word)
+    start = time.perf_counter()
+    engine.set_candidates(words)
+    setup = time.perf_counter() - start
+    candidates = len(engine.candidates)
+
+    times = []
+    played = []
+    for letter in GUESS_ORDER:
+        start = time.perf_counter()
+        engine.guess(letter)
+        times.append(time.perf_counter() - start)
+        played.append((engine.get_pattern(), len(engine.candidates)))
+        if engine.result:
+            break
+    return setup, times, candidates, played
+
+
+def main():
+    """
+    Run the benchmark and print the results.
+    """
+    if os.path.exists(DICTIONARY):
+        words = load_words_from_file(DICTIONARY)
+        source = DICTIONARY
+    else:
+        words = make_words(SYNTHETIC_WORDS)
+        source = "synthetic words"
+    print(f"{len(words)} words from {source}")
+
+    numpy = adversary.np
+    modes = [("numpy", numpy), ("python", None)] if numpy is not None else [("python", None)]
+    rng = random.Random(7)
+    starts = [rng.choice([word for word in words if len(word) == length])
+              for length in LENGTHS if any(len(word) == length for word in words)]
+
+    print(f"{'length':>6} {'mode':<7} {'candidates':>10} {'setup ms':>9} "
+          f"{'guess ms':>9} {'worst ms':>9} {'guesses':>8}")
+    for start_word in starts:
+        results = {}
+        for name, module in modes:
+            adversary.np = module
+            try:
+                setup, times, candidates, played = results[name] = play(words, start_word)
+            finally:
+                adversary.np = numpy
+            print(f"{len(start_word):>6} {name:<7} {candidates:>10} {setup * 1000:>9.2f} "
+                  f"{sum(times) / len(times) * 1000:>9.3f} {max(times) * 1000:>9.3f} {len(times):>8}")
+        if len(results) > 1 and results["numpy"][3] != results["python"][3]:
+            print(f"  NumPy and pure Python kept different families for {start_word!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark the difficulty menu with growing numbers of categories.
+
+For 3, 30 and 1,000 categories, times:
+
+- full: a complete frame, e.g. when the menu is entered
+- click: selecting a category and drawing the frame that shows it
+- scroll: moving the category list one row and drawing the frame
+
+Before the menu was pre-composited, every click cost a full frame.
+
+Run from the repository root:
+    python -m benchmarks.bench_menu
+"""
+import os
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from benchmarks.suite import measure
+from src.game import HangmanGame
+
+COUNTS = [3, 30, 1000]
+
+
+def main():
+    """
+    Run the benchmark and print the results.
+    """
+    tmp = tempfile.TemporaryDirectory()
+    pygame.init()
+    game = HangmanGame()
+    game.SAVE_FILE = os.path.join(tmp.name, 'bench.sav')
+    game.STATS_FILE = os.path.join(tmp.name, 'bench_stats.db')
+    game.ensure_loaded()
+    selector = game.difficulty_selector
+    row = selector.cat_slots[0].center
+    state = {"down": True}
+
+    def full():
+        selector.needs_full_redraw = True
+        selector.draw()
+
+    def click():
+        selector.handle_click(row)
+        selector.draw()
+
+    def scroll():
+        # Alternate, so the list never reaches its end
+        state["down"] = not state["down"]
+        selector.scroll(1 if state["down"] else -1)
+        selector.draw()
+
+    print(f"{'categories':>10} {'full ms':>9} {'click ms':>9} {'scroll ms':>10}")
+    for count in COUNTS:
+        selector.set_categories([f"category_{i:04d}" for i in range(count)])
+        results = [measure(func) / 1000 for func in (full, click, scroll)]
+        print(f"{count:>10} {results[0]:>9.3f} {results[1]:>9.3f} {results[2]:>10.3f}")
+    game.save_log.close()
+    game.stats.close()
+    pygame.quit()
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark starting a round with and without the background prefetch.
+
+Times what the main thread spends between "Start Game" and the first
+frame of the round (``reset_game()`` and ``draw()``) for a category of
+WORDS words:
+
+- reload: the category file changed since the last round, so it is read
+  and its sampler rebuilt
+- evil: evil mode, whose candidates are filtered from the whole category
+
+Without prefetch this work stalls the main thread; with it, the work
+happens while the game over screen is shown.
+
+Run from the repository root:
+    python -m benchmarks.bench_prefetch
+"""
+import os
+import statistics
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from benchmarks.bench_sampler import make_words
+from src.game import HangmanGame
+from src.randomword import get_category_catalog
+
+WORDS = 200_000
+ROUNDS = 5
+CATEGORY = 'bench_big'
+
+
+def start_round(game, path, evil, prefetch):
+    """
+    Start one round and time the main thread's part.
+
+    Args:
+        game: The game
+        path: Path of the category file
+        evil: Whether to play in evil mode
+        prefetch: Whether to prepare the round in the background first
+
+    Returns:
+        float: Milliseconds from starting the round to its first frame
+    """
+    game.category, game.evil = CATEGORY, evil
+    if not evil:
+        # Looks like an edited file, which makes the category reload
+        stamp = time.time_ns()
+        os.utime(path, ns=(stamp, stamp))
+    if prefetch:
+        game.prefetch_round()
+        game.prefetcher.wait()
+
+    start = time.perf_counter()
+    game.reset_game()
+    game.draw()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    """
+    Run the benchmark and print the results.
+    """
+    tmp = tempfile.TemporaryDirectory()
+    path = os.path.join(tmp.name, f'{CATEGORY}.txt')
+    with open(path, 'w') as file:
+        file.write('\n'.join(make_words(WORDS)) + '\n')
+
+    pygame.init()
+    game = HangmanGame()
+    game.SAVE_FILE = os.path.join(tmp.name, 'bench.sav')
+    game.STATS_FILE = os.path.join(tmp.name, 'bench_stats.db')
+    game.ensure_loaded()
+    catalog = get_category_catalog()
+    catalog.directory = tmp.name
+    catalog.refresh()
+
+    print(f"{WORDS} words in the category, median of {ROUNDS} rounds")
+    print(f"{'case':<8} {'sync ms':>9} {'prefetched ms':>14}")
+    for name, evil in (("reload", False), ("evil", True)):
+        times = {}
+        for prefetch in (False, True):
+            start_round(game, path, evil, prefetch)
+            times[prefetch] = statistics.median(
+                start_round(game, path, evil, prefetch) for _ in range(ROUNDS))
+        print(f"{name:<8} {times[False]:>9.2f} {times[True]:>14.2f}")
+
+    game.save_log.close()
+    game.stats.close()
+    pygame.quit()
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark picking random words.
+
+Compares, per draw:
+
+- rebuild: the old way, filtering the word list into a bucket and
+  calling ``random.choice`` on every pick
+- index: ``WordIndex.random_word()``, a uniform pick from a prebuilt bucket
+- alias: ``WordSampler.draw()``, a weighted pick from an alias table
+- bag: ``WordSampler.next()``, the no-repeat shuffled bag
+
+and times building an alias table over WORDS weights. The weighted
+draws are checked against the expected distribution.
+
+Run from the repository root:
+    python -m benchmarks.bench_sampler
+"""
+import random
+import time
+from src.sampler import AliasTable, WordSampler
+from src.wordindex import WordIndex
+
+WORDS = 1_000_000
+DRAWS = 200_000
+
+
+def make_words(count, seed=1234):
+    """
+    Make random lowercase words of 3 to 12 letters.
+
+    Args:
+        count: Number of words
+        seed: Seed for the words
+
+    Returns:
+        list: The words
+    """
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    return [''.join(rng.choices(letters, k=rng.randint(3, 12))) for _ in range(count)]
+
+
+def per_draw(func, draws):
+    """
+    Time a function per call.
+
+    Args:
+        func: Function to call
+        draws: Number of calls
+
+    Returns:
+        float: Microseconds per call
+    """
+    start = time.perf_counter()
+    for _ in range(draws):
+        func()
+    return (time.perf_counter() - start) / draws * 1e6
+
+
+def check_distribution(weights, draws=1_000_000, seed=99):
+    """
+    Compare alias table draws with the weights they should follow.
+
+    Args:
+        weights: The weights
+        draws: Number of draws
+        seed: Seed of the draws
+
+    Returns:
+        float: Largest absolute difference between drawn and expected share
+    """
+    table = AliasTable(weights)
+    rng = random.Random(seed)
+    counts = [0] * len(weights)
+    for _ in range(draws):
+        counts[table.draw(rng)] += 1
+    total = sum(weights)
+    return max(abs(count / draws - weight / total) for count, weight in zip(counts, weights))
+
+
+def main():
+    """
+    Run the benchmark and print the results.
+    """
+    words = make_words(WORDS)
+    index = WordIndex.build(words)
+    hard = index.get_words('hard')
+    rng = random.Random(1)
+    weights = [rng.uniform(0.1, 10.0) for _ in hard]
+    sampler = WordSampler(hard, weights)
+    uniform = WordSampler(hard)
+
+    rebuild_draws = 20
+    rebuild = per_draw(lambda: random.choice([word for word in words if len(word) >= 8]), rebuild_draws)
+    results = [
+        ("rebuild", rebuild),
+        ("index", per_draw(lambda: index.random_word('hard'), DRAWS)),
+        ("alias", per_draw(sampler.draw, DRAWS)),
+        ("uniform", per_draw(uniform.draw, DRAWS)),
+        ("bag", per_draw(sampler.next, DRAWS)),
+    ]
+
+    start = time.perf_counter()
+    AliasTable([rng.random() + 0.01 for _ in range(WORDS)])
+    build = time.perf_counter() - start
+
+    print(f"{WORDS} words, {len(hard)} in the hard bucket")
+    print(f"{'method':<8} {'us/draw':>10} {'speedup':>9}")
+    for name, micros in results:
+        print(f"{name:<8} {micros:>10.2f} {rebuild / micros:>8.0f}x")
+    print(f"alias table over {WORDS} weights built in {build * 1000:.0f} ms")
+    print(f"largest share error over 1M weighted draws: "
+          f"{check_distribution([1, 2, 3, 4, 10]):.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark checkpointing and recovering many sessions with the save log.
+
+Simulates SESSIONS games that each checkpoint after every guess, then
+measures:
+
+- write: appending every checkpoint to a ``SaveLog`` (compaction included)
+- recover: opening the log again, as after a crash
+- compact: rewriting the log with only the live sessions
+
+For comparison, the same checkpoints are written and replayed as JSON
+lines, the obvious format for saving a game.
+
+Run from the repository root:
+    python -m benchmarks.bench_savegame
+"""
+import json
+import os
+import random
+import tempfile
+import time
+from src.engine import ALPHABET, HangmanEngine
+from src.randomword import get_all_words
+from src.savegame import RECORD, SaveLog
+
+SESSIONS = 100_000
+GUESSES = 8
+
+
+def make_checkpoints(sessions, guesses, seed=1234):
+    """
+    Play random guesses and collect the engine state after each.
+
+    Args:
+        sessions: Number of sessions
+        guesses: Guesses per session
+        seed: Seed for the words and guesses
+
+    Returns:
+        list: (session id, HangmanEngine) pairs in checkpoint order;
+              engines are copies, so each pair is one saved state
+    """
+    rng = random.Random(seed)
+    words = get_all_words()
+    engines = [HangmanEngine(rng.choice(words)) for _ in range(sessions)]
+    checkpoints = []
+    for _ in range(guesses):
+        for session_id, engine in enumerate(engines):
+            engine.guess(rng.choice(ALPHABET))
+            copy = HangmanEngine()
+            copy.restore(engine.word, engine.guessed_mask, engine.wrong_guesses)
+            checkpoints.append((session_id, copy))
+    return checkpoints
+
+
+def bench_save_log(path, checkpoints):
+    """
+    Time writing, recovering and compacting a save log.
+
+    Args:
+        path: Path of the log
+        checkpoints: (session id, engine) pairs to save
+
+    Returns:
+        dict: Seconds per step and the log size before and after compaction
+    """
+    start = time.perf_counter()
+    log = SaveLog(path, min_compact=len(checkpoints) + 1)
+    for i, (session_id, engine) in enumerate(checkpoints):
+        log.save(session_id, engine, 'medium')
+        if i % 1000 == 999:
+            log.flush()
+    log.close()
+    write = time.perf_counter() - start
+    size = os.path.getsize(path)
+
+    start = time.perf_counter()
+    log = SaveLog(path)
+    recover = time.perf_counter() - start
+
+    start = time.perf_counter()
+    log.compact()
+    compact = time.perf_counter() - start
+    log.close()
+    return {"write": write, "recover": recover, "compact": compact,
+            "size": size, "compacted": os.path.getsize(path), "sessions": len(log.records)}
+
+
+def bench_json_lines(path, checkpoints):
+    """
+    Time writing and replaying the same checkpoints as JSON lines.
+
+    Args:
+        path: Path of the file
+        checkpoints: (session id, engine) pairs to save
+
+    Returns:
+        dict: Seconds per step and the file size
+    """
+    start = time.perf_counter()
+    with open(path, 'w') as file:
+        for session_id, engine in checkpoints:
+            file.write(json.dumps({
+                "session_id": session_id, "word": engine.word,
+                "guessed_letters": engine.guessed_letters,
+                "wrong_guesses": engine.wrong_guesses, "difficulty": 'medium', "category": None,
+            }) + "\n")
+    write = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sessions = {}
+    with open(path) as file:
+        for line in file:
+            record = json.loads(line)
+            sessions[record["session_id"]] = record
+    recover = time.perf_counter() - start
+    return {"write": write, "recover": recover, "size": os.path.getsize(path)}
+
+
+def main():
+    """
+    Run the benchmark and print the results.
+    """
+    checkpoints = make_checkpoints(SESSIONS, GUESSES)
+    count = len(checkpoints)
+    print(f"{SESSIONS} sessions, {count} checkpoints, {RECORD.size}-byte records")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log = bench_save_log(os.path.join(tmp, 'bench.sav'), checkpoints)
+        lines = bench_json_lines(os.path.join(tmp, 'bench.jsonl'), checkpoints)
+
+    print(f"{'format':<11} {'write/s':>10} {'recover/s':>10} {'file MB':>8}")
+    for name, result in (("save log", log), ("json lines", lines)):
+        print(f"{name:<11} {count / result['write']:>10.0f} {count / result['recover']:>10.0f} "
+              f"{result['size'] / 1e6:>8.1f}")
+    print(f"compacted {log['sessions']} sessions to {log['compacted'] / 1e6:.1f} MB "
+          f"in {log['compact'] * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
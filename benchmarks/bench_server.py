@@ -0,0 +1,206 @@
+"""
+Load test for the multi-session Hangman server.
+
+Starts ``src.server`` in its own process (or targets a running one with
+``--port``) and, for growing numbers of simultaneous sessions, keeps
+every session playing: each one sends a request, waits for the reply,
+then "thinks" for a random time averaging ``--think`` seconds. For every
+level it reports the request rate the server kept up with and the reply
+latency. A level is sustained when no request failed and the 99th
+percentile latency stayed under ``--max-p99`` milliseconds.
+
+The server process is single-threaded, so the sustained level is what
+one core can serve. Run the client on another core for a fair figure
+(the report notes when the machine has only one).
+
+Run from the repository root:
+    python -m benchmarks.bench_server --levels 1000 2000 5000 10000
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import time
+from src.engine import ALPHABET
+from src.server import HangmanServer
+from src.strategies import FREQUENCY_ORDER
+
+LEVELS = [1000, 2000, 5000, 10000]
+
+
+def run_server(port, ready, max_sessions):
+    """
+    Serve in a child process until terminated.
+
+    Args:
+        port: Port to listen on
+        ready: multiprocessing.Event set once the server listens
+        max_sessions: Most sessions the server accepts
+    """
+    async def serve():
+        server = HangmanServer(port=port, max_sessions=max_sessions, idle_timeout=60.0)
+        await server.start()
+        ready.set()
+        await server.server.serve_forever()
+
+    asyncio.run(serve())
+
+
+async def play_session(host, port, stop_at, think, latencies, counts, rng):
+    """
+    Play games on one connection until ``stop_at``.
+
+    Guesses follow letter frequency, so games have realistic lengths.
+
+    Args:
+        host: Server address
+        port: Server port
+        stop_at: ``time.perf_counter()`` time at which to stop
+        think: Mean pause between requests, in seconds
+        latencies: List collecting reply latencies in seconds
+        counts: Dict counting "requests", "games" and "errors"
+        rng: random.Random for the pauses
+    """
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError:
+        counts["errors"] += 1
+        return
+
+    # Spread the first requests over one think time
+    await asyncio.sleep(rng.uniform(0, think))
+    letters = iter(())
+    request = b"NEW\n"
+    try:
+        while time.perf_counter() < stop_at:
+            start = time.perf_counter()
+            writer.write(request)
+            reply = await reader.readline()
+            latencies.append(time.perf_counter() - start)
+            counts["requests"] += 1
+            if not reply or reply.startswith((b"ERR", b"BYE")):
+                counts["errors"] += 1
+                break
+
+            status = reply.split(b" ", 1)[0]
+            if status in (b"WON", b"LOST"):
+                counts["games"] += 1
+                request = b"NEW\n"
+            else:
+                if status == b"OK":
+                    letters = iter(FREQUENCY_ORDER)
+                letter = next(letters, None) or rng.choice(ALPHABET)
+                request = b"GUESS " + letter.encode() + b"\n"
+            await asyncio.sleep(rng.uniform(0, 2 * think))
+    except (OSError, ConnectionError):
+        counts["errors"] += 1
+    finally:
+        writer.close()
+
+
+async def run_level(host, port, sessions, duration, think, seed):
+    """
+    Run one load level.
+
+    Args:
+        host: Server address
+        port: Server port
+        sessions: Number of simultaneous sessions
+        duration: Seconds to keep the sessions playing
+        think: Mean pause between requests, in seconds
+        seed: Seed for the pauses
+
+    Returns:
+        dict: Request rate, latency percentiles, games and errors
+    """
+    latencies = []
+    counts = {"requests": 0, "games": 0, "errors": 0}
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    stop_at = start + duration
+    await asyncio.gather(*(
+        play_session(host, port, stop_at, think, latencies, counts, rng) for _ in range(sessions)
+    ))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    last = len(latencies) - 1
+    percentile = lambda p: 1000 * latencies[round(last * p / 100)] if latencies else 0.0
+    return {
+        "sessions": sessions,
+        "rate": counts["requests"] / elapsed,
+        "p50_ms": percentile(50),
+        "p99_ms": percentile(99),
+        "games": counts["games"],
+        "errors": counts["errors"],
+    }
+
+
+def main(argv=None):
+    """
+    Parse the command line, run every load level and print the results.
+
+    Args:
+        argv: Optional list of arguments; defaults to ``sys.argv[1:]``
+
+    Returns:
+        int: Process exit code
+    """
+    parser = argparse.ArgumentParser(description="Load test the Hangman server.")
+    parser.add_argument("--host", default="127.0.0.1", help="server address")
+    parser.add_argument("-p", "--port", type=int,
+                        help="port of a running server (default: start one in a child process)")
+    parser.add_argument("--levels", type=int, nargs="+", default=LEVELS,
+                        help="numbers of simultaneous sessions to try")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per level")
+    parser.add_argument("--think", type=float, default=1.0, help="mean seconds between requests")
+    parser.add_argument("--max-p99", type=float, default=100.0,
+                        help="latency in ms a sustained level must stay under")
+    args = parser.parse_args(argv)
+
+    # Each session needs a socket on both ends
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = min(hard, max(args.levels) + 256)
+    if soft < wanted:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (wanted, hard))
+    if max(args.levels) + 256 > hard:
+        print(f"Warning: open file limit {hard} is too low for {max(args.levels)} sessions")
+
+    server = None
+    port = args.port
+    if port is None:
+        port = 7777 + os.getpid() % 1000
+        ready = multiprocessing.Event()
+        server = multiprocessing.Process(target=run_server, args=(port, ready, max(args.levels) + 1),
+                                         daemon=True)
+        server.start()
+        if not ready.wait(30):
+            print("Server did not start", file=sys.stderr)
+            return 1
+
+    if os.cpu_count() == 1:
+        print("Note: only one CPU, so the client competes with the server for it")
+    print(f"{'sessions':>8} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'games':>7} {'errors':>6}")
+    sustained = 0
+    try:
+        for level in args.levels:
+            result = asyncio.run(run_level(args.host, port, level, args.duration, args.think, level))
+            print(f"{result['sessions']:>8} {result['rate']:>9.0f} {result['p50_ms']:>8.2f} "
+                  f"{result['p99_ms']:>8.2f} {result['games']:>7} {result['errors']:>6}")
+            if result["errors"] or result["p99_ms"] > args.max_p99:
+                break
+            sustained = level
+    finally:
+        if server:
+            server.terminate()
+            server.join()
+
+    print(f"Sustained {sustained} simultaneous sessions (p99 under {args.max_p99:.0f} ms, no errors)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
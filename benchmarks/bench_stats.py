@@ -0,0 +1,92 @@
+"""
+Benchmark the statistics store at millions of stored games.
+
+Queues ROWS random game results through ``StatsStore.record()``, which
+the writer thread inserts in batches, then times:
+
+- record: queueing every result, i.e. what the game loop pays
+- write: until the writer has inserted them all
+- summary: win rates and streaks from the running totals
+- scan: the same win rates computed with GROUP BY over every game
+- leaderboard: the fastest wins at one difficulty, through the index
+
+Run from the repository root:
+    python -m benchmarks.bench_stats
+"""
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from src.stats import StatsStore
+
+ROWS = 1_000_000
+DIFFICULTIES = ('easy', 'medium', 'hard')
+CATEGORIES = (None, 'animals', 'countries', 'foods')
+
+
+def timed(func, repeat=5):
+    """
+    Time the fastest of several calls.
+
+    Args:
+        func: Function to call
+        repeat: Number of calls
+
+    Returns:
+        float: Seconds taken by the fastest call
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def scan_win_rates(path):
+    """
+    Compute win rates per difficulty by scanning every game.
+
+    Args:
+        path: Path of the database
+
+    Returns:
+        list: (difficulty, games, wins) rows
+    """
+    with sqlite3.connect(path) as db:
+        return db.execute("SELECT difficulty, COUNT(*), SUM(won) FROM games GROUP BY difficulty").fetchall()
+
+
+def main():
+    """
+    Run the benchmark and print the results.
+    """
+    rng = random.Random(1234)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        store = StatsStore(path, batch_size=10_000)
+
+        start = time.perf_counter()
+        for _ in range(ROWS):
+            store.record('HANGMAN', rng.choice(DIFFICULTIES), rng.choice(CATEGORIES),
+                         rng.random() < 0.6, rng.randint(0, 6), rng.uniform(5, 120))
+        queued = time.perf_counter() - start
+        store.flush()
+        written = time.perf_counter() - start
+
+        summary = timed(lambda: store.get_summary().result())
+        leaderboard = timed(lambda: store.get_leaderboard('hard').result())
+        store.close()
+        scan = timed(lambda: scan_win_rates(path), repeat=2)
+
+    print(f"{ROWS} games")
+    print(f"record      {ROWS / queued:>10.0f} results/s queued by the game")
+    print(f"write       {ROWS / written:>10.0f} results/s inserted by the writer")
+    print(f"summary     {summary * 1000:>10.2f} ms from running totals")
+    print(f"scan        {scan * 1000:>10.2f} ms with GROUP BY over every game")
+    print(f"leaderboard {leaderboard * 1000:>10.2f} ms through the index")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark streaming word sampling against loading the whole word list.
+
+Generates synthetic dictionaries of 100k and 5M lines and compares, for
+each, the time and peak Python heap of one random word pick:
+
+- list: ``load_words_from_file`` + difficulty filter + ``random.choice``
+  (the path used before the word index and streaming sampler existed)
+- offset / reservoir: ``sample_word_from_file`` on a memory map
+
+Run from the repository root:
+    python -m benchmarks.bench_wordstream
+"""
+import os
+import random
+import string
+import tempfile
+import time
+import tracemalloc
+from src.randomword import load_words_from_file
+from src.wordindex import difficulties_for, letter_mask
+from src.wordstream import sample_word_from_file
+
+SIZES = [100_000, 5_000_000]
+DIFFICULTY = 'hard'
+
+
+def write_dictionary(path, lines, seed=1234):
+    """
+    Write a synthetic dictionary with a mix of valid and invalid lines.
+
+    Args:
+        path: Where to write the file
+        lines: Number of lines to write
+        seed: Seed for the generator
+    """
+    rng = random.Random(seed)
+    letters = string.ascii_lowercase
+    with open(path, 'w') as file:
+        for i in range(lines):
+            if i % 20 == 0:
+                file.write("o'clock\n")
+            else:
+                length = rng.randint(2, 14)
+                file.write(''.join(rng.choice(letters) for _ in range(length)) + '\n')
+
+
+def pick_from_list(path):
+    """
+    Pick a word the way the game did before streaming sampling.
+
+    Args:
+        path: Path to the word list
+
+    Returns:
+        str: A random word
+    """
+    words = load_words_from_file(path)
+    bucket = [word for word in words if DIFFICULTY in difficulties_for(word, letter_mask(word))]
+    return random.choice(bucket)
+
+
+def measure(func, *args):
+    """
+    Measure the wall time and peak traced heap of one call.
+
+    The call is made twice: once untraced for the timing, since tracing
+    slows allocation-heavy code down, and once traced for the peak heap.
+
+    Args:
+        func: Function to call
+        *args: Arguments for the function
+
+    Returns:
+        tuple: (seconds, peak bytes)
+    """
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    """
+    Run the benchmark and print a result table.
+    """
+    cases = [
+        ('list', pick_from_list),
+        ('offset', lambda path: sample_word_from_file(path, DIFFICULTY, 'offset')),
+        ('reservoir', lambda path: sample_word_from_file(path, DIFFICULTY, 'reservoir')),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        print(f"{'lines':>10} {'method':>10} {'time (ms)':>12} {'peak heap (MB)':>15}")
+        for size in SIZES:
+            path = os.path.join(tmp_dir, f'words_{size}.txt')
+            write_dictionary(path, size)
+            for name, func in cases:
+                elapsed, peak = measure(func, path)
+                print(f"{size:>10} {name:>10} {elapsed * 1000:>12.2f} {peak / 2 ** 20:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""
+Microbenchmarks of the word selection and rendering hot paths.
+
+Each benchmark calls one function in a loop, long enough to time it
+reliably, and reports the fastest of several rounds as microseconds per
+call. Results are compared with the baselines in ``baselines.json``
+next to this file: a benchmark regresses when it is slower than its
+baseline by more than its threshold (1.5 means 50% slower), and the run
+then exits with status 1.
+
+The game is created headless with the SDL dummy video driver, and its
+save log and statistics database are kept in a temporary directory, so
+the suite runs anywhere and leaves the player's files alone.
+
+Baselines depend on the machine. After a deliberate change in speed, or
+on a new machine, record new ones with ``--update``.
+
+Run from the repository root:
+    python -m benchmarks.suite
+    python -m benchmarks.suite --filter draw
+    python -m benchmarks.suite --update
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from benchmarks.bench_wordstream import write_dictionary
+from src.game import HangmanGame
+from src.randomword import (get_category_names, get_random_word, get_random_word_from_category,
+                            get_word_categories, get_words_by_difficulty, load_words_from_file)
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), 'baselines.json')
+DEFAULT_THRESHOLD = 1.5
+ROUNDS = 5
+DICTIONARY_LINES = 100_000
+
+
+def measure(func, min_time=0.2, rounds=ROUNDS):
+    """
+    Time a function per call.
+
+    The number of calls per round is doubled until a round takes at
+    least ``min_time / rounds`` seconds, so fast and slow functions are
+    timed with the same precision. As with ``timeit``, garbage
+    collection is off while timing.
+
+    Args:
+        func: Function to call, without arguments
+        min_time: Approximate total seconds to spend timing
+        rounds: Number of timed rounds; the fastest counts
+
+    Returns:
+        float: Microseconds per call
+    """
+    gc.collect()
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return time_rounds(func, min_time, rounds)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def time_rounds(func, min_time, rounds):
+    """
+    Time a function per call; see ``measure()``.
+
+    Args:
+        func: Function to call, without arguments
+        min_time: Approximate total seconds to spend timing
+        rounds: Number of timed rounds; the fastest counts
+
+    Returns:
+        float: Microseconds per call
+    """
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / rounds:
+            break
+        calls *= 2
+
+    best = elapsed
+    for _ in range(rounds - 1):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / calls * 1e6
+
+
+def make_game(tmp):
+    """
+    Create a game showing a round in progress, as the benchmarks need it.
+
+    Args:
+        tmp: Directory for the save log and statistics database
+
+    Returns:
+        HangmanGame: The game, fully loaded, with one letter guessed
+    """
+    pygame.init()
+    game = HangmanGame()
+    game.SAVE_FILE = os.path.join(tmp, 'bench.sav')
+    game.STATS_FILE = os.path.join(tmp, 'bench_stats.db')
+    game.ensure_loaded()
+    game.reset_game()
+    game.guess_button(0)
+    game.draw()
+    return game
+
+
+def get_benchmarks(game, dictionary):
+    """
+    List the benchmarks.
+
+    Args:
+        game: Game from ``make_game()``
+        dictionary: Path of a synthetic word list
+
+    Returns:
+        list: (name, function) pairs
+    """
+    def draw_full():
+        game.needs_full_redraw = True
+        game.draw()
+
+    def draw_menu():
+        selector.needs_full_redraw = True
+        selector.draw()
+
+    def click_menu():
+        # Alternate between two difficulties, so every click changes a button
+        clicks.reverse()
+        selector.handle_click(clicks[0])
+        selector.draw()
+
+    guessed = game.letters[0][:2]
+    selector = game.difficulty_selector
+    clicks = [btn["rect"].center for btn in selector.diff_buttons[:2]]
+    categories = get_category_names()
+    category = categories[0] if categories else None
+    return [
+        ("load_words_from_file", lambda: load_words_from_file(dictionary)),
+        ("get_words_by_difficulty", lambda: get_words_by_difficulty('hard')),
+        ("get_random_word", lambda: get_random_word('hard')),
+        ("get_random_word_from_category", lambda: get_random_word_from_category(category)),
+        ("get_word_categories", get_word_categories),
+        ("HangmanGame.draw idle", game.draw),
+        ("HangmanGame.draw full", draw_full),
+        ("check_game_over", game.check_game_over),
+        ("handle_mouse_click button", lambda: game.handle_mouse_click(guessed)),
+        ("handle_mouse_click miss", lambda: game.handle_mouse_click((5, 5))),
+        ("DifficultySelector.draw", draw_menu),
+        ("DifficultySelector.draw click", click_menu),
+    ]
+
+
+def load_baselines(path):
+    """
+    Load stored baselines.
+
+    Args:
+        path: Path of the baseline file
+
+    Returns:
+        dict: The file's contents; empty if there is no file
+    """
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baselines(path, results, previous):
+    """
+    Store results as the new baselines, keeping each benchmark's threshold.
+
+    Args:
+        path: Path of the baseline file
+        results: Dict of benchmark name to microseconds per call
+        previous: Baselines loaded before the run
+    """
+    benchmarks = previous.get("benchmarks", {})
+    for name, micros in results.items():
+        threshold = benchmarks.get(name, {}).get("threshold", DEFAULT_THRESHOLD)
+        benchmarks[name] = {"us": round(micros, 3), "threshold": threshold}
+    data = {
+        "machine": get_machine(),
+        "benchmarks": dict(sorted(benchmarks.items())),
+    }
+    with open(path, 'w') as file:
+        json.dump(data, file, indent=2)
+        file.write('\n')
+
+
+def get_machine():
+    """
+    Describe where the benchmarks ran, since baselines only hold there.
+
+    Returns:
+        dict: Python, pygame and platform versions
+    """
+    return {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(terse=True),
+    }
+
+
+def main(argv=None):
+    """
+    Parse the command line, run the benchmarks and compare them with the baselines.
+
+    Args:
+        argv: Optional list of arguments; defaults to ``sys.argv[1:]``
+
+    Returns:
+        int: Process exit code; 1 if a benchmark regressed
+    """
+    parser = argparse.ArgumentParser(description="Run the Hangman microbenchmarks.")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--baselines", default=BASELINE_FILE, help="baseline file to compare with")
+    parser.add_argument("--update", action="store_true", help="store the results as the new baselines")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds to spend per benchmark")
+    args = parser.parse_args(argv)
+
+    baselines = load_baselines(args.baselines)
+    stored = baselines.get("benchmarks", {})
+    if baselines and baselines.get("machine") != get_machine():
+        print(f"Note: baselines were recorded on {baselines.get('machine')}")
+
+    results = {}
+    regressions = []
+    with tempfile.TemporaryDirectory() as tmp:
+        dictionary = os.path.join(tmp, 'words.txt')
+        write_dictionary(dictionary, DICTIONARY_LINES)
+        game = make_game(tmp)
+
+        print(f"{'benchmark':<28} {'us/call':>10} {'baseline':>10} {'ratio':>6}")
+        for name, func in get_benchmarks(game, dictionary):
+            if args.filter not in name:
+                continue
+            micros = results[name] = measure(func, args.min_time)
+            baseline = stored.get(name)
+            if baseline:
+                ratio = micros / baseline["us"]
+                regressed = ratio > baseline["threshold"]
+                if regressed:
+                    regressions.append(name)
+                print(f"{name:<28} {micros:>10.2f} {baseline['us']:>10.2f} {ratio:>6.2f}"
+                      f"{'  REGRESSED' if regressed else ''}")
+            else:
+                print(f"{name:<28} {micros:>10.2f} {'-':>10} {'-':>6}")
+
+        game.save_log.close()
+        game.stats.close()
+        pygame.quit()
+
+    if args.update:
+        save_baselines(args.baselines, results, baselines)
+        print(f"Saved {len(results)} baselines to {args.baselines}")
+        return 0
+    if regressions:
+        print(f"{len(regressions)} benchmarks regressed: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+Command-line tool that builds the game's word lists from large corpora.
+
+Reads any number of text files with one word per line, in parallel,
+normalizes and deduplicates the words and writes the main word list plus
+one file per category found in the files' headers. For example:
+    python ingest_words.py corpus/*.txt --output assets/wordlists
+"""
+import argparse
+import sys
+import time
+from src.ingest import BLOCK_SIZE, MAIN_LIST, ingest, write_word_lists
+from src.scoring import WORDLISTS_DIR
+
+
+def main(argv=None):
+    """
+    Parse the command line, ingest the corpora and write the word lists.
+
+    Args:
+        argv: Optional list of arguments; defaults to ``sys.argv[1:]``
+
+    Returns:
+        int: Process exit code
+    """
+    parser = argparse.ArgumentParser(description="Build Hangman word lists from text corpora.")
+    parser.add_argument("sources", nargs="+", help="corpus files, one word per line")
+    parser.add_argument("-o", "--output", default=WORDLISTS_DIR, help="directory for the word lists")
+    parser.add_argument("--main-list", default=MAIN_LIST,
+                        help="file name for words outside any category")
+    parser.add_argument("-w", "--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--block-size", type=float, default=BLOCK_SIZE / 2**20,
+                        help="MiB of lines per worker task")
+    parser.add_argument("--fold-accents", action="store_true", help='strip accents, e.g. "café" -> "cafe"')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        categories, stats = ingest(args.sources, args.workers, int(args.block_size * 2**20),
+                                   args.fold_accents)
+    except OSError as error:
+        print(f"Could not read corpus: {error}", file=sys.stderr)
+        return 1
+    written = write_word_lists(categories, args.output, args.main_list)
+    elapsed = time.perf_counter() - start
+
+    for category, words in sorted(categories.items(), key=lambda item: item[0] or ''):
+        print(f"{category or '(no category)'}: {len(words)} words")
+    print(f"Read {stats['bytes'] / 2**20:.1f} MiB in {stats['blocks']} blocks, "
+          f"wrote {len(written)} files in {elapsed:.2f} s ({stats['bytes'] / 2**20 / elapsed:.1f} MiB/s)")
+    print("Run score_words.py to update the difficulty scores")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
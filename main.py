@@ -1,16 +1,52 @@
-"""
-Main entry point for the Hangman game.
-"""
-import pygame
-from src.game import HangmanGame
-
-def main():
-    """
-    Initialize and run the Hangman game.
-    """
-    pygame.init()
-    game = HangmanGame()
-    game.run()
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
+"""
+Main entry point for the Hangman game.
+
+Run with ``--profile-startup`` to print how long each startup phase takes,
+and with ``--frame-stats`` to save per-frame timings when the game exits:
+    python main.py --profile-startup --frame-stats frames.csv
+
+Run with ``--record`` to save the session for ``replay.py``:
+    python main.py --record session.jsonl
+"""
+import argparse
+from src.profiling import StartupProfiler
+
+def main(argv=None):
+    """
+    Initialize and run the Hangman game.
+    
+    Args:
+        argv: Optional list of arguments; defaults to ``sys.argv[1:]``
+    """
+    parser = argparse.ArgumentParser(description="Play Hangman.")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print a timing breakdown of startup")
+    parser.add_argument("--frame-stats", metavar="PATH",
+                        help="save recent frame timings on exit (CSV for .csv, otherwise JSON)")
+    parser.add_argument("--record", metavar="PATH",
+                        help="record the session's input and random seed for replay.py")
+    parser.add_argument("--seed", type=int, help="random seed of a recorded session")
+    args = parser.parse_args(argv)
+    
+    profiler = StartupProfiler(enabled=args.profile_startup)
+    with profiler.phase("imports"):
+        import pygame
+        from src.game import HangmanGame
+    with profiler.phase("pygame.init"):
+        pygame.init()
+    pacer = None
+    if args.record:
+        from src.replay import RecordingPacer
+        pacer = RecordingPacer(args.record, HangmanGame.FPS)
+    game = HangmanGame(profiler, pacer)
+    if pacer:
+        pacer.start(game, args.seed)
+    game.run()
+    if pacer:
+        pacer.close(game.rounds)
+        print(f"Recorded {pacer.frames} frames to {args.record}")
+    if args.frame_stats:
+        game.frame_stats.dump(args.frame_stats)
+
+if __name__ == "__main__":
+    main()
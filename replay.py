@@ -0,0 +1,70 @@
+"""
+Command-line entry point for replaying a recorded session.
+
+Record a session with ``python main.py --record session.jsonl``, then
+replay it headless, without frame rate cap, and report how fast the
+game handled and drew it:
+    python replay.py session.jsonl
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+
+def main(argv=None):
+    """
+    Parse the command line, replay the session and print the results.
+
+    Args:
+        argv: Optional list of arguments; defaults to ``sys.argv[1:]``
+
+    Returns:
+        int: Process exit code; 1 if the replay played different rounds
+    """
+    parser = argparse.ArgumentParser(description="Replay a recorded Hangman session.")
+    parser.add_argument("recording", help="file written by main.py --record")
+    parser.add_argument("--show", action="store_true", help="show the replay in a window")
+    args = parser.parse_args(argv)
+
+    if not args.show:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    from src.replay import replay_session
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            result = replay_session(args.recording, tmp)
+    except (OSError, ValueError) as error:
+        print(f"Could not replay '{args.recording}': {error}", file=sys.stderr)
+        return 1
+
+    seconds = result["seconds"]
+    recorded = result["recorded_seconds"]
+    print(f"Replayed {recorded:.1f} s of play in {seconds:.2f} s "
+          f"({recorded / seconds if seconds else 0:.0f}x real time)")
+    print(f"{result['wakeups']} loop wake-ups ({result['wakeups'] / seconds:.0f}/s), "
+          f"{result['frames']} frames with work ({result['frames'] / seconds:.0f}/s)")
+
+    phases = result["phases"]
+    frames = max(result["frames"], 1)
+    print(f"{'phase':<10} {'total ms':>9} {'per frame ms':>13}")
+    for name, total in phases.items():
+        print(f"{name:<10} {total * 1000:>9.1f} {total * 1000 / frames:>13.3f}")
+    logic = phases["events"] + phases["game_over"]
+    render = phases["draw"] + phases["update"]
+    print(f"logic {logic * 1000:.1f} ms, render {render * 1000:.1f} ms")
+
+    expected = result["expected_rounds"]
+    if expected is None:
+        print(f"Played {len(result['rounds'])} rounds; the recording did not end normally")
+        return 0
+    if result["rounds"] != expected:
+        print(f"Rounds differ from the recording:\n  recorded {expected}\n  replayed {result['rounds']}")
+        return 1
+    print(f"All {len(expected)} rounds matched the recording")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
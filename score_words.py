@@ -0,0 +1,62 @@
+"""
+Command-line tool that scores word difficulty with a reference solver.
+
+Plays the candidate-filtering solver against every word of the main word
+list, in parallel, and saves each word's expected number of misses to
+``assets/wordlists/difficulty_scores.json``. The game then picks easy,
+medium and hard words by those misses and the word's length. For example:
+    python score_words.py --rounds 8
+"""
+import argparse
+import sys
+import time
+from src.randomword import find_word_list_file
+from src.scoring import SCORES_FILE, score_files, write_scores
+
+
+def get_default_sources():
+    """
+    List the word lists scored by default.
+
+    Category words are picked regardless of difficulty, so only the main
+    word list's scores are used.
+
+    Returns:
+        list: The main word list, if there is one
+    """
+    main_list = find_word_list_file()
+    return [main_list] if main_list else []
+
+
+def main(argv=None):
+    """
+    Parse the command line, score the word lists and save the artifact.
+
+    Args:
+        argv: Optional list of arguments; defaults to ``sys.argv[1:]``
+
+    Returns:
+        int: Process exit code
+    """
+    parser = argparse.ArgumentParser(description="Score word difficulty with a reference solver.")
+    parser.add_argument("sources", nargs="*", help="word lists to score (default: the main word list)")
+    parser.add_argument("-r", "--rounds", type=int, default=8, help="games per word to average over")
+    parser.add_argument("-w", "--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("-o", "--output", default=SCORES_FILE, help="where to save the scores")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the solver's tie-breaks")
+    args = parser.parse_args(argv)
+
+    sources = args.sources or get_default_sources()
+    start = time.perf_counter()
+    artifact = score_files(sources, args.rounds, args.workers, seed=args.seed)
+    write_scores(artifact, args.output)
+
+    for name, entry in artifact["sources"].items():
+        low, high = entry["thresholds"]
+        print(f"{name}: {len(entry['scores'])} words, score easy <= {low:.2f} < medium <= {high:.2f} < hard")
+    print(f"Saved {args.output} in {time.perf_counter() - start:.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
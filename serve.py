@@ -0,0 +1,43 @@
+"""
+Command-line entry point for the multi-session Hangman server.
+
+Serves independent Hangman games over a line protocol, one per TCP
+connection (see ``src/server.py``). For example:
+    python serve.py --port 7777
+    printf 'NEW easy\nGUESS E\n' | nc localhost 7777
+"""
+import argparse
+import asyncio
+import sys
+from src.server import HangmanServer
+
+
+def main(argv=None):
+    """
+    Parse the command line and serve until interrupted.
+
+    Args:
+        argv: Optional list of arguments; defaults to ``sys.argv[1:]``
+
+    Returns:
+        int: Process exit code
+    """
+    parser = argparse.ArgumentParser(description="Serve Hangman sessions over TCP.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("-p", "--port", type=int, default=7777, help="port to listen on")
+    parser.add_argument("--max-sessions", type=int, default=20000, help="most sessions served at once")
+    parser.add_argument("--idle-timeout", type=float, default=300.0,
+                        help="seconds without a request before a session is closed")
+    args = parser.parse_args(argv)
+
+    server = HangmanServer(args.host, args.port, args.max_sessions, args.idle_timeout)
+    print(f"Serving Hangman on {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""
+Command-line entry point for headless Hangman self-play.
+
+Plays N complete games without a window and reports throughput, win rate
+per difficulty and guess-count distributions. For example:
+    python simulate.py --games 100000 --strategy candidate
+"""
+import argparse
+import sys
+from src.randomword import get_category_names
+from src.simulator import DIFFICULTIES, format_report, simulate
+from src.strategies import STRATEGIES
+
+
+def main(argv=None):
+    """
+    Parse the command line and run the simulation.
+
+    Args:
+        argv: Optional list of arguments; defaults to ``sys.argv[1:]``
+
+    Returns:
+        int: Process exit code
+    """
+    parser = argparse.ArgumentParser(description="Play Hangman games headless and report statistics.")
+    parser.add_argument("-n", "--games", type=int, default=10000, help="number of games to play")
+    parser.add_argument("-s", "--strategy", choices=sorted(STRATEGIES), default="frequency",
+                        help="guessing strategy")
+    parser.add_argument("-d", "--difficulty", choices=DIFFICULTIES,
+                        help="only play this difficulty (default: cycle through all)")
+    parser.add_argument("-c", "--category", help="draw words from this category instead")
+    parser.add_argument("-w", "--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="games per worker task")
+    parser.add_argument("--seed", type=int, help="base random seed, for repeatable runs")
+    args = parser.parse_args(argv)
+
+    if args.category and args.category not in get_category_names():
+        print(f"Unknown category '{args.category}'", file=sys.stderr)
+        return 2
+
+    results, elapsed = simulate(args.strategy, args.games, args.difficulty, args.category,
+                                args.workers, args.batch_size, args.seed)
+    print(f"strategy: {args.strategy}")
+    print(format_report(results, elapsed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
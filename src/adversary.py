@@ -0,0 +1,257 @@
+"""
+Module for the "evil" mode, where the word isn't decided up front.
+
+The engine keeps every word that is still consistent with what the
+player has seen. Each guess splits these candidates into families by the
+positions the letter would reveal, and the largest family survives, so
+the word only becomes fixed once a single candidate is left.
+
+A family's key is an integer with bit ``i`` set when the letter is at
+position ``i``; a miss is key 0. Keys are compared as integers, so
+grouping the candidates is a count of integers. The candidate set only
+ever shrinks, and each guess works on the survivors of the last one.
+
+With NumPy, candidates are a fixed-width character matrix with a letter
+mask per row, so only the rows holding the guessed letter are compared,
+and their keys are one matrix-vector product. Without NumPy, keys are
+built from ``str.find`` and grouped in a dict, which is fine for the
+bundled word lists.
+"""
+from src.engine import ALPHABET, HangmanEngine, MAX_NUM_OF_GUESSES, word_mask
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Hides the guessable letters of an uppercase word, leaving its shape
+SHAPE_TABLE = str.maketrans(ALPHABET, '_' * len(ALPHABET))
+
+
+def position_key(word, letter):
+    """
+    Compute the pattern key of a letter in a word.
+
+    Args:
+        word: An uppercase word
+        letter: An uppercase letter
+
+    Returns:
+        int: Bit ``i`` is set if ``word[i]`` is the letter; 0 if it isn't in the word
+    """
+    key = 0
+    position = word.find(letter)
+    while position >= 0:
+        key |= 1 << position
+        position = word.find(letter, position + 1)
+    return key
+
+
+def best_family(counts):
+    """
+    Pick the family to keep.
+
+    The largest family wins; ties go to the family revealing fewer
+    positions, then to the smaller key, so the choice doesn't depend on
+    the order of the candidates.
+
+    Args:
+        counts: Dict of family key to number of candidates
+
+    Returns:
+        int: The key of the family to keep
+    """
+    return max(counts, key=lambda key: (counts[key], -bin(key).count('1'), -key))
+
+
+class CandidateSet:
+    """
+    The words of one length that are still consistent with the guesses.
+    """
+
+    def __init__(self, words):
+        """
+        Build the candidate set.
+
+        Args:
+            words: Distinct uppercase words, all of the same length
+        """
+        self.words = words
+        if np is None or not words:
+            self.rows = None
+            return
+
+        width = len(words[0])
+        self.chars = np.array(words, dtype=f'<U{max(width, 1)}').view(np.uint32).reshape(len(words), -1)
+        letters = (self.chars >= 65) & (self.chars <= 90)
+        bits = np.where(letters, np.uint32(1) << np.where(letters, self.chars - 65, 0).astype(np.uint32), 0)
+        self.masks = np.bitwise_or.reduce(bits.astype(np.uint32), axis=1)
+        self.weights = np.uint64(1) << np.arange(width, dtype=np.uint64)
+        # Positions of the surviving words in self.words
+        self.rows = np.arange(len(words))
+
+    def __len__(self):
+        return len(self.words) if self.rows is None else len(self.rows)
+
+    def first(self):
+        """
+        Get a word of the set.
+
+        Returns:
+            str: The first surviving word, in the original order
+        """
+        return self.words[0] if self.rows is None else self.words[int(self.rows[0])]
+
+    def get_keys(self, index):
+        """
+        Compute the pattern key of a letter for every candidate.
+
+        Args:
+            index: 0 for 'A' up to 25 for 'Z'
+
+        Returns:
+            tuple: (keys of the candidates containing the letter, and a
+                   boolean array of which candidates those are)
+        """
+        hits = (self.masks >> np.uint32(index)) & 1 != 0
+        keys = (self.chars[hits] == 65 + index) @ self.weights
+        return keys, hits
+
+    def split(self, index):
+        """
+        Guess a letter, keeping only the largest family of candidates.
+
+        Args:
+            index: 0 for 'A' up to 25 for 'Z'
+
+        Returns:
+            int: The key of the family that was kept
+        """
+        if self.rows is None:
+            letter = ALPHABET[index]
+            families = {}
+            for word in self.words:
+                key = position_key(word, letter) if letter in word else 0
+                family = families.get(key)
+                if family is None:
+                    families[key] = [word]
+                else:
+                    family.append(word)
+            best = best_family({key: len(family) for key, family in families.items()})
+            self.words = families[best]
+            return best
+
+        keys, hits = self.get_keys(index)
+        found, counts = np.unique(keys, return_counts=True)
+        counts = dict(zip(found.tolist(), counts.tolist()))
+        misses = len(hits) - len(keys)
+        if misses:
+            counts[0] = misses
+        best = best_family(counts)
+        self.keep(best, keys, hits)
+        return best
+
+    def narrow(self, index, key):
+        """
+        Keep only the candidates with a given pattern key for a letter.
+
+        Args:
+            index: 0 for 'A' up to 25 for 'Z'
+            key: The pattern key to keep, 0 for words without the letter
+        """
+        if self.rows is None:
+            letter = ALPHABET[index]
+            self.words = [word for word in self.words if position_key(word, letter) == key]
+            return
+        keys, hits = self.get_keys(index)
+        self.keep(key, keys, hits)
+
+    def keep(self, key, keys, hits):
+        """
+        Drop every candidate outside one family.
+
+        Args:
+            key: The family's pattern key
+            keys: Keys from ``get_keys()``
+            hits: Candidates containing the letter, from ``get_keys()``
+        """
+        if key:
+            keep = np.flatnonzero(hits)[keys == key]
+        else:
+            keep = np.flatnonzero(~hits)
+        self.chars = self.chars[keep]
+        self.masks = self.masks[keep]
+        self.rows = self.rows[keep]
+
+
+class AdversaryEngine(HangmanEngine):
+    """
+    A game of Hangman whose word changes to dodge the player's guesses.
+
+    Until ``set_candidates()`` is called it plays like HangmanEngine. The
+    word is always one of the surviving candidates, so the pattern, the
+    win/loss check and the save log work exactly as for a fixed word.
+    """
+
+    __slots__ = ('candidates',)
+
+    def __init__(self, word="", max_wrong_guesses=MAX_NUM_OF_GUESSES):
+        """
+        Initialize the engine.
+
+        Args:
+            word: The first word
+            max_wrong_guesses: Number of wrong guesses that loses the game
+        """
+        self.candidates = None
+        super().__init__(word, max_wrong_guesses)
+
+    def reset(self, word):
+        """
+        Start a new game; the word is fixed until ``set_candidates()``.
+
+        Args:
+            word: The first word; it is converted to uppercase
+        """
+        super().reset(word)
+        self.candidates = None
+
+    def set_candidates(self, words):
+        """
+        Let the word change to any of the given words that fits what was revealed.
+
+        The current word is always kept, so the game can go on if it
+        isn't in the list.
+
+        Args:
+            words: Words the game may switch to, in any case; words of
+                   another length are skipped quickly
+        """
+        shape = self.word.translate(SHAPE_TABLE)
+        length = len(self.word)
+        same_length = [word.upper() for word in words if len(word) == length]
+        matching = [self.word] + [word for word in same_length if word.translate(SHAPE_TABLE) == shape]
+        candidates = CandidateSet(list(dict.fromkeys(matching)))
+
+        for index in range(26):
+            if self.guessed_mask >> index & 1:
+                candidates.narrow(index, position_key(self.word, ALPHABET[index]))
+        self.candidates = candidates
+
+    def guess_index(self, index):
+        """
+        Guess a letter, after switching to the largest family of words it splits.
+
+        Args:
+            index: 0 for 'A' up to 25 for 'Z'
+
+        Returns:
+            bool: True for a correct guess, False for a wrong one, or None
+                  if the letter was already guessed or the game is over
+        """
+        if self.candidates is not None and not (self.guessed_mask >> index & 1 or self.result):
+            key = self.candidates.split(index)
+            if position_key(self.word, ALPHABET[index]) != key:
+                self.word = self.candidates.first()
+                self.word_mask = word_mask(self.word)
+        return super().guess_index(index)
@@ -0,0 +1,200 @@
+"""
+This module loads and prepares the images of the Hangman game.
+
+Every image is converted to the display's pixel format once, so blits
+never convert pixels again. Images drawn together are packed into one
+atlas surface and handed out as subsurfaces. Prepared atlases are cached
+on disk as raw pixels, which load much faster than decoding PNG and JPEG
+files, and are rebuilt when a source image changes.
+"""
+import os
+import pickle
+import pygame
+
+ASSET_CACHE_VERSION = 1
+# Next to the game's assets, so the cache doesn't depend on the working directory
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.cache')
+
+# Widest row of an atlas before packing moves to the next shelf
+ATLAS_WIDTH = 1024
+
+
+def pack_shelves(sizes, max_width=ATLAS_WIDTH):
+    """
+    Place rectangles in rows ("shelves"), tallest first.
+
+    Args:
+        sizes: List of (width, height) sizes to place
+        max_width: Widest a row may get
+
+    Returns:
+        tuple: (list of pygame.Rect in the order of ``sizes``, (width, height) of the atlas)
+    """
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+    rects = [None] * len(sizes)
+    x = y = shelf_height = width = 0
+    for i in order:
+        w, h = sizes[i]
+        if x and x + w > max_width:
+            y += shelf_height
+            x = shelf_height = 0
+        rects[i] = pygame.Rect(x, y, w, h)
+        x += w
+        width = max(width, x)
+        shelf_height = max(shelf_height, h)
+    return rects, (width, y + shelf_height)
+
+
+class AssetManager:
+    """
+    Loads images converted for the display, packed into cached atlases.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        """
+        Initialize the asset manager.
+
+        Must be created after ``pygame.display.set_mode()``, since
+        converting images needs the display's pixel format.
+
+        Args:
+            cache_dir: Directory for prepared atlases; None disables the disk cache
+        """
+        self.cache_dir = cache_dir
+        self.atlases = {}
+
+    def get_cache_path(self, name):
+        """
+        Get where an atlas is cached on disk.
+
+        Args:
+            name: The atlas name
+
+        Returns:
+            str: Path of the cache file, or None if the disk cache is disabled
+        """
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, f"{name}.atlas")
+
+    def load_atlas(self, name, paths, alpha=True, convert=True):
+        """
+        Load several images packed into one converted atlas surface.
+
+        Args:
+            name: Name of the atlas, used for the disk cache
+            paths: Paths of the images to pack
+            alpha: Keep per-pixel alpha (``convert_alpha``) or not (``convert``)
+            convert: Convert to the display format; off for images that are
+                     never blitted, like the window icon
+
+        Returns:
+            dict: Image path to a subsurface of the atlas
+        """
+        if name in self.atlases:
+            return self.atlases[name]
+
+        stamps = []
+        for path in paths:
+            info = os.stat(path)
+            stamps.append((path, info.st_mtime_ns, info.st_size))
+
+        cached = self.read_cache(name, stamps, alpha)
+        if cached:
+            atlas, rects = cached
+        else:
+            atlas, rects = self.build_atlas(paths, alpha)
+            self.write_cache(name, stamps, alpha, atlas, rects)
+
+        if convert:
+            atlas = atlas.convert_alpha() if alpha else atlas.convert()
+        images = {path: atlas.subsurface(rect) for path, rect in zip(paths, rects)}
+        self.atlases[name] = images
+        return images
+
+    def load_image(self, path, alpha=True, convert=True):
+        """
+        Load one converted image, cached on disk like an atlas.
+
+        Args:
+            path: Path of the image
+            alpha: Keep per-pixel alpha (``convert_alpha``) or not (``convert``)
+            convert: Convert to the display format
+
+        Returns:
+            pygame.Surface: The converted image
+        """
+        name = os.path.splitext(os.path.basename(path))[0]
+        return self.load_atlas(name, [path], alpha, convert)[path]
+
+    def build_atlas(self, paths, alpha):
+        """
+        Decode images and pack them into a new atlas surface.
+
+        Args:
+            paths: Paths of the images to pack
+            alpha: Whether the atlas keeps per-pixel alpha
+
+        Returns:
+            tuple: (atlas surface, list of pygame.Rect, one per path)
+        """
+        images = [pygame.image.load(path) for path in paths]
+        rects, size = pack_shelves([image.get_size() for image in images])
+        atlas = pygame.Surface(size, pygame.SRCALPHA if alpha else 0, 32)
+        for image, rect in zip(images, rects):
+            atlas.blit(image, rect)
+        return atlas, rects
+
+    def read_cache(self, name, stamps, alpha):
+        """
+        Read a prepared atlas from the disk cache.
+
+        Args:
+            name: The atlas name
+            stamps: (path, mtime_ns, size) of every source image
+            alpha: Whether the atlas keeps per-pixel alpha
+
+        Returns:
+            tuple: (atlas surface, list of pygame.Rect), or None if the
+                   cache is missing or any source image changed
+        """
+        cache_path = self.get_cache_path(name)
+        if not cache_path:
+            return None
+        try:
+            with open(cache_path, 'rb') as file:
+                version, saved_stamps, saved_alpha, size, rects, pixels = pickle.loads(file.read())
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            return None
+
+        if version != ASSET_CACHE_VERSION or saved_stamps != stamps or saved_alpha != alpha:
+            return None
+        atlas = pygame.image.frombytes(pixels, size, 'RGBA' if alpha else 'RGB')
+        return atlas, [pygame.Rect(rect) for rect in rects]
+
+    def write_cache(self, name, stamps, alpha, atlas, rects):
+        """
+        Save a prepared atlas to the disk cache; failures only print a warning.
+
+        Args:
+            name: The atlas name
+            stamps: (path, mtime_ns, size) of every source image
+            alpha: Whether the atlas keeps per-pixel alpha
+            atlas: The atlas surface
+            rects: Where each source image is in the atlas
+        """
+        cache_path = self.get_cache_path(name)
+        if not cache_path:
+            return
+        pixels = pygame.image.tobytes(atlas, 'RGBA' if alpha else 'RGB')
+        data = pickle.dumps((ASSET_CACHE_VERSION, stamps, alpha, atlas.get_size(),
+                             [tuple(rect) for rect in rects], pixels),
+                            protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as file:
+                file.write(data)
+            os.replace(tmp_path, cache_path)
+        except OSError as error:
+            print(f"Warning: Could not cache assets in '{cache_path}': {error}")
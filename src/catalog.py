@@ -0,0 +1,275 @@
+"""
+Module for finding category word lists and loading them on demand.
+
+Every ``.txt`` file in the word list directory except the main word
+lists is a category, named after the file. Its header, if it has one,
+gives the category's title and description:
+
+    \"\"\"
+    Category: Animals
+    One animal per line.
+    \"\"\"
+
+A ``CategoryCatalog`` scans the directory once into a manifest of every
+category's path, header and word count. Counting the words means reading
+each file, so the words read are kept in a bounded least-recently-used
+cache; only categories that fell out of it are read again when used.
+Each use compares the file's mtime and size with the manifest, so an
+edited file is reloaded, on its own, without restarting the game.
+"""
+from collections import OrderedDict
+import os
+import threading
+from src.ingest import CATEGORY_LINE, MAIN_LISTS
+from src.wordindex import get_file_stamp, is_valid_word
+
+
+class CategoryEntry:
+    """
+    The manifest entry of one category.
+    """
+
+    __slots__ = ('name', 'path', 'stamp', 'title', 'description', 'word_count')
+
+    def __init__(self, name, path, stamp, title, description, word_count):
+        """
+        Initialize the entry.
+
+        Args:
+            name: Category name, the file name without ``.txt``
+            path: Path of the category file
+            stamp: (mtime_ns, size) of the file when it was read
+            title: Title from the header's "Category:" line, or the capitalized name
+            description: Other header lines, joined with spaces
+            word_count: Number of valid words in the file
+        """
+        self.name = name
+        self.path = path
+        self.stamp = stamp
+        self.title = title
+        self.description = description
+        self.word_count = word_count
+
+
+def read_category(path):
+    """
+    Read a category file's header and words.
+
+    Words are filtered like ``load_words_from_file`` does.
+
+    Args:
+        path: Path of the category file
+
+    Returns:
+        tuple: (title or None, description, list of words)
+    """
+    with open(path, encoding='utf-8', errors='replace') as file:
+        lines = file.read().splitlines()
+
+    title = None
+    description = []
+    start = 0
+    if lines and lines[0].strip() == '"""':
+        end = next((i for i in range(1, len(lines)) if lines[i].strip() == '"""'), None)
+        if end is not None:
+            for line in lines[1:end]:
+                match = CATEGORY_LINE.match(line)
+                if match:
+                    title = match.group(1)
+                elif line.strip():
+                    description.append(line.strip())
+            start = end + 1
+
+    words = [word for word in (line.strip().lower() for line in lines[start:]) if is_valid_word(word)]
+    return title, ' '.join(description), words
+
+
+class CategoryCatalog:
+    """
+    A manifest of the category files in a directory, with lazily loaded words.
+    """
+
+    def __init__(self, directory, max_loaded=16):
+        """
+        Initialize the catalog; the directory is scanned on first use.
+
+        Args:
+            directory: Directory holding the category files
+            max_loaded: Most categories whose words are kept in memory
+        """
+        self.directory = directory
+        self.max_loaded = max_loaded
+        self.entries = None
+        self.loaded = OrderedDict()
+        self.lock = threading.RLock()
+
+    def refresh(self):
+        """
+        Bring the manifest up to date with the directory.
+
+        Only files that were added or whose mtime or size changed are
+        read, and their words are cached; categories whose files are
+        gone are dropped.
+
+        Returns:
+            bool: True if any category was added, changed or removed
+        """
+        with self.lock:
+            entries = self.entries if self.entries is not None else {}
+            try:
+                filenames = os.listdir(self.directory)
+            except FileNotFoundError:
+                filenames = []
+
+            changed = self.entries is None
+            current = {}
+            for filename in filenames:
+                if not filename.endswith('.txt') or filename in MAIN_LISTS:
+                    continue
+                name = filename[:-4]
+                path = os.path.join(self.directory, filename)
+                try:
+                    stamp = get_file_stamp(path)
+                except OSError:
+                    continue
+                entry = entries.get(name)
+                if entry is None or entry.stamp != stamp:
+                    entry, words = self.read_entry(name, path)
+                    if entry is None:
+                        continue
+                    self.cache(name, words)
+                    changed = True
+                current[name] = entry
+
+            if set(current) != set(entries):
+                changed = True
+            # Changed files were cached again as they were read
+            for name in list(self.loaded):
+                if name not in current:
+                    del self.loaded[name]
+            self.entries = current
+            return changed
+
+    def read_entry(self, name, path):
+        """
+        Read a category file into a manifest entry.
+
+        Args:
+            name: Category name
+            path: Path of the category file
+
+        Returns:
+            tuple: (CategoryEntry, list of words), or (None, None) if the
+                   file can't be read
+        """
+        try:
+            stamp = get_file_stamp(path)
+            title, description, words = read_category(path)
+        except OSError as error:
+            print(f"Warning: Could not read category file '{path}': {error}")
+            return None, None
+        entry = CategoryEntry(name, path, stamp, title or name.replace('_', ' ').title(),
+                              description, len(words))
+        return entry, words
+
+    def cache(self, name, words):
+        """
+        Keep a category's words, evicting the least recently used beyond ``max_loaded``.
+
+        Args:
+            name: Category name
+            words: The category's words
+        """
+        self.loaded[name] = words
+        self.loaded.move_to_end(name)
+        while len(self.loaded) > self.max_loaded:
+            self.loaded.popitem(last=False)
+
+    def get_entries(self):
+        """
+        Get the manifest, scanning the directory the first time.
+
+        Returns:
+            list: CategoryEntry objects sorted by name
+        """
+        with self.lock:
+            if self.entries is None:
+                self.refresh()
+            return [self.entries[name] for name in sorted(self.entries)]
+
+    def names(self):
+        """
+        Get the category names, scanning the directory the first time.
+
+        Returns:
+            list: Sorted category names
+        """
+        return [entry.name for entry in self.get_entries()]
+
+    def __contains__(self, name):
+        """
+        Check whether a category exists, scanning the directory the first time.
+
+        Args:
+            name: Category name
+
+        Returns:
+            bool: True if the category is in the manifest
+        """
+        with self.lock:
+            if self.entries is None:
+                self.refresh()
+            return name in self.entries
+
+    def get(self, name):
+        """
+        Get a category's words, loading or reloading the file if needed.
+
+        The returned list is the same object until the category is
+        reloaded or evicted, and must not be modified.
+
+        Args:
+            name: Category name
+
+        Returns:
+            list: The category's words, or None if there is no such category
+        """
+        with self.lock:
+            if self.entries is None:
+                self.refresh()
+            entry = self.entries.get(name)
+            if entry is None:
+                return None
+
+            try:
+                stamp = get_file_stamp(entry.path)
+            except OSError:
+                # The file was removed
+                del self.entries[name]
+                self.loaded.pop(name, None)
+                return None
+
+            words = self.loaded.get(name)
+            if stamp != entry.stamp or words is None:
+                # Reading the file again also refreshes its manifest entry
+                self.loaded.pop(name, None)
+                entry, words = self.read_entry(name, entry.path)
+                if entry is None:
+                    return None
+                self.entries[name] = entry
+                self.cache(name, words)
+            else:
+                self.loaded.move_to_end(name)
+            return words
+
+    def is_loaded(self, name):
+        """
+        Check whether a category's words are in the cache.
+
+        Args:
+            name: Category name
+
+        Returns:
+            bool: True if ``get()`` would not read the file
+        """
+        return name in self.loaded
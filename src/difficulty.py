@@ -2,16 +2,19 @@
 This module adds a game difficulty selector to the Hangman game.
 """
 import pygame
+from src.input import HitMap
+from src.pacing import FramePacer
+from src.render import TextCache
 
 class DifficultySelector:
     """
     A class to handle difficulty selection for the Hangman game.
     
     This class creates a screen where players can choose a game difficulty
-    and optionally a word category before starting the game.
+    and optionally a word category and evil mode before starting the game.
     """
     
-    def __init__(self, screen, background, font_path):
+    def __init__(self, screen, background, font_path, text_cache=None, pacer=None):
         """
         Initialize the difficulty selector.
         
@@ -19,9 +22,13 @@ class DifficultySelector:
             screen: The pygame surface to draw on
             background: The background sprite
             font_path: Path to the font file
+            text_cache: Optional TextCache to share with other screens
+            pacer: Optional FramePacer to share with other screens
         """
         self.screen = screen
         self.background = background
+        self.text_cache = text_cache if text_cache is not None else TextCache()
+        self.pacer = pacer if pacer is not None else FramePacer()
         
         # Fonts
         self.title_font = pygame.font.Font(font_path, 50)
@@ -38,17 +45,20 @@ class DifficultySelector:
         self.YELLOW = (204, 204, 0)
         
         # Difficulty options
+        from src.randomword import get_difficulty_descriptions, get_category_names
+        descriptions = get_difficulty_descriptions()
         self.difficulties = [
-            {"name": "Easy", "color": self.GREEN, "desc": "3-5 letter words"},
-            {"name": "Medium", "color": self.YELLOW, "desc": "6-7 letter words"},
-            {"name": "Hard", "color": self.RED, "desc": "8+ letter words, uncommon letters"}
+            {"name": "Easy", "color": self.GREEN, "desc": descriptions["easy"]},
+            {"name": "Medium", "color": self.YELLOW, "desc": descriptions["medium"]},
+            {"name": "Hard", "color": self.RED, "desc": descriptions["hard"]}
         ]
         
-        # Category information
-        from src.randomword import get_word_categories
-        self.categories = get_word_categories()
-        self.category_names = list(self.categories.keys())
+        # Category information; only the names, words are loaded when a round starts
         self.selected_category = None
+        self.category_names = []
+        
+        # In evil mode the word changes to dodge the player's guesses
+        self.evil = False
         
         # Button dimensions and positions
         self.WIDTH, self.HEIGHT = screen.get_size()
@@ -71,88 +81,301 @@ class DifficultySelector:
                 "desc": diff["desc"]
             })
         
-        # Calculate positions for category buttons if there are any
-        self.cat_buttons = []
-        if self.categories:
-            # Position category buttons on the right side
-            cat_start_x = self.WIDTH - 250
-            cat_start_y = 180
-            cat_button_width = 180
-            cat_button_height = 40
-            
-            for i, cat in enumerate(self.category_names):
-                # Only show the first 8 categories to avoid overcrowding
-                if i >= 8:
-                    break
-                    
-                btn_x = cat_start_x
-                btn_y = cat_start_y + i * (cat_button_height + 15)
-                
-                self.cat_buttons.append({
-                    "rect": pygame.Rect(btn_x, btn_y, cat_button_width, cat_button_height),
-                    "name": cat,
-                    "selected": False
-                })
+        # The category list on the right side shows as many rows as fit
+        # above the bottom edge and scrolls through the rest; only the
+        # visible rows exist as buttons, however many categories there are
+        self.cat_button_width = 180
+        self.cat_button_height = 40
+        self.cat_row_height = self.cat_button_height + 15
+        self.cat_list = pygame.Rect(self.WIDTH - 250, 180, self.cat_button_width, 0)
+        self.cat_list.height = (self.HEIGHT - 20 - self.cat_list.top) // self.cat_row_height * self.cat_row_height
+        self.cat_slots = [
+            pygame.Rect(self.cat_list.left, self.cat_list.top + i * self.cat_row_height,
+                        self.cat_button_width, self.cat_button_height)
+            for i in range(self.cat_list.height // self.cat_row_height)
+        ]
+        self.scrollbar = pygame.Rect(self.cat_list.right + 6, self.cat_list.top, 6,
+                                     self.cat_list.height - 15)
+        self.set_categories(get_category_names())
+        
+        # Start button at the bottom, statistics in the bottom-left corner
+        self.start_btn = pygame.Rect((self.WIDTH - 250)//2, self.HEIGHT - 100, 250, 60)
+        self.stats_btn = pygame.Rect(30, self.HEIGHT - 90, 130, 45)
+        
+        # Evil mode toggle on the left side
+        self.evil_btn = pygame.Rect(30, 180, 180, 40)
+        
+        # The parts of the screen that never change, composited on first draw,
+        # and what the last frame showed of the parts that do
+        self.base = None
+        self.needs_full_redraw = True
+        self.drawn_diff = [None] * len(self.diff_buttons)
+        self.drawn_slots = [None] * len(self.cat_slots)
+        self.drawn_scroll = None
+        self.drawn_evil = None
+        
+        self.build_hit_map()
     
-    def draw(self):
+    def set_categories(self, names):
         """
-        Draw the difficulty selection screen.
+        Set the categories listed, scrolled to the top.
+        
+        Args:
+            names: The category names, in display order
+        """
+        if bool(names) != bool(self.category_names):
+            # The category heading is part of the pre-composited base
+            self.base = None
+        self.category_names = names
+        self.cat_scroll = 0
+        if self.selected_category not in names:
+            self.selected_category = None
+        self.needs_full_redraw = True
+    
+    def refresh_categories(self):
+        """
+        Pick up category files added, changed or removed since the last look.
+        """
+        from src.randomword import get_category_names
+        names = get_category_names(refresh=True)
+        if names != self.category_names:
+            self.set_categories(names)
+    
+    def build_hit_map(self):
+        """
+        Map every screen position to the button there.
+        
+        Category buttons are mapped by their row on screen, not by
+        category, so scrolling doesn't change the map.
+        """
+        self.hit_map = HitMap((self.WIDTH, self.HEIGHT))
+        for btn in self.diff_buttons:
+            self.hit_map.add_rect(btn["rect"], ("difficulty", btn))
+        for slot, rect in enumerate(self.cat_slots):
+            self.hit_map.add_rect(rect, ("category", slot))
+        self.hit_map.add_rect(self.evil_btn, ("evil", None))
+        self.hit_map.add_rect(self.start_btn, ("start", None))
+        self.hit_map.add_rect(self.stats_btn, ("stats", None))
+    
+    def build_base(self):
+        """
+        Composite everything that never changes into one surface.
+        
+        Returns:
+            pygame.Surface: Background, titles, descriptions and the
+                            start and statistics buttons
         """
-        # Draw background
-        self.screen.blit(self.background.image, self.background.rect)
+        base = pygame.Surface((self.WIDTH, self.HEIGHT)).convert()
+        base.blit(self.background.image, self.background.rect)
         
-        # Draw title
-        title = self.title_font.render("Select Difficulty", True, self.BLACK)
-        self.screen.blit(title, (self.WIDTH//2 - title.get_width()//2, 50))
+        # Title
+        title = self.text_cache.render(self.title_font, "Select Difficulty", self.BLACK)
+        base.blit(title, (self.WIDTH//2 - title.get_width()//2, 50))
         
-        # Draw difficulty buttons
+        # Difficulty descriptions under their buttons
         for btn in self.diff_buttons:
-            pygame.draw.rect(self.screen, btn["color"], btn["rect"], border_radius=10)
-            pygame.draw.rect(self.screen, self.BLACK, btn["rect"], 3, border_radius=10)
-            
-            # Button text
-            text = self.option_font.render(btn["name"], True, self.BLACK)
-            text_x = btn["rect"].centerx - text.get_width()//2
-            text_y = btn["rect"].centery - text.get_height()//2
-            self.screen.blit(text, (text_x, text_y))
-            
-            # Description text
-            desc = self.info_font.render(btn["desc"], True, self.BLACK)
+            desc = self.text_cache.render(self.info_font, btn["desc"], self.BLACK)
             desc_x = btn["rect"].centerx - desc.get_width()//2
             desc_y = btn["rect"].bottom + 5
-            self.screen.blit(desc, (desc_x, desc_y))
+            base.blit(desc, (desc_x, desc_y))
         
-        # Draw category title if there are categories
-        if self.categories:
-            cat_title = self.option_font.render("Optional: Choose Category", True, self.BLACK)
-            self.screen.blit(cat_title, (self.WIDTH - 250 - cat_title.get_width()//2, 130))
-            
-            # Draw category buttons
-            for btn in self.cat_buttons:
-                # Use a different color for selected category
-                color = self.LIGHT_BLUE if btn["selected"] else self.WHITE
-                pygame.draw.rect(self.screen, color, btn["rect"], border_radius=5)
-                pygame.draw.rect(self.screen, self.BLACK, btn["rect"], 2, border_radius=5)
-                
-                # Button text
-                text = self.info_font.render(btn["name"].capitalize(), True, self.BLACK)
-                text_x = btn["rect"].centerx - text.get_width()//2
-                text_y = btn["rect"].centery - text.get_height()//2
-                self.screen.blit(text, (text_x, text_y))
+        # Evil mode description under its toggle
+        desc_y = self.evil_btn.bottom + 5
+        for line in ("The word changes", "to dodge guesses"):
+            desc = self.text_cache.render(self.info_font, line, self.BLACK)
+            base.blit(desc, (self.evil_btn.centerx - desc.get_width()//2, desc_y))
+            desc_y += desc.get_height()
+        
+        # Category title if there are categories
+        if self.category_names:
+            cat_title = self.text_cache.render(self.option_font, "Optional: Choose Category", self.BLACK)
+            base.blit(cat_title, (self.WIDTH - 250 - cat_title.get_width()//2, 130))
+        
+        # Start button at the bottom
+        pygame.draw.rect(base, self.DARK_BLUE, self.start_btn, border_radius=10)
+        pygame.draw.rect(base, self.BLACK, self.start_btn, 3, border_radius=10)
+        start_text = self.text_cache.render(self.option_font, "Start Game", self.WHITE)
+        base.blit(start_text, start_text.get_rect(center=self.start_btn.center))
+        
+        # Statistics button
+        pygame.draw.rect(base, self.WHITE, self.stats_btn, border_radius=5)
+        pygame.draw.rect(base, self.BLACK, self.stats_btn, 2, border_radius=5)
+        stats_text = self.text_cache.render(self.info_font, "Statistics", self.BLACK)
+        base.blit(stats_text, stats_text.get_rect(center=self.stats_btn.center))
+        return base
+    
+    def draw(self):
+        """
+        Draw the difficulty selection screen.
+        
+        A full frame blits the pre-composited base and draws every button;
+        after that, only buttons whose color, category or selection changed
+        are redrawn and pushed to the display.
+        """
+        if self.base is None:
+            self.base = self.build_base()
+        full = self.needs_full_redraw
+        if full:
+            self.screen.blit(self.base, (0, 0))
+            self.drawn_diff = [None] * len(self.diff_buttons)
+            self.drawn_slots = [None] * len(self.cat_slots)
+            self.drawn_scroll = None
+            self.drawn_evil = None
+            self.needs_full_redraw = False
+        dirty = []
+        
+        # Difficulty buttons
+        for i, btn in enumerate(self.diff_buttons):
+            if btn["color"] != self.drawn_diff[i]:
+                self.restore_base(btn["rect"])
+                self.draw_difficulty_button(btn)
+                self.drawn_diff[i] = btn["color"]
+                dirty.append(btn["rect"])
+        
+        if self.evil != self.drawn_evil:
+            self.restore_base(self.evil_btn)
+            self.draw_evil_button()
+            self.drawn_evil = self.evil
+            dirty.append(self.evil_btn)
         
-        # Draw start button at the bottom
-        start_btn = pygame.Rect((self.WIDTH - 250)//2, self.HEIGHT - 100, 250, 60)
-        pygame.draw.rect(self.screen, self.DARK_BLUE, start_btn, border_radius=10)
-        pygame.draw.rect(self.screen, self.BLACK, start_btn, 3, border_radius=10)
+        # Visible rows of the category list
+        for slot, rect in enumerate(self.cat_slots):
+            row = self.cat_scroll + slot
+            name = self.category_names[row] if row < len(self.category_names) else None
+            shown = (name, name is not None and name == self.selected_category)
+            if shown != self.drawn_slots[slot]:
+                self.restore_base(rect)
+                if name is not None:
+                    self.draw_category_button(rect, *shown)
+                self.drawn_slots[slot] = shown
+                dirty.append(rect)
         
-        start_text = self.option_font.render("Start Game", True, self.WHITE)
-        start_x = start_btn.centerx - start_text.get_width()//2
-        start_y = start_btn.centery - start_text.get_height()//2
-        self.screen.blit(start_text, (start_x, start_y))
+        if self.cat_scroll != self.drawn_scroll:
+            dirty.append(self.draw_scrollbar())
+            self.drawn_scroll = self.cat_scroll
         
-        pygame.display.update()
+        if full:
+            pygame.display.update()
+        elif dirty:
+            pygame.display.update(dirty)
+    
+    def restore_base(self, rect):
+        """
+        Copy a region of the pre-composited base back to the screen.
         
-        return start_btn
+        Args:
+            rect: The region to restore
+        """
+        self.screen.blit(self.base, rect, rect)
+    
+    def draw_difficulty_button(self, btn):
+        """
+        Draw one difficulty button.
+        
+        Args:
+            btn: The button's dict from ``self.diff_buttons``
+        """
+        pygame.draw.rect(self.screen, btn["color"], btn["rect"], border_radius=10)
+        pygame.draw.rect(self.screen, self.BLACK, btn["rect"], 3, border_radius=10)
+        text = self.text_cache.render(self.option_font, btn["name"], self.BLACK)
+        self.screen.blit(text, text.get_rect(center=btn["rect"].center))
+    
+    def draw_evil_button(self):
+        """
+        Draw the evil mode toggle, highlighted when it is on.
+        """
+        color = self.RED if self.evil else self.WHITE
+        pygame.draw.rect(self.screen, color, self.evil_btn, border_radius=5)
+        pygame.draw.rect(self.screen, self.BLACK, self.evil_btn, 2, border_radius=5)
+        label = "Evil Mode: On" if self.evil else "Evil Mode: Off"
+        text = self.text_cache.render(self.info_font, label, self.WHITE if self.evil else self.BLACK)
+        self.screen.blit(text, text.get_rect(center=self.evil_btn.center))
+    
+    def draw_category_button(self, rect, name, selected):
+        """
+        Draw one row of the category list.
+        
+        Args:
+            rect: Where to draw the button
+            name: The category name
+            selected: Whether the category is selected
+        """
+        color = self.LIGHT_BLUE if selected else self.WHITE
+        pygame.draw.rect(self.screen, color, rect, border_radius=5)
+        pygame.draw.rect(self.screen, self.BLACK, rect, 2, border_radius=5)
+        
+        # Long names are cut off at the button's edges
+        text = self.text_cache.render(self.info_font, name.capitalize(), self.BLACK)
+        area = pygame.Rect(0, 0, min(text.get_width(), rect.width - 12), text.get_height())
+        self.screen.blit(text, (rect.centerx - area.width//2, rect.centery - area.height//2), area)
+    
+    def draw_scrollbar(self):
+        """
+        Draw the category list's scrollbar, if it has more rows than fit.
+        
+        Returns:
+            pygame.Rect: The area drawn
+        """
+        self.restore_base(self.scrollbar)
+        rows = len(self.category_names)
+        visible = len(self.cat_slots)
+        if rows > visible:
+            track = self.scrollbar
+            thumb_height = max(12, track.height * visible // rows)
+            thumb_y = track.top + (track.height - thumb_height) * self.cat_scroll // (rows - visible)
+            pygame.draw.rect(self.screen, self.BLACK, (track.left, thumb_y, track.width, thumb_height),
+                             border_radius=3)
+        return self.scrollbar
+    
+    def scroll(self, rows):
+        """
+        Scroll the category list.
+        
+        Args:
+            rows: Number of rows to scroll down; negative scrolls up
+            
+        Returns:
+            bool: True if the list moved
+        """
+        last = max(0, len(self.category_names) - len(self.cat_slots))
+        scroll = min(max(self.cat_scroll + rows, 0), last)
+        if scroll == self.cat_scroll:
+            return False
+        self.cat_scroll = scroll
+        return True
+    
+    def handle_scroll(self, event):
+        """
+        Scroll the category list with the mouse wheel or the arrow and page keys.
+        
+        Args:
+            event: A pygame event
+            
+        Returns:
+            bool: True if the list moved
+        """
+        if event.type == pygame.MOUSEWHEEL:
+            return self.scroll(-event.y)
+        if event.type == pygame.KEYDOWN:
+            page = len(self.cat_slots)
+            rows = {pygame.K_UP: -1, pygame.K_DOWN: 1,
+                    pygame.K_PAGEUP: -page, pygame.K_PAGEDOWN: page}.get(event.key)
+            if rows:
+                return self.scroll(rows)
+        return False
+    
+    @staticmethod
+    def is_click(event):
+        """
+        Check whether an event is a button click rather than a wheel turn.
+        
+        Args:
+            event: A pygame event
+            
+        Returns:
+            bool: True for left, middle and right mouse button presses
+        """
+        return event.type == pygame.MOUSEBUTTONDOWN and event.button in (1, 2, 3)
     
     def handle_click(self, pos):
         """
@@ -162,78 +385,88 @@ class DifficultySelector:
             pos: The (x, y) position of the mouse click
             
         Returns:
-            tuple: (difficulty, category) if Start Game is clicked, None otherwise
+            tuple: (difficulty, category, evil) if Start Game is clicked,
+                   "stats" if Statistics is clicked, None otherwise
         """
+        hit = self.hit_map.lookup(pos)
+        if hit is None:
+            return None
+        kind, btn = hit
+        
+        if kind == "stats":
+            return "stats"
+        
+        if kind == "evil":
+            self.evil = not self.evil
+            return None
+        
         # Check difficulty button clicks
-        for btn in self.diff_buttons:
-            if btn["rect"].collidepoint(pos):
-                # Set this as the selected difficulty
-                for b in self.diff_buttons:
-                    b["color"] = self.GREEN if b["name"] == "Easy" else \
-                               self.YELLOW if b["name"] == "Medium" else \
-                               self.RED
-                
-                # Highlight the selected button
-                btn["color"] = (btn["color"][0] + 50, btn["color"][1] + 50, btn["color"][2] + 50)
-                return None
-        
-        # Check category button clicks
-        for btn in self.cat_buttons:
-            if btn["rect"].collidepoint(pos):
-                # Toggle selection
-                btn["selected"] = not btn["selected"]
-                
-                # Deselect other category buttons
-                if btn["selected"]:
-                    self.selected_category = btn["name"]
-                    for other_btn in self.cat_buttons:
-                        if other_btn != btn:
-                            other_btn["selected"] = False
-                else:
-                    self.selected_category = None
-                
-                return None
-        
-        # Check if Start Game button is clicked
-        start_btn = pygame.Rect((self.WIDTH - 250)//2, self.HEIGHT - 100, 250, 60)
-        if start_btn.collidepoint(pos):
-            # Find selected difficulty
-            difficulty = "medium"  # Default
-            for btn in self.diff_buttons:
-                if btn["color"] != (self.GREEN if btn["name"] == "Easy" else \
-                                  self.YELLOW if btn["name"] == "Medium" else \
-                                  self.RED):
-                    difficulty = btn["difficulty"]
-                    break
+        if kind == "difficulty":
+            # Set this as the selected difficulty
+            for b in self.diff_buttons:
+                b["color"] = self.GREEN if b["name"] == "Easy" else \
+                           self.YELLOW if b["name"] == "Medium" else \
+                           self.RED
             
-            return (difficulty, self.selected_category)
+            # Highlight the selected button
+            btn["color"] = (btn["color"][0] + 50, btn["color"][1] + 50, btn["color"][2] + 50)
+            return None
+        
+        # Check category button clicks; btn is the row on screen
+        if kind == "category":
+            row = self.cat_scroll + btn
+            if row < len(self.category_names):
+                # Toggle selection, which deselects any other category
+                name = self.category_names[row]
+                self.selected_category = None if name == self.selected_category else name
+            return None
+        
+        # Start Game button was clicked; find selected difficulty
+        difficulty = "medium"  # Default
+        for btn in self.diff_buttons:
+            if btn["color"] != (self.GREEN if btn["name"] == "Easy" else \
+                              self.YELLOW if btn["name"] == "Medium" else \
+                              self.RED):
+                difficulty = btn["difficulty"]
+                break
         
-        return None
+        return (difficulty, self.selected_category, self.evil)
     
     def run(self):
         """
         Run the difficulty selector screen.
         
         Returns:
-            tuple: (difficulty, category) selections
+            tuple: (difficulty, category, evil) selections, or "stats" if
+                   Statistics was clicked
         """
         running = True
-        start_btn = self.draw()
+        self.needs_full_redraw = True
+        self.draw()
         
         while running:
-            for event in pygame.event.get():
+            # Sleep until there is input instead of spinning
+            changed = False
+            for event in self.pacer.wait():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     return None
                 
-                if event.type == pygame.MOUSEBUTTONDOWN:
+                if self.is_click(event):
                     result = self.handle_click(event.pos)
                     if result:
                         return result
-                    
-                    # Redraw after handling click
-                    start_btn = self.draw()
+                    changed = True
+                elif self.handle_scroll(event):
+                    changed = True
+                
+                if self.pacer.needs_redraw(event):
+                    self.needs_full_redraw = True
+                    changed = True
             
-            pygame.display.update()
+            # Redraw only after something changed
+            if changed:
+                self.draw()
+                self.pacer.tick()
         
         return None
\ No newline at end of file
@@ -0,0 +1,183 @@
+"""
+Module with the rules of Hangman, independent of any display.
+
+The word and the guesses are kept as 26-bit masks (bit 0 is 'A'), so a
+guess and the win/loss check are a few integer operations no matter how
+long the word is. Nothing here imports pygame, which lets simulations,
+solvers and servers run the exact same rules as the game window.
+"""
+
+MAX_NUM_OF_GUESSES = 6
+
+# Results, as returned by check_game_over()
+WON = 1
+LOST = -1
+PLAYING = 0
+
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+FULL_MASK = (1 << 26) - 1
+
+
+def word_mask(word):
+    """
+    Compute the mask of the guessable letters in an uppercase word.
+
+    Args:
+        word: An uppercase word
+
+    Returns:
+        int: Bit ``i`` is set if the word contains ``ALPHABET[i]``
+    """
+    mask = 0
+    for letter in word:
+        index = ord(letter) - 65
+        if 0 <= index < 26:
+            mask |= 1 << index
+    return mask
+
+
+class HangmanEngine:
+    """
+    The state of one game of Hangman.
+    """
+
+    __slots__ = ('word', 'word_mask', 'guessed_mask', 'wrong_guesses',
+                 'max_wrong_guesses', 'result')
+
+    def __init__(self, word="", max_wrong_guesses=MAX_NUM_OF_GUESSES):
+        """
+        Initialize the engine.
+
+        Args:
+            word: The word to guess
+            max_wrong_guesses: Number of wrong guesses that loses the game
+        """
+        self.max_wrong_guesses = max_wrong_guesses
+        self.reset(word)
+
+    def reset(self, word):
+        """
+        Start a new game.
+
+        Args:
+            word: The word to guess; it is converted to uppercase
+        """
+        self.word = word.upper()
+        self.word_mask = word_mask(self.word)
+        self.guessed_mask = 0
+        self.wrong_guesses = 0
+        self.result = WON if self.word and not self.word_mask else PLAYING
+
+    def restore(self, word, guessed_mask, wrong_guesses):
+        """
+        Continue a game saved earlier.
+
+        Args:
+            word: The word to guess
+            guessed_mask: Mask of the letters guessed so far
+            wrong_guesses: Number of wrong guesses so far
+        """
+        self.reset(word)
+        self.guessed_mask = guessed_mask & FULL_MASK
+        self.wrong_guesses = wrong_guesses
+        if self.word_mask and not self.word_mask & ~self.guessed_mask:
+            self.result = WON
+        elif self.wrong_guesses >= self.max_wrong_guesses:
+            self.result = LOST
+
+    def guess_index(self, index):
+        """
+        Guess a letter by its position in the alphabet.
+
+        Args:
+            index: 0 for 'A' up to 25 for 'Z'
+
+        Returns:
+            bool: True for a correct guess, False for a wrong one, or None
+                  if the letter was already guessed or the game is over
+        """
+        bit = 1 << index
+        if self.guessed_mask & bit or self.result:
+            return None
+
+        self.guessed_mask |= bit
+        if self.word_mask & bit:
+            if not self.word_mask & ~self.guessed_mask:
+                self.result = WON
+            return True
+
+        self.wrong_guesses += 1
+        if self.wrong_guesses >= self.max_wrong_guesses:
+            self.result = LOST
+        return False
+
+    def guess(self, letter):
+        """
+        Guess a letter.
+
+        Args:
+            letter: A single letter, in either case
+
+        Returns:
+            bool: True for a correct guess, False for a wrong one, or None
+                  if the letter was already guessed or the game is over
+        """
+        return self.guess_index(ord(letter.upper()) - 65)
+
+    def is_guessed(self, letter):
+        """
+        Check whether a letter was already guessed.
+
+        Args:
+            letter: A single uppercase letter
+
+        Returns:
+            bool: True if the letter was guessed
+        """
+        return bool(self.guessed_mask >> (ord(letter) - 65) & 1)
+
+    def check_game_over(self):
+        """
+        Check if the game is won or lost.
+
+        Returns:
+            int: 1 if game is won, -1 if game is lost, 0 if game continues
+        """
+        return self.result
+
+    @property
+    def guessed_letters(self):
+        """
+        list: The guessed letters, in alphabetical order.
+        """
+        return [letter for i, letter in enumerate(ALPHABET) if self.guessed_mask >> i & 1]
+
+    @property
+    def wrong_mask(self):
+        """
+        int: Mask of the guessed letters that are not in the word.
+        """
+        return self.guessed_mask & ~self.word_mask
+
+    def get_pattern(self, placeholder="_"):
+        """
+        Get the word with placeholders for unguessed letters.
+
+        Characters that cannot be guessed, such as accented letters, are
+        always shown.
+
+        Args:
+            placeholder: Character shown for each unguessed letter
+
+        Returns:
+            str: The masked word, e.g. "P_T__N"
+        """
+        guessed = self.guessed_mask
+        pattern = []
+        for letter in self.word:
+            index = ord(letter) - 65
+            if 0 <= index < 26 and not guessed >> index & 1:
+                pattern.append(placeholder)
+            else:
+                pattern.append(letter)
+        return "".join(pattern)
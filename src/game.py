@@ -1,7 +1,21 @@
-import math
+import threading
+import time
 import pygame
-from src.randomword import get_random_word, get_random_word_from_category
+from src.adversary import AdversaryEngine
+from src.assets import AssetManager
+from src.engine import ALPHABET, HangmanEngine, MAX_NUM_OF_GUESSES
+from src.randomword import (get_random_word, get_random_word_from_category,
+                            get_category_words, get_word_index, put_back_word,
+                            save_sampler_state)
 from src.difficulty import DifficultySelector
+from src.input import HitMap
+from src.pacing import FramePacer
+from src.prefetch import RoundPrefetcher
+from src.profiling import DRAW, EVENTS, UPDATE, FrameStats, StartupProfiler
+from src.render import TextCache
+from src.savegame import EVIL, SAVE_FILE, SaveLog
+from src.stats import STATS_FILE, StatsStore
+from src.scenes import StartScene, TimerQueue
 
 class HangmanGame:
     """
@@ -10,7 +24,14 @@ class HangmanGame:
     # Game constants
     WIDTH, HEIGHT = 780, 544
     FPS = 60
-    MAX_NUM_OF_GUESSES = 6
+    MAX_NUM_OF_GUESSES = MAX_NUM_OF_GUESSES
+    
+    # Only redraw regions that changed since the last frame
+    DIRTY_RECTS = True
+    WORD_POS = (20, 50)
+    HINT_STATUS_POS = (20, 105)
+    HINT_POLL_INTERVAL = 50
+    HANGMAN_POS = (280, 130)
     
     # Colors
     BLACK = (0, 0, 0)
@@ -19,54 +40,205 @@ class HangmanGame:
     DARK_BLUE = (0, 0, 153)
     LIGHT_BROWN = (255, 204, 153)
     
-    def __init__(self):
+    FONT_PATH = 'assets/fonts/arial_bold.ttf'
+    SAVE_FILE = SAVE_FILE
+    STATS_FILE = STATS_FILE
+    
+    # The window plays a single session in the save log
+    SESSION_ID = 0
+    
+    def __init__(self, profiler=None, pacer=None):
         """
-        Initialize the game, setup display, fonts, and load assets.
+        Initialize the game, setup display, and load the title screen assets.
+        
+        Fonts, word lists and the difficulty selector are not needed for
+        the title screen; ``run()`` loads them in a background thread
+        while the title is shown.
+        
+        Args:
+            profiler: Optional StartupProfiler to record startup phases in
+            pacer: Optional FramePacer, e.g. one that records or replays input
         """
-        # Game state
-        self.current_state = 0
-        self.word = ""
+        self.profiler = profiler or StartupProfiler()
+        
+        # Game state; the rules live in the engine, this class only draws it
+        self.engine = HangmanEngine(max_wrong_guesses=self.MAX_NUM_OF_GUESSES)
         self.difficulty = "medium"
         self.category = None
-        self.guessed_letters = []
+        self.evil = False
         self.running = True
         
+        # Suggested letter; (word list, HintSolver) built on a worker
+        # thread, and whether a hint is waiting for the solver
+        self.hint = None
+        self.hint_solver = None
+        self.hint_builder = None
+        self.hint_pending = False
+        
+        # The next round, prepared while the game over screen is shown
+        self.prefetcher = RoundPrefetcher(self.prepare_round, self.discard_round)
+        
+        # What the last drawn frame showed, for dirty-rect rendering
+        self.needs_full_redraw = True
+        self.drawn_word = ""
+        self.drawn_buttons = []
+        self.drawn_state = 0
+        self.drawn_hint_pending = False
+        self.word_rect = pygame.Rect(self.WORD_POS, (0, 0))
+        
         # Setup pygame
-        self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
-        self.clock = pygame.time.Clock()
+        with self.profiler.phase("display"):
+            self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
+        self.pacer = pacer if pacer is not None else FramePacer(self.FPS)
+        self.frame_stats = FrameStats()
+        self.timers = TimerQueue(self.pacer.get_time)
+        self.scene = None
         
-        # Load fonts
-        self.LETTERS_FONT = pygame.font.Font('assets/fonts/arial_bold.ttf', 25)
-        self.GUESS_FONT = pygame.font.Font('assets/fonts/arial_bold.ttf', 34)
-        self.WORD_FONT = pygame.font.Font('assets/fonts/arial_bold.ttf', 40)
-        self.TITLE_FONT = pygame.font.Font('assets/fonts/arial_bold.ttf', 60)
+        # Rendered text surfaces, shared with the difficulty selector
+        self.text_cache = TextCache()
         
         # Create letter buttons
         self.setup_buttons()
         
-        # Load images
-        self.press_any_key = pygame.image.load("assets/images/press_any_key.png")
-        self.hangman_title = pygame.image.load("assets/images/hangman_title.png")
-        
-        self.images = []
-        for i in range(7):
-            image = pygame.image.load(f'assets/images/hangman{i}.png')
-            self.images.append(image)
-        
-        # Load background and icon
-        self.background = self.load_background("assets/images/game_background.jpg", [0, 0])
+        # Load images, converted for the display and packed into one atlas
+        with self.profiler.phase("images"):
+            self.assets = AssetManager()
+            hangman_paths = [f'assets/images/hangman{i}.png' for i in range(7)]
+            ui_paths = ["assets/images/press_any_key.png", "assets/images/hangman_title.png"]
+            atlas = self.assets.load_atlas("sprites", hangman_paths + ui_paths)
+            
+            self.press_any_key = atlas["assets/images/press_any_key.png"]
+            self.hangman_title = atlas["assets/images/hangman_title.png"]
+            self.images = [atlas[path] for path in hangman_paths]
+            
+            # Load background and icon
+            self.background = self.load_background("assets/images/game_background.jpg", [0, 0])
+            program_icon = self.assets.load_image('assets/images/loop_rope.png', convert=False)
         
         # Set window properties
-        program_icon = pygame.image.load('assets/images/loop_rope.png')
         pygame.display.set_caption("Hangman")
         pygame.display.set_icon(program_icon)
         
-        # Create difficulty selector
-        self.difficulty_selector = DifficultySelector(
-            self.screen, 
-            self.background, 
-            'assets/fonts/arial_bold.ttf'
-        )
+        # Frame time overlay, toggled with F3 during a round
+        self.show_frame_stats = False
+        self.frame_stats_rect = None
+        self.frame_stats_drawn = 0.0
+        
+        # When the current round started, for its duration in the statistics
+        self.round_started = time.monotonic()
+        
+        # (word, result, wrong guesses) of every round finished this session
+        self.rounds = []
+        
+        # Loaded in the background while the title screen is shown
+        self.save_log = None
+        self.stats = None
+        self.difficulty_selector = None
+        self.loader = None
+        self.loader_error = None
+    
+    def start_loading(self):
+        """
+        Start loading what the title screen doesn't need in a background thread.
+        """
+        self.loader = threading.Thread(target=self.load_deferred, name="loader", daemon=True)
+        self.loader.start()
+    
+    def load_deferred(self):
+        """
+        Load fonts, word lists and the difficulty selector.
+        
+        Runs on the loader thread; nothing here touches the display.
+        """
+        try:
+            with self.profiler.phase("fonts"):
+                self.STATS_FONT = pygame.font.Font(self.FONT_PATH, 14)
+                self.LETTERS_FONT = pygame.font.Font(self.FONT_PATH, 25)
+                self.GUESS_FONT = pygame.font.Font(self.FONT_PATH, 34)
+                self.WORD_FONT = pygame.font.Font(self.FONT_PATH, 40)
+                self.TITLE_FONT = pygame.font.Font(self.FONT_PATH, 60)
+                
+                # A font must not render on two threads at once, so the
+                # round prefetcher renders with copies, keyed by the original
+                self.prefetch_fonts = {
+                    self.LETTERS_FONT: pygame.font.Font(self.FONT_PATH, 25),
+                    self.WORD_FONT: pygame.font.Font(self.FONT_PATH, 40),
+                }
+            
+            with self.profiler.phase("word list"):
+                get_word_index()
+            
+            with self.profiler.phase("save log"):
+                self.save_log = self.open_save_log()
+            
+            # The database is opened on the store's own writer thread
+            self.stats = StatsStore(self.STATS_FILE)
+            
+            # Reads the category lists and the difficulty fonts
+            with self.profiler.phase("difficulty selector"):
+                self.difficulty_selector = DifficultySelector(
+                    self.screen, 
+                    self.background, 
+                    self.FONT_PATH,
+                    self.text_cache,
+                    self.pacer
+                )
+        except Exception as error:
+            self.loader_error = error
+        finally:
+            self.profiler.mark("background loading done")
+            if self.profiler.enabled:
+                print(self.profiler.format_report())
+    
+    def open_save_log(self):
+        """
+        Open the save log, recovering any round interrupted earlier.
+        
+        Returns:
+            SaveLog: The save log, or None if it can't be opened
+        """
+        try:
+            return SaveLog(self.SAVE_FILE)
+        except OSError as error:
+            print(f"Warning: Could not open save file '{self.SAVE_FILE}': {error}")
+            return None
+    
+    def ensure_loaded(self):
+        """
+        Wait for background loading to finish, loading now if it never started.
+        
+        Raises:
+            Exception: Whatever stopped background loading
+        """
+        if self.loader is None:
+            if self.difficulty_selector is not None:
+                return
+            self.load_deferred()
+        else:
+            self.loader.join()
+        if self.loader_error:
+            raise self.loader_error
+    
+    @property
+    def word(self):
+        """
+        str: The uppercase word being guessed.
+        """
+        return self.engine.word
+    
+    @property
+    def current_state(self):
+        """
+        int: Number of wrong guesses, which is also the hangman image shown.
+        """
+        return self.engine.wrong_guesses
+    
+    @property
+    def guessed_letters(self):
+        """
+        list: The letters guessed so far, in alphabetical order.
+        """
+        return self.engine.guessed_letters
     
     def setup_buttons(self):
         """
@@ -83,6 +255,13 @@ class HangmanGame:
             X = START_X + DISTANCE + ((DISTANCE * 2 + SEPERATE) * (i % 13))
             Y = START_Y + ((i // 13) * (DISTANCE + SEPERATE * 2))
             self.letters.append([X, Y, chr(A + i), False])
+        
+        # Resolve clicks and key presses to a button index in constant time
+        self.hit_map = HitMap((self.WIDTH, self.HEIGHT))
+        self.key_map = {}
+        for i, (x, y, _, _) in enumerate(self.letters):
+            self.hit_map.add_circle((x, y), DISTANCE, i)
+            self.key_map[pygame.K_a + i] = i
     
     def load_background(self, image_file, location):
         """
@@ -96,237 +275,701 @@ class HangmanGame:
             A pygame.sprite.Sprite object with the background
         """
         class Background(pygame.sprite.Sprite):
-            def __init__(self, image_file, location):
+            def __init__(self, image, location):
                 pygame.sprite.Sprite.__init__(self)
-                self.image = pygame.image.load(image_file)
+                self.image = image
                 self.rect = self.image.get_rect()
                 self.rect.left, self.rect.top = location
         
-        return Background(image_file, location)
+        # The background is opaque, so it is converted without alpha
+        return Background(self.assets.load_image(image_file, alpha=False), location)
     
     def draw(self):
         """
         Draw the game state to the screen.
+        
+        After the first full frame of a round, only the regions whose
+        content changed (the word line, clicked letter buttons and the
+        hangman image) are redrawn and pushed to the display. Frames where
+        nothing changed do no drawing at all.
+        """
+        display_word = self.get_display_word()
+        
+        if self.needs_full_redraw or not self.DIRTY_RECTS:
+            self.draw_full(display_word)
+            return
+        
+        dirty = []
+        
+        # Word line
+        if display_word != self.drawn_word:
+            old_rect = self.word_rect
+            self.restore_background(old_rect)
+            self.word_rect = self.draw_word(display_word)
+            dirty.append(old_rect.union(self.word_rect))
+        
+        # Letter buttons that were clicked since the last frame
+        for i, letter in enumerate(self.letters):
+            state = self.get_button_state(letter)
+            if state != self.drawn_buttons[i]:
+                rect = self.get_button_rect(letter)
+                self.restore_background(rect)
+                self.draw_button(letter)
+                self.drawn_buttons[i] = state
+                dirty.append(rect)
+        
+        # Hangman image
+        if self.current_state != self.drawn_state:
+            rect = self.images[self.current_state].get_rect(topleft=self.HANGMAN_POS)
+            rect.union_ip(self.images[self.drawn_state].get_rect(topleft=self.HANGMAN_POS))
+            self.restore_background(rect)
+            self.screen.blit(self.images[self.current_state], self.HANGMAN_POS)
+            self.drawn_state = self.current_state
+            dirty.append(rect)
+        
+        # "Preparing hint" note
+        if self.hint_pending != self.drawn_hint_pending:
+            dirty.append(self.draw_hint_status())
+        
+        rect = self.draw_frame_stats()
+        if rect:
+            dirty.append(rect)
+        
+        self.frame_stats.lap(DRAW)
+        if dirty:
+            pygame.display.update(dirty)
+        self.frame_stats.lap(UPDATE)
+    
+    def draw_full(self, display_word):
+        """
+        Redraw the whole game screen and update the full display.
+        
+        Args:
+            display_word: The masked word to show
         """
         # Draw background
         self.screen.blit(self.background.image, self.background.rect)
         
         # Draw word with placeholders for unguessed letters
-        display_word = ""
-        for letter in self.word:
-            if letter in self.guessed_letters:
-                display_word += letter + " "
-            else:
-                display_word += "_ "
-        
-        text = self.WORD_FONT.render(display_word, True, self.BLACK)
-        self.screen.blit(text, (20, 50))
+        self.word_rect = self.draw_word(display_word)
         
         # Draw difficulty and category info if available
-        difficulty_text = self.LETTERS_FONT.render(
-            f"Difficulty: {self.difficulty.capitalize()}", True, self.BLACK
-        )
-        self.screen.blit(difficulty_text, (self.WIDTH - difficulty_text.get_width() - 20, 20))
-        
-        if self.category:
-            category_text = self.LETTERS_FONT.render(
-                f"Category: {self.category.capitalize()}", True, self.BLACK
-            )
-            self.screen.blit(category_text, (self.WIDTH - category_text.get_width() - 20, 50))
+        for i, label in enumerate(self.get_labels(self.difficulty, self.category, self.evil)):
+            text = self.text_cache.render(self.LETTERS_FONT, label, self.BLACK)
+            self.screen.blit(text, (self.WIDTH - text.get_width() - 20, 20 + i * 30))
         
         # Draw letter buttons
         for letter in self.letters:
-            x, y, ltr, clicked = letter
-            if not clicked:
-                pygame.draw.circle(self.screen, self.DARK_BLUE, (x, y), 20, 3)
-                text = self.LETTERS_FONT.render(ltr, True, self.DARK_BLUE)
-                self.screen.blit(text, (x - text.get_width() / 2, y - text.get_height() / 2))
+            self.draw_button(letter)
         
         # Draw hangman
-        self.screen.blit(self.images[self.current_state], (280, 130))
+        self.screen.blit(self.images[self.current_state], self.HANGMAN_POS)
+        
+        self.draw_hint_status()
+        self.frame_stats_rect = None
+        self.draw_frame_stats(force=True)
         
+        self.frame_stats.lap(DRAW)
         pygame.display.update()
+        self.frame_stats.lap(UPDATE)
+        
+        # Remember what is on screen for the next dirty-rect frame
+        self.drawn_word = display_word
+        self.drawn_buttons = [self.get_button_state(letter) for letter in self.letters]
+        self.drawn_state = self.current_state
+        self.needs_full_redraw = False
+    
+    def get_labels(self, difficulty, category, evil):
+        """
+        Get the labels shown in the top right corner during a round.
+        
+        Args:
+            difficulty: The round's difficulty
+            category: The round's category, or None
+            evil: Whether the round is in evil mode
+            
+        Returns:
+            list: The label texts, top to bottom
+        """
+        labels = [f"Difficulty: {difficulty.capitalize()}{' (Evil)' if evil else ''}"]
+        if category:
+            labels.append(f"Category: {category.capitalize()}")
+        return labels
+    
+    def draw_hint_status(self):
+        """
+        Draw or remove the note shown while the hint solver is being built.
+        
+        Returns:
+            pygame.Rect: The screen area of the note
+        """
+        text = self.text_cache.render(self.LETTERS_FONT, "Preparing hint...", self.BLACK)
+        rect = text.get_rect(topleft=self.HINT_STATUS_POS)
+        self.restore_background(rect)
+        if self.hint_pending:
+            self.screen.blit(text, rect)
+        self.drawn_hint_pending = self.hint_pending
+        return rect
+    
+    def draw_frame_stats(self, force=False):
+        """
+        Draw, refresh or remove the frame time overlay in the top-left corner.
+        
+        The overlay shows the median and 99th percentile frame time and
+        the 99th percentile of each part of a frame. It is refreshed at
+        most four times a second, so it doesn't cost a render every frame.
+        
+        Args:
+            force: Redraw the overlay even if it was refreshed recently
+        
+        Returns:
+            pygame.Rect: The screen area that changed, or None
+        """
+        if not self.show_frame_stats:
+            rect = self.frame_stats_rect
+            if rect:
+                self.restore_background(rect)
+                self.frame_stats_rect = None
+            return rect
+        
+        now = time.perf_counter()
+        if not force and self.frame_stats_rect and now - self.frame_stats_drawn < 0.25:
+            return None
+        self.frame_stats_drawn = now
+        
+        stats = self.frame_stats
+        p50, p99 = stats.get_percentiles()
+        parts = "  ".join(
+            f"{name} {stats.get_percentiles(column, (99,))[0]:.1f}"
+            for column, name in ((EVENTS, "events"), (DRAW, "draw"), (UPDATE, "update"))
+        )
+        lines = [
+            f"frame p50 {p50:.1f} ms  p99 {p99:.1f} ms  ({stats.count} frames)",
+            f"p99 ms: {parts}",
+        ]
+        
+        old_rect = self.frame_stats_rect
+        rect = pygame.Rect(8, 6, 0, 0)
+        surfaces = [self.STATS_FONT.render(line, True, self.BLACK, self.WHITE) for line in lines]
+        rect.width = max(surface.get_width() for surface in surfaces)
+        rect.height = sum(surface.get_height() for surface in surfaces)
+        if old_rect:
+            self.restore_background(old_rect)
+        y = rect.top
+        for surface in surfaces:
+            self.screen.blit(surface, (rect.left, y))
+            y += surface.get_height()
+        
+        self.frame_stats_rect = rect
+        return rect.union(old_rect) if old_rect else rect
+    
+    def get_display_word(self, engine=None):
+        """
+        Get the word with placeholders for unguessed letters.
+        
+        Args:
+            engine: Game to show; the current one if None
+            
+        Returns:
+            str: The masked word, e.g. "P _ T _ _ N "
+        """
+        return "".join(letter + " " for letter in (engine or self.engine).get_pattern())
+    
+    def draw_word(self, display_word):
+        """
+        Draw the masked word from cached per-letter glyphs.
+        
+        Args:
+            display_word: The masked word to show
+            
+        Returns:
+            pygame.Rect: The area covered by the word
+        """
+        self.drawn_word = display_word
+        return self.text_cache.blit_glyphs(
+            self.screen, self.WORD_FONT, display_word, self.BLACK, self.WORD_POS
+        )
     
-    def show_start_screen(self):
+    def draw_button(self, letter):
         """
-        Show the game's start screen.
+        Draw a letter button, or nothing if it was already clicked.
+        
+        Args:
+            letter: The [x, y, letter, clicked] button entry
+        """
+        x, y, ltr, clicked = letter
+        if not clicked:
+            if ltr == self.hint:
+                pygame.draw.circle(self.screen, self.LIGHT_BROWN, (x, y), 20)
+            pygame.draw.circle(self.screen, self.DARK_BLUE, (x, y), 20, 3)
+            text = self.text_cache.render(self.LETTERS_FONT, ltr, self.DARK_BLUE)
+            self.screen.blit(text, (x - text.get_width() / 2, y - text.get_height() / 2))
+    
+    def get_button_state(self, letter):
+        """
+        Get what a letter button looks like, to detect when it must be redrawn.
+        
+        Args:
+            letter: The [x, y, letter, clicked] button entry
+            
+        Returns:
+            tuple: (clicked, hinted)
+        """
+        return (letter[3], letter[2] == self.hint)
+    
+    def get_button_rect(self, letter):
+        """
+        Get the screen area covered by a letter button.
+        
+        Args:
+            letter: The [x, y, letter, clicked] button entry
+            
+        Returns:
+            pygame.Rect: The button's bounding box
+        """
+        x, y = letter[0], letter[1]
+        return pygame.Rect(x - 21, y - 21, 42, 42)
+    
+    def restore_background(self, rect):
+        """
+        Paint the background back over a screen area.
+        
+        Args:
+            rect: The screen area to restore
+        """
+        area = rect.move(-self.background.rect.left, -self.background.rect.top)
+        self.screen.blit(self.background.image, rect, area)
+    
+    def draw_start_screen(self):
+        """
+        Draw the game's title screen.
         """
         self.screen.blit(self.background.image, self.background.rect)
         self.screen.blit(self.hangman_title, (self.WIDTH / 2 - self.hangman_title.get_width() / 2, 15))
         pygame.display.update()
-        pygame.time.delay(2000)
-        
+    
+    def draw_press_any_key(self):
+        """
+        Draw the "press any key" prompt on the title screen.
+        """
         self.screen.blit(self.press_any_key, (self.WIDTH / 2 - self.press_any_key.get_width() / 2, 415))
         pygame.display.update()
-        
-        # Wait for key or mouse press
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return False
-                if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
-                    waiting = False
-        return True
     
-    def select_difficulty(self):
+    def change_scene(self, scene):
         """
-        Show the difficulty selection screen.
+        Switch to another screen of the game.
         
-        Returns:
-            bool: True if selection was made, False if user quit
+        Timers scheduled by the previous scene are cancelled.
+        
+        Args:
+            scene: The Scene to switch to, or None to stop the game
         """
-        result = self.difficulty_selector.run()
-        if result:
-            self.difficulty, self.category = result
-            return True
-        return False
+        if self.scene:
+            self.scene.exit()
+            self.timers.cancel(self.scene)
+        self.scene = scene
+        if scene:
+            scene.enter()
     
     def reset_game(self):
         """
         Reset the game state for a new game.
         """
-        self.current_state = 0
-        
-        # Get a new word based on difficulty and category
-        if self.category:
-            self.word = get_random_word_from_category(self.category).upper()
+        self.ensure_loaded()
+        
+        # Use the round prepared during the game over screen, if the
+        # settings are the same; otherwise get a new word now
+        settings = (self.difficulty, self.category, self.evil)
+        prepared = self.prefetcher.take(settings)
+        if prepared:
+            self.engine, surfaces = prepared
+            for font, text, surface in surfaces:
+                self.text_cache.put(font, text, self.BLACK, surface)
         else:
-            self.word = get_random_word(self.difficulty).upper()
-            
-        self.guessed_letters = []
+            self.engine = self.new_engine(*settings)
         
         # Reset letter buttons
         for letter in self.letters:
             letter[3] = False
+        self.hint = None
+        self.hint_pending = False
+        self.prepare_hint_solver()
+        
+        # Other screens drew over the window, so start with a full frame
+        self.needs_full_redraw = True
+        self.round_started = time.monotonic()
+        self.checkpoint()
     
-    def check_game_over(self):
+    def new_engine(self, difficulty, category, evil):
         """
-        Check if the game is won or lost.
+        Pick a word based on difficulty and category and start a game with it.
         
+        Args:
+            difficulty: 'easy', 'medium' or 'hard'
+            category: Category name or None
+            evil: Whether to play in evil mode
+            
         Returns:
-            int: 1 if game is won, -1 if game is lost, 0 if game continues
+            HangmanEngine: The new game, an AdversaryEngine in evil mode
+        """
+        if category:
+            word = get_random_word_from_category(category, no_repeat=True)
+        else:
+            word = get_random_word(difficulty, no_repeat=True)
+        
+        # In evil mode the word is only where the round starts
+        if evil:
+            engine = AdversaryEngine(word, self.MAX_NUM_OF_GUESSES)
+            engine.set_candidates(self.get_source_words(difficulty, category))
+            return engine
+        return HangmanEngine(word, self.MAX_NUM_OF_GUESSES)
+    
+    def prefetch_round(self):
+        """
+        Start preparing a round with the current settings in the background.
+        """
+        self.prefetcher.start((self.difficulty, self.category, self.evil))
+    
+    def prepare_round(self, settings):
+        """
+        Pick the next round's word and render the text its first frame shows.
+        
+        Runs on the prefetcher's thread, so it only renders with
+        ``self.prefetch_fonts`` and leaves the text cache alone.
+        
+        Args:
+            settings: (difficulty, category, evil) of the round
+            
+        Returns:
+            tuple: (engine, list of (font, text, surface) rendered in black)
+        """
+        engine = self.new_engine(*settings)
+        texts = [(self.LETTERS_FONT, label) for label in self.get_labels(*settings)]
+        texts.append((self.LETTERS_FONT, "Preparing hint..."))
+        # Glyphs of the masked word, and of every letter it may reveal
+        glyphs = set(self.get_display_word(engine)) | set(engine.word) | set(ALPHABET)
+        texts.extend((self.WORD_FONT, glyph) for glyph in sorted(glyphs))
+        surfaces = [(font, text, self.prefetch_fonts[font].render(text, True, self.BLACK))
+                    for font, text in texts]
+        return engine, surfaces
+    
+    def discard_round(self, settings, prepared):
+        """
+        Put the word of a prepared round that won't be played back in its bag.
+        
+        Args:
+            settings: (difficulty, category, evil) the round was prepared for
+            prepared: The round, as returned by ``prepare_round()``
+        """
+        difficulty, category, _ = settings
+        engine, _ = prepared
+        put_back_word(engine.word, difficulty, category)
+    
+    def get_source_words(self, difficulty, category):
         """
-        # Check if player won
-        won = True
-        for letter in self.word:
-            if letter not in self.guessed_letters:
-                won = False
-                break
+        Get the words a round's word is drawn from.
         
-        if won:
-            return 1
+        Args:
+            difficulty: The round's difficulty
+            category: The round's category, or None
+            
+        Returns:
+            list: The category's words, or the difficulty's bucket; shared,
+                  so callers must not modify it
+        """
+        if category:
+            return get_category_words(category)
+        return get_word_index().get_words(difficulty)
+    
+    def has_saved_game(self):
+        """
+        Check whether a round was left unfinished.
         
-        # Check if player lost
-        if self.current_state == self.MAX_NUM_OF_GUESSES:
-            return -1
+        Returns:
+            bool: True if there is a saved round to resume
+        """
+        return self.save_log is not None and self.save_log.load(self.SESSION_ID) is not None
+    
+    def resume_game(self):
+        """
+        Continue the round saved in the save log.
         
-        # Game continues
-        return 0
+        Returns:
+            bool: True if a saved round was restored
+        """
+        self.ensure_loaded()
+        saved = self.save_log.load(self.SESSION_ID) if self.save_log else None
+        if not saved:
+            return False
+        
+        self.difficulty = saved["difficulty"] or "medium"
+        self.category = saved["category"]
+        self.evil = bool(saved["flags"] & EVIL)
+        self.engine = AdversaryEngine() if self.evil else HangmanEngine()
+        self.save_log.resume(self.SESSION_ID, self.engine)
+        if self.evil:
+            self.engine.set_candidates(self.get_source_words(self.difficulty, self.category))
+        for letter in self.letters:
+            letter[3] = self.engine.is_guessed(letter[2])
+        self.hint = None
+        self.hint_pending = False
+        self.prepare_hint_solver()
+        self.needs_full_redraw = True
+        self.round_started = time.monotonic()
+        return True
+    
+    def checkpoint(self):
+        """
+        Save the round in progress, or forget it once the round is over.
+        """
+        if self.save_log is None:
+            return
+        try:
+            if self.engine.check_game_over():
+                self.save_log.delete(self.SESSION_ID)
+            else:
+                self.save_log.save(self.SESSION_ID, self.engine, self.difficulty, self.category, self.evil)
+            self.save_log.flush()
+        except (OSError, ValueError) as error:
+            print(f"Warning: Could not save the game: {error}")
+    
+    def record_result(self, result):
+        """
+        Queue the result of the finished round for the statistics.
+        
+        Args:
+            result: 1 for win, -1 for lose
+        """
+        self.rounds.append((self.word, result, self.engine.wrong_guesses))
+        if self.stats:
+            # Evil rounds would drag down the win rate of their difficulty
+            difficulty = "evil" if self.evil else self.difficulty
+            self.stats.record(self.word, difficulty, self.category, result == 1,
+                              self.engine.wrong_guesses, time.monotonic() - self.round_started)
+    
+    def check_game_over(self):
+        """
+        Check if the game is won or lost.
+        
+        Returns:
+            int: 1 if game is won, -1 if game is lost, 0 if game continues
+        """
+        return self.engine.check_game_over()
     
-    def show_game_over(self, result):
+    def draw_game_over(self, result):
         """
-        Show game over screen with win/lose message.
+        Draw the win/lose message over the final game state.
         
         Args:
             result: 1 for win, -1 for lose
         """
         if result == 1:
-            text = self.TITLE_FONT.render("You won!", True, self.BLACK)
+            text = self.text_cache.render(self.TITLE_FONT, "You won!", self.BLACK)
         else:
-            text = self.TITLE_FONT.render("You lost!", True, self.BLACK)
+            text = self.text_cache.render(self.TITLE_FONT, "You lost!", self.BLACK)
             # Show the correct word
             word_text = self.LETTERS_FONT.render(f"The word was: {self.word}", True, self.BLACK)
             self.screen.blit(word_text, (self.WIDTH / 2 - word_text.get_width() / 2, 250))
         
         self.screen.blit(text, (25, 120))
-        
-        # Show try again message
-        pygame.time.delay(1300)
-        try_again = self.LETTERS_FONT.render("Press any key to try again", True, self.BLACK)
+        pygame.display.update()
+    
+    def draw_try_again(self):
+        """
+        Draw the "try again" prompt on the game over screen.
+        """
+        try_again = self.text_cache.render(self.LETTERS_FONT, "Press any key to try again", self.BLACK)
         self.screen.blit(try_again, (self.WIDTH / 2 - try_again.get_width() / 2, 10))
         pygame.display.update()
+    
+    def draw_stats_screen(self, summary):
+        """
+        Draw the statistics screen.
         
-        # Wait for key press
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return False
-                if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
-                    waiting = False
-        return True
+        Args:
+            summary: Rows from ``StatsStore.get_summary()``, or None while
+                     they are still being read
+        """
+        self.screen.blit(self.background.image, self.background.rect)
+        title = self.text_cache.render(self.TITLE_FONT, "Statistics", self.BLACK)
+        self.screen.blit(title, (self.WIDTH / 2 - title.get_width() / 2, 20))
+        
+        if summary is None:
+            lines = ["Loading..."]
+        elif not summary:
+            lines = ["No games played yet"]
+        else:
+            lines = []
+            for row in summary:
+                name = "All games" if row["grouping"] == "all" else row["name"].capitalize()
+                lines.append(f"{name}: {row['games']} played, {row['win_rate']:.0%} won, "
+                             f"{row['avg_wrong']:.1f} misses, best streak {row['best_streak']}")
+            lines.insert(1, f"Current streak: {summary[0]['streak']}")
+        
+        # As many rows as fit above the prompt
+        y = 110
+        for line in lines[:11]:
+            text = self.text_cache.render(self.LETTERS_FONT, line, self.BLACK)
+            self.screen.blit(text, (40, y))
+            y += text.get_height() + 8
+        
+        prompt = self.text_cache.render(self.LETTERS_FONT, "Press any key to go back", self.BLACK)
+        self.screen.blit(prompt, (self.WIDTH / 2 - prompt.get_width() / 2, self.HEIGHT - 45))
+        pygame.display.update()
     
-    def play_round(self):
+    def handle_mouse_click(self, pos):
         """
-        Play one round of the game.
+        Handle mouse click events for letter selection.
+        
+        Args:
+            pos: The (x, y) position of the click, from ``event.pos``
+        """
+        index = self.hit_map.lookup(pos)
+        if index is not None:
+            self.guess_button(index)
+    
+    def handle_key(self, key):
+        """
+        Handle key presses, so letters can be guessed from the keyboard.
+        
+        Args:
+            key: The pygame key code, from ``event.key``
+        """
+        index = self.key_map.get(key)
+        if index is not None:
+            self.guess_button(index)
+    
+    def guess_button(self, index):
+        """
+        Guess the letter of a button, unless it was already clicked.
+        
+        Args:
+            index: Index of the button in ``self.letters``
+        """
+        letter = self.letters[index]
+        if not letter[3]:
+            letter[3] = True
+            self.engine.guess(letter[2])
+            self.hint = None
+            self.checkpoint()
+    
+    def get_hint_words(self):
+        """
+        Get the word list hints are computed over.
         
         Returns:
-            bool: True if game should continue, False if user quit
+            list: The category's words, or every word of the word list;
+                  a new list object whenever the list was reloaded
         """
-        self.running = True
-        while self.running:
-            self.clock.tick(self.FPS)
-            
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return False
-                
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    self.handle_mouse_click()
-            
-            # Draw current state
-            self.draw()
-            
-            # Check game over condition
-            result = self.check_game_over()
-            if result != 0:
-                self.running = False
-                if not self.show_game_over(result):
-                    return False
+        if self.category:
+            return get_category_words(self.category)
+        return get_word_index().words
+    
+    def prepare_hint_solver(self):
+        """
+        Start building the hint solver for the current word list in the background.
         
-        return True
+        Nothing is started while another solver is being built, or if the
+        solver for this list, as loaded now, already exists.
+        
+        Returns:
+            bool: True if the solver is ready
+        """
+        words = self.get_hint_words()
+        built = self.hint_solver
+        if built is not None and built[0] is words:
+            return True
+        builder = self.hint_builder
+        if builder is None or not builder.is_alive():
+            self.hint_builder = threading.Thread(target=self.build_hint_solver, args=(words,),
+                                                 name="hint solver", daemon=True)
+            self.hint_builder.start()
+        return False
     
-    def handle_mouse_click(self):
+    def build_hint_solver(self, words):
         """
-        Handle mouse click events for letter selection.
+        Build the hint solver for a word list; runs on a worker thread.
+        
+        Args:
+            words: The word list
+        """
+        from src.hint import HintSolver
+        
+        try:
+            solver = HintSolver(words)
+        except Exception as error:
+            print(f"Warning: Could not build the hint solver: {error}")
+            solver = None
+        # One assignment, so the main thread never sees half of it
+        self.hint_solver = (words, solver)
+    
+    def show_hint(self):
         """
-        m_x, m_y = pygame.mouse.get_pos()
+        Highlight the letter that best narrows down the possible words.
         
-        for letter in self.letters:
-            x, y, ltr, clicked = letter
-            if not clicked:
-                dis = math.sqrt((m_x - x) ** 2 + (m_y - y) ** 2)
-                if dis < 20:  # DISTANCE
-                    letter[3] = True
-                    self.guessed_letters.append(ltr)
-                    
-                    # Increment state if wrong guess
-                    if ltr not in self.word:
-                        self.current_state += 1
-                    break
+        The solver is built on a worker thread from the word list the
+        current word was drawn from, and rebuilt when that list is
+        reloaded. Until it is ready, a note is shown and the hint appears
+        as soon as the solver is done.
+        """
+        if not self.hint_pending:
+            self.update_hint()
     
-    def run(self):
+    def update_hint(self):
         """
-        Main game loop.
+        Compute the hint, or check again shortly if the solver isn't ready.
         """
-        # Show start screen
-        if not self.show_start_screen():
+        if not self.prepare_hint_solver():
+            self.hint_pending = True
+            self.timers.schedule(self.HINT_POLL_INTERVAL, self.update_hint, owner=self.scene)
             return
         
-        # Main game loop
-        while True:
-            # Show difficulty selection
-            if not self.select_difficulty():
-                return
-            
-            # Initialize the game with selected settings
-            self.reset_game()
-            
-            # Play the game
-            if not self.play_round():
-                break
\ No newline at end of file
+        self.hint_pending = False
+        solver = self.hint_solver[1]
+        if solver is not None:
+            engine = self.engine
+            self.hint = solver.suggest(engine.get_pattern(), engine.guessed_mask, engine.wrong_mask)
+    
+    def run(self):
+        """
+        Main game loop.
+        
+        Every screen runs inside this one loop: it sleeps until there is
+        input or a timer is due, passes events to the active scene, fires
+        due timers and lets the scene draw what changed.
+        """
+        self.running = True
+        self.change_scene(StartScene(self))
+        self.profiler.mark("title screen shown")
+        self.start_loading()
+        
+        frames = self.frame_stats
+        try:
+            while self.running and self.scene:
+                timeout = self.timers.time_until_next(self.pacer.idle_timeout)
+                events = self.pacer.wait(timeout)
+                frames.begin()
+                for event in events:
+                    if event.type == pygame.QUIT:
+                        self.change_scene(None)
+                        return
+                    self.scene.handle_event(event)
+                
+                fired = self.timers.run_due()
+                frames.lap(EVENTS)
+                self.scene.draw()
+                
+                # Idle wake-ups with nothing to do would drown out real frames
+                if events or fired:
+                    frames.end()
+                self.pacer.tick()
+        finally:
+            # Also runs when a scene raises, so saves and stats aren't lost
+            if self.save_log:
+                self.save_log.close()
+            if self.stats:
+                self.stats.close()
+            # The prefetcher may still be picking a word, which wasn't played
+            self.prefetcher.drop()
+            save_sampler_state()
+            pygame.quit()
@@ -0,0 +1,187 @@
+"""
+Module for suggesting the next letter to guess.
+
+The word list is stored as a fixed-width uint8 matrix, one row per word,
+with words sorted by length so the rows of one length are a contiguous
+slice. Filtering candidates against the masked word and scoring every
+letter are whole-array NumPy operations, so a hint over a 500k-word
+dictionary fits in a single frame.
+
+NumPy is optional. Without it, hints use the pure-Python candidate filter
+from ``src.strategies`` and score letters the same way in plain Python,
+so they suggest the same letters; this is fine for the bundled word lists.
+"""
+from src.adversary import position_key
+from src.engine import ALPHABET, word_mask
+from src.strategies import filter_candidates
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Code of characters other than A-Z; 0 is padding and 1-26 are A-Z
+OTHER_CODE = 27
+
+
+class HintSolver:
+    """
+    Suggests the letter that best splits the words matching a masked word.
+    """
+
+    # Letters scored by exact position groups, after a cheaper hit/miss pass
+    EXACT_LETTERS = 4
+
+    def __init__(self, words):
+        """
+        Build the solver's word matrix.
+
+        Args:
+            words: List of words the hidden word may come from
+        """
+        words = sorted(set(word.upper() for word in words), key=len)
+        self.words = words
+
+        if np is None:
+            self.by_length = {}
+            for word in words:
+                self.by_length.setdefault(len(word), []).append((word, word_mask(word)))
+            return
+
+        width = max((len(word) for word in words), default=0)
+        chars = np.array(words, dtype=f'<U{max(width, 1)}').view(np.uint32).reshape(len(words), -1)
+        letters = (chars >= 65) & (chars <= 90)
+        self.matrix = np.where(letters, chars - 64, np.where(chars == 0, 0, OTHER_CODE)).astype(np.uint8)
+        bits = np.where(letters, np.uint32(1) << np.where(letters, chars - 65, 0).astype(np.uint32), 0)
+        self.masks = np.bitwise_or.reduce(bits.astype(np.uint32), axis=1) if len(words) else \
+            np.zeros(0, dtype=np.uint32)
+
+        # Words are sorted by length, so each length is one slice of rows
+        lengths = np.array([len(word) for word in words], dtype=np.int32)
+        self.slices = {}
+        for length in np.unique(lengths).tolist():
+            start, stop = np.searchsorted(lengths, [length, length + 1]).tolist()
+            self.slices[length] = (start, stop)
+        self.bits = np.arange(26, dtype=np.uint32)
+
+    def get_candidates(self, pattern, guessed_mask, wrong_mask):
+        """
+        Get the words that are consistent with what was revealed.
+
+        Args:
+            pattern: The masked word, with '_' for unrevealed letters
+            guessed_mask: Mask of the letters guessed so far
+            wrong_mask: Mask of the guessed letters not in the word
+
+        Returns:
+            tuple: (matrix rows, letter masks) of the candidates, or a list
+                   of (word, letter mask) pairs without NumPy
+        """
+        if np is None:
+            candidates = self.by_length.get(len(pattern), [])
+            return filter_candidates(candidates, pattern, guessed_mask, wrong_mask)
+
+        start, stop = self.slices.get(len(pattern), (0, 0))
+        rows = self.matrix[start:stop, :len(pattern)]
+        keep = (self.masks[start:stop] & np.uint32(wrong_mask)) == 0
+
+        codes = np.array([0 if shown == '_' else ord(shown) - 64 for shown in pattern], dtype=np.int16)
+        revealed = codes != 0
+        if revealed.any():
+            keep &= (rows[:, revealed] == codes[revealed]).all(axis=1)
+
+        # An unrevealed position can't hold a letter that was already guessed
+        hidden = ~revealed
+        if hidden.any() and guessed_mask:
+            guessed = np.zeros(OTHER_CODE + 1, dtype=bool)
+            guessed[1:27] = (guessed_mask >> self.bits) & 1
+            keep &= ~guessed[rows[:, hidden]].any(axis=1)
+
+        return rows[keep], self.masks[start:stop][keep]
+
+    def suggest(self, pattern, guessed_mask, wrong_mask):
+        """
+        Suggest the next letter to guess.
+
+        Each unguessed letter splits the candidates into groups by the
+        positions it would reveal (or no position, for a miss). The letter
+        with the smallest expected group size is suggested; ties go to the
+        letter found in more candidates.
+
+        Exact group sizes need a sort per letter, so they are only computed
+        for the few letters whose hit/miss split is most even, which is
+        found for all letters at once from the candidates' letter masks.
+
+        Args:
+            pattern: The masked word, with '_' for unrevealed letters
+            guessed_mask: Mask of the letters guessed so far
+            wrong_mask: Mask of the guessed letters not in the word
+
+        Returns:
+            str: The suggested uppercase letter, or None if no word matches
+        """
+        if np is None:
+            return self.suggest_python(self.get_candidates(pattern, guessed_mask, wrong_mask),
+                                       guessed_mask)
+
+        rows, masks = self.get_candidates(pattern, guessed_mask, wrong_mask)
+        total = len(rows)
+        if total == 0:
+            return None
+
+        # Number of candidates containing each letter, for all letters at once
+        present_counts = ((masks[:, None] >> self.bits) & 1).sum(axis=0).astype(np.int64)
+        split = present_counts ** 2 + (total - present_counts) ** 2
+        open_letters = [index for index in range(26)
+                        if not guessed_mask >> index & 1 and present_counts[index]]
+        open_letters.sort(key=lambda index: split[index])
+
+        weights = np.uint64(1) << np.arange(rows.shape[1], dtype=np.uint64)
+        best = None
+        for index in open_letters[:self.EXACT_LETTERS]:
+            present = int(present_counts[index])
+            signatures = (rows == index + 1).astype(np.uint64) @ weights
+            _, counts = np.unique(signatures, return_counts=True)
+            expected = int((counts.astype(np.int64) ** 2).sum())
+            score = (expected, -present)
+            if best is None or score < best[0]:
+                best = (score, index)
+
+        return None if best is None else chr(65 + best[1])
+
+    def suggest_python(self, candidates, guessed_mask):
+        """
+        Suggest the next letter without NumPy, scoring letters like ``suggest()``.
+
+        Args:
+            candidates: List of (word, letter mask) pairs from ``get_candidates()``
+            guessed_mask: Mask of the letters guessed so far
+
+        Returns:
+            str: The suggested uppercase letter, or None if no word matches
+        """
+        total = len(candidates)
+        present_counts = [0] * 26
+        for _, mask in candidates:
+            while mask:
+                low = mask & -mask
+                present_counts[low.bit_length() - 1] += 1
+                mask ^= low
+        open_letters = [index for index in range(26)
+                        if not guessed_mask >> index & 1 and present_counts[index]]
+        open_letters.sort(key=lambda index: present_counts[index] ** 2 +
+                          (total - present_counts[index]) ** 2)
+
+        best = None
+        for index in open_letters[:self.EXACT_LETTERS]:
+            letter = ALPHABET[index]
+            counts = {}
+            for word, _ in candidates:
+                key = position_key(word, letter)
+                counts[key] = counts.get(key, 0) + 1
+            expected = sum(count * count for count in counts.values())
+            score = (expected, -present_counts[index])
+            if best is None or score < best[0]:
+                best = (score, index)
+
+        return None if best is None else ALPHABET[best[1]]
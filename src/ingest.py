@@ -0,0 +1,269 @@
+"""
+Module for turning large text corpora into the game's word lists.
+
+Input files are read in fixed-size blocks that end on a line boundary,
+so memory use depends on the block size and the number of blocks in
+flight, not on the size of the corpus. The reading process only looks
+for category headers, docstring-style blocks such as
+
+    \"\"\"
+    Category: Animals
+    One animal per line.
+    \"\"\"
+
+which set the category of the lines that follow. Each block is then
+sent to a process pool, where lines are Unicode-normalized, filtered
+with the same rule as ``load_words_from_file`` and deduplicated; the
+reading process merges the unique words of each category and writes
+the word list and category files.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import os
+import re
+import unicodedata
+from src.wordindex import is_valid_word
+
+BLOCK_SIZE = 4 * 1024 * 1024
+MAIN_LIST = 'wordlist.txt'
+
+# File names of the main word lists, which the game never reads as categories
+MAIN_LISTS = (MAIN_LIST, 'words.txt')
+
+# Put in front of a category whose file would be named like a main list
+RESERVED_PREFIX = 'category_'
+
+# A line with only three quotes opens or closes a header
+HEADER_DELIMITER = re.compile(rb'^[ \t]*"""[ \t]*\r?$', re.MULTILINE)
+CATEGORY_LINE = re.compile(r'^\s*category\s*:\s*(.+?)\s*$', re.IGNORECASE | re.MULTILINE)
+
+
+def normalize_text(text, fold_accents=False):
+    """
+    Unicode-normalize text, a whole block at a time.
+
+    NFKC composes accented letters and maps compatibility forms such as
+    full-width letters and ligatures to plain ones. Pure ASCII text is
+    returned as is, since normalizing it changes nothing.
+
+    Args:
+        text: The text to normalize
+        fold_accents: Also strip accents, so "Café" becomes "Cafe"
+
+    Returns:
+        str: The normalized text
+    """
+    if text.isascii():
+        return text
+    if fold_accents:
+        text = unicodedata.normalize('NFKD', text)
+        text = ''.join(char for char in text if not unicodedata.combining(char))
+    return unicodedata.normalize('NFKC', text)
+
+
+def get_category_name(header):
+    """
+    Find the category a header declares.
+
+    Args:
+        header: Text between the header delimiters
+
+    Returns:
+        str: The lowercase category name, or None if the header has no
+             "Category:" line
+    """
+    match = CATEGORY_LINE.search(header)
+    if not match:
+        return None
+    name = re.sub(r'[^\w-]+', '_', match.group(1).strip().lower()).strip('_')
+    return name or None
+
+
+def read_blocks(path, block_size=BLOCK_SIZE):
+    """
+    Read a file in blocks that end on a line boundary.
+
+    Args:
+        path: Path of the file
+        block_size: Approximate size of a block in bytes
+
+    Yields:
+        bytes: One block of whole lines
+    """
+    rest = b''
+    with open(path, 'rb') as file:
+        while True:
+            data = file.read(block_size)
+            if not data:
+                break
+            data = rest + data
+            end = data.rfind(b'\n') + 1
+            if end == 0:
+                rest = data
+                continue
+            rest = data[end:]
+            yield data[:end]
+    if rest:
+        yield rest + b'\n'
+
+
+def split_sections(paths, block_size=BLOCK_SIZE):
+    """
+    Split corpus files into runs of lines that share a category.
+
+    Headers are parsed here; every other line is passed on untouched.
+    Each file starts without a category, and a header without a
+    "Category:" line (like the main word list's) also means none.
+
+    Args:
+        paths: Paths of the corpus files
+        block_size: Approximate size of a read block in bytes
+
+    Yields:
+        tuple: (category or None, bytes of whole lines)
+    """
+    for path in paths:
+        category = None
+        header = None
+        for block in read_blocks(path, block_size):
+            start = 0
+            for match in HEADER_DELIMITER.finditer(block):
+                if header is None:
+                    if match.start() > start:
+                        yield category, block[start:match.start()]
+                    header = []
+                else:
+                    header.append(block[start:match.start()])
+                    category = get_category_name(b''.join(header).decode('utf-8', 'replace'))
+                    header = None
+                start = match.end()
+            if header is None:
+                if start < len(block):
+                    yield category, block[start:]
+            else:
+                header.append(block[start:])
+
+
+def clean_block(category, data, fold_accents=False):
+    """
+    Normalize, filter and deduplicate the words of one block.
+
+    Runs in a worker process.
+
+    Args:
+        category: Category of the block, or None
+        data: Bytes of whole lines
+        fold_accents: Strip accents from words
+
+    Returns:
+        tuple: (category, set of words)
+    """
+    text = normalize_text(data.decode('utf-8', 'replace'), fold_accents).lower()
+    words = {word for word in map(str.strip, text.splitlines()) if is_valid_word(word)}
+    return category, words
+
+
+def ingest(paths, workers=None, block_size=BLOCK_SIZE, fold_accents=False):
+    """
+    Collect the unique words of every category from corpus files.
+
+    At most two blocks per worker are in flight at a time, which bounds
+    memory no matter how large the corpus is; only the unique words are
+    kept.
+
+    Args:
+        paths: Paths of the corpus files
+        workers: Number of worker processes; defaults to the CPU count
+        block_size: Approximate size of a read block in bytes
+        fold_accents: Strip accents from words
+
+    Returns:
+        tuple: (dict of category or None to a set of words, dict of statistics)
+    """
+    workers = workers or os.cpu_count() or 1
+    categories = {}
+    stats = {"bytes": 0, "blocks": 0}
+
+    def merge(future):
+        category, words = future.result()
+        categories.setdefault(category, set()).update(words)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = []
+        for category, data in split_sections(paths, block_size):
+            stats["bytes"] += len(data)
+            stats["blocks"] += 1
+            pending.append(pool.submit(clean_block, category, data, fold_accents))
+            if len(pending) >= 2 * workers:
+                merge(pending.pop(0))
+        for future in pending:
+            merge(future)
+
+    stats["words"] = sum(len(words) for words in categories.values())
+    return categories, stats
+
+
+def write_word_list(path, words, category=None):
+    """
+    Write a sorted word list file, replacing any existing one atomically.
+
+    Args:
+        path: Where to write the list
+        words: The words to write
+        category: Category name, written in the header; None for the main list
+    """
+    if category:
+        header = f'"""\nCategory: {category.replace("_", " ").title()}\nOne word per line.\n"""\n'
+    else:
+        header = '"""\nWord list file for Hangman game.\nOne word per line.\n"""\n'
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        file.write(header)
+        for word in sorted(words):
+            file.write(word + '\n')
+    os.replace(tmp_path, path)
+
+
+def get_file_name(category, main_list=MAIN_LIST):
+    """
+    Get the file name a category's words are written to.
+
+    A category named like a main word list, such as "words", would
+    overwrite that list and be hidden from the game, so it is prefixed
+    with ``RESERVED_PREFIX``.
+
+    Args:
+        category: Category name, or None for the main list
+        main_list: File name for words without a category
+
+    Returns:
+        str: The file name
+    """
+    if not category:
+        return main_list
+    file_name = f"{category}.txt"
+    if file_name in MAIN_LISTS or file_name == main_list:
+        file_name = RESERVED_PREFIX + file_name
+    return file_name
+
+
+def write_word_lists(categories, output_dir, main_list=MAIN_LIST):
+    """
+    Write the main word list and one file per category.
+
+    Args:
+        categories: Dict of category or None to a set of words
+        output_dir: Directory to write the files to
+        main_list: File name for words without a category
+
+    Returns:
+        list: Paths of the files written
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+    for category, words in sorted(categories.items(), key=lambda item: item[0] or ''):
+        if not words:
+            continue
+        path = os.path.join(output_dir, get_file_name(category, main_list))
+        write_word_list(path, words, category)
+        written.append(path)
+    return written
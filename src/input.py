@@ -0,0 +1,165 @@
+"""
+This module provides the input layer shared by the Hangman game screens.
+
+Screens register their buttons in a ``HitMap`` whenever their layout
+changes, so resolving a click is a single array lookup instead of a loop
+over every button. ``InputLatency`` timestamps events as they arrive and
+measures how long it takes until the frame that answers them is shown.
+"""
+from array import array
+from collections import deque
+import math
+import time
+
+
+class HitMap:
+    """
+    A per-pixel map from screen position to button id.
+    """
+
+    def __init__(self, size):
+        """
+        Initialize an empty hit map.
+
+        Args:
+            size: The (width, height) of the screen
+        """
+        self.width, self.height = size
+        self.clear()
+
+    def clear(self):
+        """
+        Remove every button from the map.
+        """
+        self.cells = array('H', bytes(2 * self.width * self.height))
+        self.ids = [None]
+
+    def register(self, button_id):
+        """
+        Get the cell value used for a button id.
+
+        Args:
+            button_id: Any hashable id
+
+        Returns:
+            int: The value stored in the cells covered by the button
+        """
+        self.ids.append(button_id)
+        return len(self.ids) - 1
+
+    def fill_span(self, y, x0, x1, value):
+        """
+        Fill one clipped row span of the map.
+
+        Args:
+            y: Row to fill
+            x0: First column, inclusive
+            x1: Last column, exclusive
+            value: Cell value to store
+        """
+        if not 0 <= y < self.height:
+            return
+        x0, x1 = max(x0, 0), min(x1, self.width)
+        if x0 < x1:
+            start = y * self.width
+            self.cells[start + x0:start + x1] = array('H', [value]) * (x1 - x0)
+
+    def add_rect(self, rect, button_id):
+        """
+        Register a rectangular button; later buttons cover earlier ones.
+
+        Args:
+            rect: The button's pygame.Rect
+            button_id: Id returned by ``lookup()`` for points inside the rect
+        """
+        value = self.register(button_id)
+        for y in range(rect.top, rect.bottom):
+            self.fill_span(y, rect.left, rect.right, value)
+
+    def add_circle(self, center, radius, button_id):
+        """
+        Register a round button covering points closer than ``radius``.
+
+        Args:
+            center: The (x, y) center of the button
+            radius: The button's radius in pixels
+            button_id: Id returned by ``lookup()`` for points inside the circle
+        """
+        value = self.register(button_id)
+        cx, cy = center
+        limit = radius * radius - 1
+        for dy in range(-radius + 1, radius):
+            dx = math.isqrt(limit - dy * dy)
+            self.fill_span(cy + dy, cx - dx, cx + dx + 1, value)
+
+    def lookup(self, pos):
+        """
+        Find the button at a screen position.
+
+        Args:
+            pos: The (x, y) position, e.g. ``event.pos``
+
+        Returns:
+            The button id, or None if no button is there
+        """
+        x, y = pos
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.ids[self.cells[y * self.width + x]]
+        return None
+
+
+class InputLatency:
+    """
+    Measures the time from receiving input to showing the frame that answers it.
+    """
+
+    def __init__(self, history=256):
+        """
+        Initialize the latency tracker.
+
+        Args:
+            history: Number of recent latencies to keep
+        """
+        self.pending = None
+        self.latencies = deque(maxlen=history)
+
+    def stamp(self, events):
+        """
+        Timestamp newly received events.
+
+        Each event gets a ``received`` attribute with its
+        ``time.perf_counter()`` arrival time.
+
+        Args:
+            events: List of pygame events that just arrived
+        """
+        if not events:
+            return
+        now = time.perf_counter()
+        for event in events:
+            event.received = now
+        if self.pending is None:
+            self.pending = now
+
+    def frame_shown(self):
+        """
+        Record that a frame answering all input received so far was shown.
+        """
+        if self.pending is not None:
+            self.latencies.append(time.perf_counter() - self.pending)
+            self.pending = None
+
+    def get_stats(self):
+        """
+        Summarize recent input-to-frame latencies.
+
+        Returns:
+            dict: Count, mean and max latency in milliseconds
+        """
+        if not self.latencies:
+            return {"count": 0, "mean_ms": 0.0, "max_ms": 0.0}
+        return {
+            "count": len(self.latencies),
+            "mean_ms": 1000 * sum(self.latencies) / len(self.latencies),
+            "max_ms": 1000 * max(self.latencies),
+        }
@@ -0,0 +1,97 @@
+"""
+This module provides frame pacing shared by every Hangman game screen.
+"""
+import pygame
+from src.input import InputLatency
+
+# Events after which the window contents have to be presented again
+REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED)
+
+
+class FramePacer:
+    """
+    Blocks on input while a screen is idle and caps the redraw rate.
+
+    Every screen loop calls ``wait()`` instead of polling
+    ``pygame.event.get()``, so a player sitting on a menu costs no CPU,
+    and calls ``tick()`` after it redraws, so a burst of input never
+    redraws faster than ``fps``. Events are timestamped on arrival and
+    ``latency`` tracks how long input waits for the frame that answers it.
+
+    ``now`` is the time the current frame's input arrived, in
+    ``pygame.time.get_ticks()`` milliseconds. Timers are measured against
+    it rather than the live clock, so a frame's events and timers are
+    ordered by the same instant, which is what makes replaying a
+    recorded session reproduce it exactly.
+    """
+
+    def __init__(self, fps=60, idle_timeout=500):
+        """
+        Initialize the frame pacer.
+
+        Args:
+            fps: Maximum number of redraws per second
+            idle_timeout: Longest time to block waiting for input, in milliseconds
+        """
+        self.fps = fps
+        self.idle_timeout = idle_timeout
+        self.clock = pygame.time.Clock()
+        self.latency = InputLatency()
+        self.now = pygame.time.get_ticks()
+
+    def wait(self, timeout=None):
+        """
+        Block until at least one event arrives or the timeout expires.
+
+        Args:
+            timeout: Longest time to block, in milliseconds; defaults to
+                     ``idle_timeout``; 0 returns immediately
+
+        Returns:
+            list: Every pending event, possibly empty on timeout
+        """
+        if timeout is None:
+            timeout = self.idle_timeout
+
+        if timeout > 0:
+            event = pygame.event.wait(timeout)
+            events = [] if event.type == pygame.NOEVENT else [event]
+        else:
+            events = []
+
+        events.extend(pygame.event.get())
+        self.now = pygame.time.get_ticks()
+        self.latency.stamp(events)
+        return events
+
+    def get_time(self):
+        """
+        Get the time of the current frame.
+
+        Returns:
+            int: Milliseconds, on the ``pygame.time.get_ticks()`` clock
+        """
+        return self.now
+
+    def tick(self):
+        """
+        Mark the end of a redraw, sleeping if needed to respect ``fps``.
+
+        Returns:
+            int: Milliseconds since the previous tick
+        """
+        self.latency.frame_shown()
+        return self.clock.tick(self.fps)
+
+    @staticmethod
+    def needs_redraw(event):
+        """
+        Check whether an event means the window has to be presented again.
+
+        Args:
+            event: A pygame event
+
+        Returns:
+            bool: True if the window was exposed or restored
+        """
+        return event.type in REDRAW_EVENTS
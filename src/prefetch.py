@@ -0,0 +1,104 @@
+"""
+Module for preparing the next round in the background.
+
+While the game over screen is shown, a worker thread picks the next word
+for the same difficulty, category and mode and does whatever else the
+round needs before its first frame. Starting the round then only hands
+over the result, so the main thread does no word list reading or font
+rendering at the moment the player clicks.
+
+Word selection isn't thread-safe, so the main thread waits for the
+worker before it picks a word itself; taking a prefetch always waits
+too, which also keeps the words picked the same from run to run. A
+prepared round that is never played, because the settings changed or
+the game closed, is handed to a discard function, which can e.g. put
+its word back so it isn't lost from a no-repeat bag.
+"""
+import threading
+
+
+class RoundPrefetcher:
+    """
+    Runs a preparation function for the next round on a worker thread.
+    """
+
+    def __init__(self, prepare, discard=None):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            prepare: Function of the round's settings returning what the
+                     round needs; it runs on the worker thread
+            discard: Optional function of (settings, result) called on the
+                     calling thread for a prepared round that isn't taken
+        """
+        self.prepare = prepare
+        self.discard = discard
+        self.thread = None
+        self.settings = None
+        self.result = None
+        self.error = None
+
+    def start(self, settings):
+        """
+        Start preparing a round, replacing any earlier prefetch.
+
+        Args:
+            settings: Hashable settings of the round, passed to ``prepare``
+        """
+        self.drop()
+        self.settings = settings
+        self.thread = threading.Thread(target=self.run, name="round prefetch", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        """
+        Prepare the round; runs on the worker thread.
+        """
+        try:
+            self.result = self.prepare(self.settings)
+        except Exception as error:
+            self.error = error
+
+    def wait(self):
+        """
+        Wait for the worker thread, if one is running.
+        """
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def drop(self):
+        """
+        Wait for the worker and discard any round it prepared.
+        """
+        self.wait()
+        result, self.result = self.result, None
+        if self.error is not None:
+            print(f"Warning: Could not prepare the next round: {self.error}")
+            self.error = None
+        elif result is not None and self.discard:
+            self.discard(self.settings, result)
+
+    def take(self, settings):
+        """
+        Get the prepared round, if it was prepared for these settings.
+
+        Each prefetch is handed out at most once. One for other settings
+        is discarded.
+
+        Args:
+            settings: Settings of the round about to start
+
+        Returns:
+            The result of ``prepare``, or None if there is nothing usable
+        """
+        if settings != self.settings:
+            self.drop()
+            return None
+        self.wait()
+        result, self.result = self.result, None
+        if self.error is not None:
+            print(f"Warning: Could not prepare the next round: {self.error}")
+            self.error = None
+        return result
@@ -0,0 +1,218 @@
+"""
+This module provides timing breakdowns of the game's startup and frames.
+"""
+from array import array
+from contextlib import contextmanager, nullcontext
+import csv
+import json
+import threading
+import time
+
+# Parts of a frame timed by FrameStats, in column order
+FRAME_PHASES = ("events", "draw", "game_over", "update")
+EVENTS, DRAW, GAME_OVER, UPDATE = range(len(FRAME_PHASES))
+TOTAL = len(FRAME_PHASES)
+
+
+class StartupProfiler:
+    """
+    Records how long each startup phase takes, on any thread.
+
+    When disabled, ``phase()`` and ``mark()`` do nothing, so the game can
+    always call them.
+    """
+
+    def __init__(self, enabled=False):
+        """
+        Initialize the profiler; the clock starts now.
+
+        Args:
+            enabled: Whether to record anything
+        """
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self.records = []
+        self.lock = threading.Lock()
+
+    def phase(self, name):
+        """
+        Time a block of startup work.
+
+        Args:
+            name: Name of the phase
+
+        Returns:
+            A context manager that records the phase when it exits
+        """
+        if not self.enabled:
+            return nullcontext()
+        return self.timed(name)
+
+    @contextmanager
+    def timed(self, name):
+        """
+        Context manager that records the duration of its block.
+
+        Args:
+            name: Name of the phase
+        """
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, begin, time.perf_counter() - begin)
+
+    def mark(self, name):
+        """
+        Record a point in time, such as the first frame being shown.
+
+        Args:
+            name: Name of the event
+        """
+        if self.enabled:
+            self.record(name, time.perf_counter(), None)
+
+    def record(self, name, begin, duration):
+        """
+        Store one phase or mark.
+
+        Args:
+            name: Name of the phase or mark
+            begin: ``time.perf_counter()`` when it started
+            duration: Length in seconds, or None for a mark
+        """
+        with self.lock:
+            self.records.append((begin - self.start, duration, name, threading.current_thread().name))
+
+    def format_report(self):
+        """
+        Format the recorded phases as a table, in start order.
+
+        Returns:
+            str: The report
+        """
+        with self.lock:
+            records = sorted(self.records)
+        lines = [f"{'start (ms)':>10} {'took (ms)':>10}  {'thread':<12} phase"]
+        for begin, duration, name, thread in records:
+            took = "" if duration is None else f"{duration * 1000:.1f}"
+            lines.append(f"{begin * 1000:>10.1f} {took:>10}  {thread:<12} {name}")
+        return "\n".join(lines)
+
+
+class FrameStats:
+    """
+    Per-frame timings of the main loop, kept in a fixed-size ring buffer.
+
+    The loop calls ``begin()`` once it has input to handle, ``lap(phase)``
+    at the end of each part of the frame and ``end()`` when the frame is
+    done. Timings are written into a preallocated array, so recording a
+    frame never builds or grows a container.
+    """
+
+    def __init__(self, capacity=1024):
+        """
+        Initialize the frame stats.
+
+        Args:
+            capacity: Number of most recent frames to keep
+        """
+        self.capacity = capacity
+        self.width = TOTAL + 1
+        self.times = array('d', bytes(8 * self.width * capacity))
+        self.index = 0
+        self.count = 0
+        self.frame_start = self.last = time.perf_counter()
+
+    def begin(self):
+        """
+        Start timing a frame, overwriting the oldest one once the buffer is full.
+        """
+        row = self.index * self.width
+        for column in range(row, row + self.width):
+            self.times[column] = 0.0
+        self.frame_start = self.last = time.perf_counter()
+
+    def lap(self, phase):
+        """
+        Add the time since the previous lap to one phase of the current frame.
+
+        Args:
+            phase: One of EVENTS, DRAW, GAME_OVER or UPDATE
+        """
+        now = time.perf_counter()
+        self.times[self.index * self.width + phase] += now - self.last
+        self.last = now
+
+    def end(self):
+        """
+        Finish the current frame and keep it in the buffer.
+        """
+        self.times[self.index * self.width + TOTAL] = time.perf_counter() - self.frame_start
+        self.index = (self.index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def get_frames(self):
+        """
+        Get the kept frames, oldest first.
+
+        Returns:
+            list: One tuple of seconds per frame, one per phase followed by the total
+        """
+        first = (self.index - self.count) % self.capacity
+        frames = []
+        for i in range(self.count):
+            row = (first + i) % self.capacity * self.width
+            frames.append(tuple(self.times[row:row + self.width]))
+        return frames
+
+    def get_percentiles(self, column=TOTAL, percentiles=(50, 99)):
+        """
+        Get percentiles of one phase, or of whole frames, over the kept frames.
+
+        Args:
+            column: A phase index, or TOTAL for whole frames
+            percentiles: Which percentiles to compute
+
+        Returns:
+            list: The percentiles in milliseconds, all 0.0 if no frame was kept
+        """
+        values = sorted(frame[column] for frame in self.get_frames())
+        if not values:
+            return [0.0 for _ in percentiles]
+        last = len(values) - 1
+        return [1000 * values[round(last * p / 100)] for p in percentiles]
+
+    def get_summary(self):
+        """
+        Summarize the kept frames.
+
+        Returns:
+            dict: p50, p99 and max in milliseconds for every phase and the total
+        """
+        summary = {}
+        for column, name in enumerate(FRAME_PHASES + ("total",)):
+            p50, p99, p100 = self.get_percentiles(column, (50, 99, 100))
+            summary[name] = {"p50_ms": p50, "p99_ms": p99, "max_ms": p100}
+        return summary
+
+    def dump(self, path):
+        """
+        Save the kept frames, as CSV if ``path`` ends in ``.csv`` and as JSON otherwise.
+
+        Args:
+            path: Where to save the frames
+        """
+        columns = [f"{name}_ms" for name in FRAME_PHASES + ("total",)]
+        frames = [[round(1000 * value, 4) for value in frame] for frame in self.get_frames()]
+        try:
+            with open(path, 'w', newline='') as file:
+                if path.lower().endswith('.csv'):
+                    writer = csv.writer(file)
+                    writer.writerow(columns)
+                    writer.writerows(frames)
+                else:
+                    json.dump({"columns": columns, "frames": frames, "summary": self.get_summary()},
+                              file, indent=2)
+        except OSError as error:
+            print(f"Warning: Could not save frame stats to '{path}': {error}")
@@ -1,8 +1,49 @@
 """
 Module for generating random words for the Hangman game.
 """
-import random
 import os
+from collections import OrderedDict
+from src.catalog import CategoryCatalog
+from src.sampler import (BAG_STATE_FILE, WordSampler, difficulty_weights, load_bag_states,
+                         save_bag_states)
+from src.scoring import WORDLISTS_DIR, get_difficulty_scores
+from src.wordindex import WordIndex, get_file_stamp, is_valid_word, load_index
+from src.wordstream import sample_word_from_file
+
+# Word lists to load words from, in order of preference
+WORD_LIST_FILES = [
+    os.path.join(WORDLISTS_DIR, 'wordlist.txt'),
+    os.path.join(WORDLISTS_DIR, 'words.txt'),
+    '/usr/share/dict/words'  # Common location on Unix-like systems
+]
+
+# Word lists at least this large are sampled straight from disk instead of indexed
+STREAMING_THRESHOLD = 64 * 1024 * 1024
+
+# How many recent words a streamed pick avoids with no_repeat; a bag of
+# every word would hold the whole dictionary in memory
+RECENT_STREAMED_WORDS = 1000
+
+# Streamed picks to try before accepting a recently played word
+MAX_REPEAT_ATTEMPTS = 20
+
+# Recently streamed words, oldest first
+_recent_words = OrderedDict()
+
+# Index over the fallback list, built the first time it is needed
+_fallback_index = None
+
+# Category word lists, found next to the main word list
+_catalog = CategoryCatalog(WORDLISTS_DIR)
+
+# Samplers keyed by (difficulty, category), with the bucket each was built from
+_samplers = {}
+
+# Saved shuffled-bag positions, loaded the first time a sampler is built
+_bag_states = None
+
+# Where bag positions are loaded from and saved to; None to not save them
+_bag_state_file = BAG_STATE_FILE
 
 def load_words_from_file(filename):
     """
@@ -18,7 +59,7 @@ def load_words_from_file(filename):
         with open(filename, 'r') as file:
             # Strip whitespace and filter out empty lines and words with non-alphabetic characters
             words = [word.strip().lower() for word in file.readlines()]
-            return [word for word in words if word and word.isalpha() and len(word) >= 3]
+            return [word for word in words if is_valid_word(word)]
     except FileNotFoundError:
         print(f"Warning: Word list file '{filename}' not found. Using fallback word list.")
         return get_fallback_words()
@@ -51,19 +92,83 @@ def get_words_by_difficulty(difficulty='medium'):
     Returns:
         list: Words of appropriate difficulty
     """
-    all_words = get_all_words()
+    # Easy: 3-5 letter words
+    # Medium: 6-7 letter words not containing uncommon letters
+    # Hard: 8+ letter words or words with uncommon letters (j, q, x, z)
+    return list(get_word_index().get_words(difficulty or 'medium'))
+
+def find_word_list():
+    """
+    Find the word list file to load words from, with its stamp.
+    
+    Both the index and the choice to stream a huge list go through this
+    lookup, so they always agree on the file. It costs one ``os.stat``
+    per missing candidate and one for the list found.
     
-    if difficulty == 'easy':
-        # Easy: 3-5 letter words
-        return [word for word in all_words if 3 <= len(word) <= 5]
-    elif difficulty == 'hard':
-        # Hard: 8+ letter words or words with uncommon letters (j, q, x, z)
-        return [word for word in all_words if len(word) >= 8 or 
-                any(letter in word for letter in 'jqxz')]
-    else:
-        # Medium: 6-7 letter words not containing uncommon letters
-        return [word for word in all_words if 6 <= len(word) <= 7 and 
-                not any(letter in word for letter in 'jqxz')]
+    Returns:
+        tuple: (path, (mtime_ns, size)) of the first word list found,
+               or (None, None) if there is none
+    """
+    for file_path in WORD_LIST_FILES:
+        try:
+            return file_path, get_file_stamp(file_path)
+        except OSError:
+            continue
+    return None, None
+
+def find_word_list_file():
+    """
+    Find the word list file to load words from.
+    
+    Returns:
+        str: Path to the first word list found, or None if there is none
+    """
+    return find_word_list()[0]
+
+def get_word_index():
+    """
+    Get the compiled index of all available words.
+    
+    The index is built once per word list and saved next to it, so later
+    calls and later game starts reuse it until the word list changes.
+    Difficulty levels come from the solver scores in
+    ``difficulty_scores.json`` when the word list was scored, and from
+    word length and uncommon letters otherwise.
+    
+    Returns:
+        WordIndex: Index over the complete list of words
+    """
+    global _fallback_index
+    
+    file_path = find_word_list_file()
+    if file_path:
+        scores = get_difficulty_scores(file_path)
+        if scores:
+            return load_index(file_path, load_words_from_file, scores.difficulties_for, scores.tag)
+        return load_index(file_path, load_words_from_file)
+    
+    # If no files are found, index the fallback list
+    if _fallback_index is None:
+        _fallback_index = WordIndex.build(get_fallback_words())
+    return _fallback_index
+
+def get_difficulty_descriptions():
+    """
+    Describe what each difficulty level means for the current word list.
+    
+    Returns:
+        dict: Difficulty name ('easy', 'medium', 'hard') to description
+    """
+    file_path = find_word_list_file()
+    scores = get_difficulty_scores(file_path) if file_path else None
+    if scores:
+        return scores.get_descriptions()
+    
+    return {
+        "easy": "3-5 letter words",
+        "medium": "6-7 letter words",
+        "hard": "8+ letter words, uncommon letters"
+    }
 
 def get_all_words():
     """
@@ -72,75 +177,238 @@ def get_all_words():
     Returns:
         list: Complete list of words
     """
-    # First try to load words from external files
-    words_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'wordlists')
+    return list(get_word_index().words)
+
+def get_sampler(difficulty=None, category=None, words=None):
+    """
+    Get the sampler of a word bucket, building it the first time.
     
-    # Try multiple possible word list files
-    potential_files = [
-        os.path.join(words_dir, 'wordlist.txt'),
-        os.path.join(words_dir, 'words.txt'),
-        '/usr/share/dict/words'  # Common location on Unix-like systems
-    ]
+    Samplers are rebuilt only when the bucket they were built from is
+    replaced, e.g. because the word list changed on disk. Category
+    samplers are dropped along with their words when the category
+    catalog evicts them, keeping their bag positions.
+    
+    Args:
+        difficulty: Optional difficulty level ('easy', 'medium', 'hard')
+        category: Optional category name; ``words`` must then be given
+        words: The category's words
+        
+    Returns:
+        WordSampler: The bucket's sampler
+    """
+    global _bag_states
     
-    for file_path in potential_files:
-        if os.path.exists(file_path):
-            return load_words_from_file(file_path)
+    bucket = words if category else get_word_index().get_words(difficulty)
+    key = f"{difficulty or ''}/{category or ''}"
+    entry = _samplers.get(key)
+    if entry is None or entry[0] is not bucket:
+        if category:
+            # Only keep samplers of categories the catalog still holds
+            for other in [other for other in _samplers if other.startswith('/')]:
+                if other == key or not _catalog.is_loaded(other[1:]):
+                    forget_sampler(other)
+        file_path = None if category else find_word_list_file()
+        scores = get_difficulty_scores(file_path) if file_path else None
+        weights = difficulty_weights(bucket, difficulty, scores.scores if scores else None)
+        sampler = WordSampler(bucket, weights)
+        if _bag_states is None:
+            _bag_states = load_bag_states(_bag_state_file) if _bag_state_file else {}
+        sampler.set_state(_bag_states.get(key))
+        _samplers[key] = entry = (bucket, sampler)
+    return entry[1]
+
+def forget_sampler(key):
+    """
+    Drop a sampler, keeping its bag position for when it is built again.
+    
+    Args:
+        key: The sampler's key in ``_samplers``
+    """
+    _, sampler = _samplers.pop(key)
+    state = sampler.get_state()
+    if state and _bag_states is not None:
+        _bag_states[key] = state
+
+def get_sampler_state():
+    """
+    Get where every shuffled bag is, including bags not used yet this session.
+    
+    Returns:
+        dict: Bucket key to bag state, as ``reset_samplers()`` takes it
+    """
+    global _bag_states
     
-    # If no files are found, use the fallback list
-    return get_fallback_words()
+    if _bag_states is None:
+        _bag_states = load_bag_states(_bag_state_file) if _bag_state_file else {}
+    for key, (_, sampler) in _samplers.items():
+        state = sampler.get_state()
+        if state:
+            _bag_states[key] = state
+    return dict(_bag_states)
 
-def get_random_word(difficulty=None):
+def reset_samplers(states, path=BAG_STATE_FILE):
+    """
+    Forget every sampler and continue the shuffled bags from given positions.
+    
+    Together with ``random.seed()``, this makes the words picked from
+    now on reproducible.
+    
+    Args:
+        states: Bucket key to bag state, from ``get_sampler_state()``
+        path: Where ``save_sampler_state()`` saves the bags; None to not save them
+    """
+    global _bag_states, _bag_state_file
+    
+    _samplers.clear()
+    _bag_states = dict(states)
+    _bag_state_file = path
+
+def save_sampler_state():
+    """
+    Save where every shuffled bag is, so the next game continues them.
+    """
+    if _bag_states is None or _bag_state_file is None:
+        return
+    save_bag_states(get_sampler_state(), _bag_state_file)
+
+def put_back_word(word, difficulty=None, category=None):
+    """
+    Return a word picked with ``no_repeat`` that was never played.
+    
+    The word counts as unplayed again: it is the next word of its bag,
+    or, for a streamed word, no longer avoided. Words picked before it
+    can't be put back, and nothing happens for those.
+    
+    Args:
+        word: The word, in any case
+        difficulty: The difficulty it was picked for
+        category: The category it was picked from, or None
+    """
+    _recent_words.pop(word.lower(), None)
+    key = f"/{category}" if category else f"{difficulty or ''}/"
+    entry = _samplers.get(key)
+    if entry:
+        entry[1].put_back(word)
+
+def get_random_word(difficulty=None, no_repeat=False):
     """
     Returns a random word for the Hangman game.
     
+    Words are weighted by how typical they are of the difficulty (see
+    ``sampler.difficulty_weights``) and drawn in constant time.
+    
+    Word lists of ``STREAMING_THRESHOLD`` bytes or more are never loaded,
+    so their words can't be weighted or put in a bag: they are picked
+    uniformly from the file, and ``no_repeat`` only avoids the last
+    ``RECENT_STREAMED_WORDS`` words.
+    
     Args:
         difficulty: Optional difficulty level ('easy', 'medium', 'hard')
+        no_repeat: Draw from a shuffled bag, so no word repeats until
+                   every word of the difficulty was played
         
     Returns:
         str: A random word
     """
-    if difficulty:
-        word_list = get_words_by_difficulty(difficulty)
-    else:
-        word_list = get_all_words()
+    # Huge dictionaries are sampled from a memory map so memory stays flat
+    file_path, stamp = find_word_list()
+    if file_path and stamp[1] >= STREAMING_THRESHOLD:
+        word = stream_random_word(file_path, difficulty, no_repeat)
+        if word:
+            return word
+    
+    sampler = get_sampler(difficulty)
+    return sampler.next() if no_repeat else sampler.draw()
+
+def stream_random_word(file_path, difficulty=None, no_repeat=False):
+    """
+    Pick a word straight from a word list file.
+    
+    Args:
+        file_path: Path to the word list
+        difficulty: Optional difficulty level ('easy', 'medium', 'hard')
+        no_repeat: Skip words among the last ``RECENT_STREAMED_WORDS``
+                   picked, unless ``MAX_REPEAT_ATTEMPTS`` picks all were
+        
+    Returns:
+        str: A random word, or None if the file has no matching word
+    """
+    attempts = MAX_REPEAT_ATTEMPTS if no_repeat else 1
+    for _ in range(attempts):
+        word = sample_word_from_file(file_path, difficulty)
+        if word is None or word not in _recent_words:
+            break
+    
+    if word and no_repeat:
+        _recent_words[word] = None
+        _recent_words.move_to_end(word)
+        if len(_recent_words) > RECENT_STREAMED_WORDS:
+            _recent_words.popitem(last=False)
+    return word
+
+def get_category_catalog():
+    """
+    Get the catalog of category word lists.
+    
+    Returns:
+        CategoryCatalog: The catalog of ``assets/wordlists``
+    """
+    return _catalog
+
+def get_category_names(refresh=False):
+    """
+    Get the names of the available categories, without loading their words.
+    
+    Args:
+        refresh: Look for added, changed and removed category files first
+        
+    Returns:
+        list: Sorted category names
+    """
+    if refresh:
+        _catalog.refresh()
+    return _catalog.names()
+
+def get_category_words(category):
+    """
+    Get the words of one category, loading them if needed.
     
-    return random.choice(word_list)
+    Args:
+        category: The name of the category
+        
+    Returns:
+        list: The category's words, empty if the category doesn't exist
+    """
+    return _catalog.get(category) or []
 
 def get_word_categories():
     """
     Returns available word categories if categorized word lists exist.
     
+    This loads every category; use ``get_category_names()`` and
+    ``get_category_words()`` when that isn't needed.
+    
     Returns:
         dict: A dictionary of category names to word lists
     """
-    categories = {}
-    categories_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
-                                 'assets', 'wordlists', 'categories')
-    
-    # If the categories directory exists, load each file as a category
-    if os.path.exists(categories_dir):
-        for filename in os.listdir(categories_dir):
-            if filename.endswith('.txt'):
-                category_name = filename[:-4]  # Remove .txt extension
-                file_path = os.path.join(categories_dir, filename)
-                categories[category_name] = load_words_from_file(file_path)
-    
-    return categories
+    return {name: get_category_words(name) for name in _catalog.names()}
 
-def get_random_word_from_category(category):
+def get_random_word_from_category(category, no_repeat=False):
     """
     Get a random word from a specific category.
     
     Args:
         category: The name of the category
+        no_repeat: Draw from a shuffled bag, so no word repeats until
+                   every word of the category was played
         
     Returns:
         str: A random word from the category, or None if category doesn't exist
     """
-    categories = get_word_categories()
-    
-    if category in categories and categories[category]:
-        return random.choice(categories[category])
-    
-    # Fallback to regular random word if category doesn't exist
-    return get_random_word()
\ No newline at end of file
+    # The catalog reloads edited files; a reloaded list gets a new sampler
+    words = _catalog.get(category)
+    if not words:
+        # Fallback to regular random word if category doesn't exist
+        return get_random_word(no_repeat=no_repeat)
+    sampler = get_sampler(category=category, words=words)
+    return sampler.next() if no_repeat else sampler.draw()
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""
+This module provides a cache of rendered text surfaces for the Hangman game.
+"""
+from collections import OrderedDict
+import pygame
+
+
+class TextCache:
+    """
+    A bounded, least-recently-used cache of rendered text surfaces.
+
+    Surfaces are keyed by (font, text, color, antialias), so a label that
+    is drawn every frame is only rasterized once. The hit and miss counters
+    make it easy to check that steady-state frames do no font rendering.
+    """
+
+    def __init__(self, max_size=512):
+        """
+        Initialize the text cache.
+
+        Args:
+            max_size: Maximum number of surfaces to keep
+        """
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        """
+        Get the rendered surface for a piece of text.
+
+        Args:
+            font: The pygame font to render with
+            text: The text to render
+            color: The text color as an (r, g, b) tuple
+            antialias: Whether to render with antialiasing
+
+        Returns:
+            pygame.Surface: The rendered text; callers must not draw on it
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def put(self, font, text, color, surface, antialias=True):
+        """
+        Add a surface rendered elsewhere, e.g. on another thread.
+
+        A surface already cached for the same key is kept.
+
+        Args:
+            font: The pygame font the surface stands for
+            text: The rendered text
+            color: The text color as an (r, g, b) tuple
+            surface: The rendered text
+            antialias: Whether it was rendered with antialiasing
+        """
+        key = (font, text, tuple(color), antialias)
+        if key in self.surfaces:
+            return
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+
+    def blit_glyphs(self, screen, font, text, color, position, antialias=True):
+        """
+        Draw text one cached glyph at a time.
+
+        Text whose characters come from a small alphabet, such as the
+        masked word, can be drawn without rasterizing any new string.
+
+        Args:
+            screen: The pygame surface to draw on
+            font: The pygame font to render with
+            text: The text to draw
+            color: The text color as an (r, g, b) tuple
+            position: The (x, y) top-left position of the text
+            antialias: Whether to render with antialiasing
+
+        Returns:
+            pygame.Rect: The area covered by the text
+        """
+        x, y = position
+        area = pygame.Rect(position, (0, font.get_height()))
+        for char in text:
+            glyph = self.render(font, char, color, antialias)
+            area.union_ip(screen.blit(glyph, (x, y)))
+            x += glyph.get_width()
+        return area
+
+    def clear(self):
+        """
+        Remove every cached surface and reset the counters.
+        """
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self):
+        """
+        Get the cache counters.
+
+        Returns:
+            dict: Number of hits, misses and cached surfaces
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.surfaces)}
@@ -0,0 +1,304 @@
+"""
+Module for recording play sessions and replaying them headless.
+
+A recording is a JSON-lines file. The first line holds what the game's
+randomness depends on: the seed given to ``random`` and the positions of
+the shuffled word bags when the session started, plus the round that
+was saved in the save log, if any. Every following line is one wake-up
+of the main loop, with its frame time (see ``FramePacer.now``) and the
+events it received; timer-only and idle wake-ups are recorded too. The
+last line lists the rounds the session played.
+
+Replaying feeds the same wake-ups to ``HangmanGame.run()`` through a
+pacer that never waits and a frame clock that follows the recording, so
+every event and timer is handled in the same order as in the real
+session, as fast as the game can draw.
+"""
+import json
+import os
+import random
+import time
+import pygame
+from src.engine import HangmanEngine
+from src.game import HangmanGame
+from src.pacing import FramePacer
+from src.profiling import FRAME_PHASES, FrameStats
+from src.randomword import get_sampler_state, reset_samplers
+from src.savegame import EVIL, SaveLog
+
+RECORDING_VERSION = 1
+
+# Event attributes that describe the receiving process, not the input
+SKIPPED_ATTRIBUTES = ('received', 'window')
+
+
+def serialize_event(event):
+    """
+    Convert an event to JSON-serializable data.
+
+    Attributes that aren't plain values, or lists of them, are dropped.
+
+    Args:
+        event: A pygame event
+
+    Returns:
+        dict: The event type and its attributes
+    """
+    data = {"type": event.type}
+    for name, value in event.dict.items():
+        if name in SKIPPED_ATTRIBUTES:
+            continue
+        if isinstance(value, (tuple, list)):
+            if all(isinstance(item, (int, float)) for item in value):
+                data[name] = list(value)
+        elif value is None or isinstance(value, (int, float, str)):
+            data[name] = value
+    return data
+
+
+def deserialize_event(data):
+    """
+    Rebuild an event from ``serialize_event()`` data.
+
+    Args:
+        data: The serialized event
+
+    Returns:
+        pygame.event.Event: The event
+    """
+    attributes = {name: tuple(value) if isinstance(value, list) else value
+                  for name, value in data.items() if name != "type"}
+    return pygame.event.Event(data["type"], attributes)
+
+
+def read_saved_round(path, session_id):
+    """
+    Read the round a save log would resume, without creating the log.
+
+    Args:
+        path: Path of the save log
+        session_id: Session of the game window
+
+    Returns:
+        dict: The saved record, or None if there is none
+    """
+    if not os.path.exists(path):
+        return None
+    log = SaveLog(path)
+    try:
+        return log.load(session_id)
+    finally:
+        log.close()
+
+
+def write_saved_round(path, session_id, saved):
+    """
+    Save a round read with ``read_saved_round()`` into a save log.
+
+    Args:
+        path: Path of the save log
+        session_id: Session of the game window
+        saved: The saved record
+    """
+    engine = HangmanEngine(max_wrong_guesses=saved["max_wrong_guesses"])
+    engine.restore(saved["word"], saved["guessed_mask"], saved["wrong_guesses"])
+    log = SaveLog(path)
+    log.save(session_id, engine, saved["difficulty"], saved["category"], bool(saved["flags"] & EVIL))
+    log.close()
+
+
+class RecordingPacer(FramePacer):
+    """
+    A frame pacer that writes every wake-up of the main loop to a recording.
+    """
+
+    def __init__(self, path, fps=60, idle_timeout=500):
+        """
+        Initialize the pacer and create the recording file.
+
+        Args:
+            path: Path of the recording
+            fps: Maximum number of redraws per second
+            idle_timeout: Longest time to block waiting for input, in milliseconds
+        """
+        super().__init__(fps, idle_timeout)
+        self.path = path
+        self.file = open(path, 'w')
+        self.frames = 0
+
+    def start(self, game, seed=None):
+        """
+        Seed the word selection and write the recording's header.
+
+        Must be called before ``game.run()``.
+
+        Args:
+            game: The HangmanGame being recorded
+            seed: Seed for ``random``; a random one if None
+        """
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        random.seed(seed)
+        header = {
+            "version": RECORDING_VERSION,
+            "pygame": pygame.version.ver,
+            "seed": seed,
+            "started": self.now,
+            "bags": get_sampler_state(),
+            "saved": read_saved_round(game.SAVE_FILE, game.SESSION_ID),
+        }
+        self.file.write(json.dumps(header) + "\n")
+
+    def wait(self, timeout=None):
+        """
+        Wait for input like ``FramePacer.wait()`` and record the wake-up.
+
+        Args:
+            timeout: Longest time to block, in milliseconds
+
+        Returns:
+            list: Every pending event, possibly empty on timeout
+        """
+        events = super().wait(timeout)
+        frame = {"t": self.now, "events": [serialize_event(event) for event in events]}
+        self.file.write(json.dumps(frame) + "\n")
+        self.frames += 1
+        return events
+
+    def close(self, rounds):
+        """
+        Write the rounds the session played and close the recording.
+
+        Args:
+            rounds: ``HangmanGame.rounds`` after the session
+        """
+        self.file.write(json.dumps({"rounds": rounds}) + "\n")
+        self.file.close()
+
+
+class ReplayPacer(FramePacer):
+    """
+    A frame pacer that returns recorded wake-ups instead of waiting for input.
+
+    It never sleeps, neither for input nor to cap the frame rate, and its
+    frame clock follows the recorded frame times. Once the recording is
+    exhausted it returns a QUIT event.
+    """
+
+    def __init__(self, frames, started, idle_timeout=500):
+        """
+        Initialize the pacer.
+
+        Args:
+            frames: Recorded (frame time, serialized events) pairs
+            started: Frame time when the recorded session started
+            idle_timeout: Longest time the game asks to block, in milliseconds
+        """
+        super().__init__(0, idle_timeout)
+        self.frames = frames
+        self.position = 0
+        self.now = started
+
+    def wait(self, timeout=None):
+        """
+        Return the next recorded wake-up.
+
+        Input to the replay window is discarded.
+
+        Args:
+            timeout: Ignored; the recording decides when the loop wakes
+
+        Returns:
+            list: The recorded events, possibly empty
+        """
+        pygame.event.clear()
+        if self.position < len(self.frames):
+            self.now, data = self.frames[self.position]
+            self.position += 1
+            events = [deserialize_event(event) for event in data]
+        else:
+            events = [pygame.event.Event(pygame.QUIT)]
+        self.latency.stamp(events)
+        return events
+
+
+def load_recording(path):
+    """
+    Load a recording.
+
+    Args:
+        path: Path of the recording
+
+    Returns:
+        tuple: (header dict, list of (frame time, events) pairs,
+               recorded rounds or None if the session didn't end normally)
+
+    Raises:
+        ValueError: If the file isn't a recording this version can replay
+    """
+    frames = []
+    rounds = None
+    with open(path) as file:
+        header = json.loads(file.readline() or 'null')
+        if not isinstance(header, dict) or header.get("version") != RECORDING_VERSION:
+            raise ValueError(f"'{path}' is not a version {RECORDING_VERSION} recording")
+        for line in file:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # A session that crashed can leave a torn last line
+                break
+            if "rounds" in entry:
+                rounds = entry["rounds"]
+                break
+            frames.append((entry["t"], entry["events"]))
+    return header, frames, rounds
+
+
+def replay_session(path, work_dir):
+    """
+    Replay a recording as fast as the game can run.
+
+    The save log and statistics database of the replay are created in
+    ``work_dir``, so the player's own files are left alone.
+
+    Args:
+        path: Path of the recording
+        work_dir: Directory for the replay's save log and statistics
+
+    Returns:
+        dict: wakeups, frames (wake-ups that did work), seconds,
+              recorded_seconds, phases (seconds spent per frame phase),
+              rounds and expected_rounds
+    """
+    header, frames, expected = load_recording(path)
+    if header["pygame"] != pygame.version.ver:
+        print(f"Note: recorded with pygame {header['pygame']}, replaying with {pygame.version.ver}")
+
+    pygame.init()
+    game = HangmanGame(pacer=ReplayPacer(frames, header["started"]))
+    game.SAVE_FILE = os.path.join(work_dir, 'replay.sav')
+    game.STATS_FILE = os.path.join(work_dir, 'replay_stats.db')
+    if header["saved"]:
+        write_saved_round(game.SAVE_FILE, game.SESSION_ID, header["saved"])
+    reset_samplers(header["bags"], path=None)
+    random.seed(header["seed"])
+
+    # Keep every frame, so the totals cover the whole session
+    game.frame_stats = FrameStats(max(len(frames), 1))
+    start = time.perf_counter()
+    game.run()
+    seconds = time.perf_counter() - start
+
+    kept = game.frame_stats.get_frames()
+    phases = {name: sum(frame[column] for frame in kept)
+              for column, name in enumerate(FRAME_PHASES)}
+    return {
+        "wakeups": len(frames),
+        "frames": len(kept),
+        "seconds": seconds,
+        "recorded_seconds": (frames[-1][0] - header["started"]) / 1000 if frames else 0.0,
+        "phases": phases,
+        "rounds": [list(played) for played in game.rounds],
+        "expected_rounds": expected,
+    }
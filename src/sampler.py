@@ -0,0 +1,271 @@
+"""
+Module for weighted and non-repeating random word selection.
+
+A ``WordSampler`` is built once per word bucket (a difficulty or a
+category) and then serves two kinds of draws:
+
+- ``draw()``: an independent weighted pick in constant time, using a
+  Walker alias table, so the cost does not depend on the number of words
+- ``next()``: a pick from a shuffled bag, which returns every word once
+  before any word repeats; weighted words tend to come earlier in the bag
+
+The position in each bag can be saved and restored, so a player does
+not see the same words again after restarting the game.
+"""
+import json
+import os
+import random
+import zlib
+
+BAG_STATE_VERSION = 1
+BAG_STATE_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.cache', 'word_bags.json')
+
+
+def difficulty_weights(words, difficulty, scores):
+    """
+    Weigh words so each difficulty favours its most typical words.
+
+    Easy games favour the words a strong player solves with the fewest
+    misses and hard games the ones that cost the most; medium and
+    unscored words are weighed equally.
+
+    Args:
+        words: The words of a bucket
+        difficulty: 'easy', 'medium', 'hard' or None
+        scores: Dictionary of word to expected misses, or None
+
+    Returns:
+        list: One weight per word, or None for equal weights
+    """
+    if not scores or difficulty not in ('easy', 'hard'):
+        return None
+    weights = []
+    for word in words:
+        score = scores.get(word)
+        if score is None:
+            weights.append(1.0)
+        elif difficulty == 'easy':
+            weights.append(1.0 / (1.0 + score))
+        else:
+            weights.append(1.0 + score)
+    return weights
+
+
+class AliasTable:
+    """
+    Walker's alias table for drawing indexes with given weights in O(1).
+    """
+
+    def __init__(self, weights):
+        """
+        Build the table in O(n) with Vose's method.
+
+        Args:
+            weights: Non-negative weights, not all zero
+        """
+        n = len(weights)
+        total = float(sum(weights))
+        if n == 0 or total <= 0:
+            raise ValueError("An alias table needs at least one positive weight")
+
+        scaled = [weight * n / total for weight in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        self.size = n
+
+    def draw(self, rng=random):
+        """
+        Draw an index with probability proportional to its weight.
+
+        One random number picks a column and, with its fractional part,
+        whether to take the column or its alias.
+
+        Args:
+            rng: Random number generator to use
+
+        Returns:
+            int: The drawn index
+        """
+        r = rng.random() * self.size
+        i = int(r)
+        return i if r - i < self.prob[i] else self.alias[i]
+
+
+class WordSampler:
+    """
+    Weighted and no-repeat draws from one bucket of words.
+    """
+
+    def __init__(self, words, weights=None, rng=random):
+        """
+        Initialize the sampler; the shuffled bag is made on first use.
+
+        Args:
+            words: The words to draw from
+            weights: Optional weight per word; None for equal weights
+            rng: Random number generator to use
+        """
+        self.words = list(words)
+        self.weights = weights
+        self.rng = rng
+        self.table = AliasTable(weights) if weights else None
+        self.checksum = zlib.crc32('\n'.join(self.words).encode('utf-8'))
+        self.order = None
+        self.seed = None
+        self.position = 0
+        self.avoid = None
+
+    def draw(self):
+        """
+        Draw a weighted random word, independent of earlier draws.
+
+        Returns:
+            str: The word, or None if there are no words
+        """
+        if not self.words:
+            return None
+        if self.table:
+            return self.words[self.table.draw(self.rng)]
+        return self.rng.choice(self.words)
+
+    def next(self):
+        """
+        Take the next word from the shuffled bag, reshuffling when it is empty.
+
+        Returns:
+            str: The word, or None if there are no words
+        """
+        if not self.words:
+            return None
+        if self.order is None or self.position >= len(self.order):
+            last = self.order[-1] if self.order else None
+            self.shuffle(self.rng.getrandbits(64), last)
+        index = self.order[self.position]
+        self.position += 1
+        return self.words[index]
+
+    def put_back(self, word):
+        """
+        Return the word last taken with ``next()`` to the bag, e.g. because
+        it was never shown, so it is the next word again.
+
+        Args:
+            word: The word that was taken, in any case
+
+        Returns:
+            bool: True if it was the last word taken and was put back
+        """
+        if not self.position or self.words[self.order[self.position - 1]].upper() != word.upper():
+            return False
+        self.position -= 1
+        return True
+
+    def shuffle(self, seed, avoid=None):
+        """
+        Fill the bag in an order determined by ``seed``.
+
+        With weights, the order is a weighted random permutation: each word
+        gets the key ``u ** (1 / weight)`` and the bag is sorted by key.
+
+        Args:
+            seed: Seed of the order
+            avoid: Index that must not come first, so the last word of the
+                   previous bag isn't repeated right away
+        """
+        rng = random.Random(seed)
+        if self.weights:
+            keys = [rng.random() ** (1.0 / weight) if weight > 0 else 0.0 for weight in self.weights]
+            order = sorted(range(len(self.words)), key=keys.__getitem__, reverse=True)
+        else:
+            order = list(range(len(self.words)))
+            rng.shuffle(order)
+        if len(order) > 1 and order[0] == avoid:
+            order[0], order[-1] = order[-1], order[0]
+        self.order = order
+        self.seed = seed
+        self.avoid = avoid
+        self.position = 0
+
+    def get_state(self):
+        """
+        Get the position in the bag, to continue it later.
+
+        Returns:
+            dict: JSON-serializable state, or None if the bag was never used
+        """
+        if self.order is None:
+            return None
+        return {"checksum": self.checksum, "seed": self.seed,
+                "avoid": self.avoid, "position": self.position}
+
+    def set_state(self, state):
+        """
+        Continue a bag saved with ``get_state()``.
+
+        The state is ignored if the words changed since it was saved.
+
+        Args:
+            state: The saved state
+
+        Returns:
+            bool: True if the state was restored
+        """
+        if not state or state.get("checksum") != self.checksum:
+            return False
+        self.shuffle(state["seed"], state["avoid"])
+        self.position = min(state["position"], len(self.order))
+        return True
+
+
+def load_bag_states(path=BAG_STATE_FILE):
+    """
+    Load saved bag positions.
+
+    Args:
+        path: Path of the state file
+
+    Returns:
+        dict: Bucket key to state; empty if there is no usable file
+    """
+    try:
+        with open(path) as file:
+            data = json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as error:
+        print(f"Warning: Could not read word bag state '{path}': {error}")
+        return {}
+    if data.get("version") != BAG_STATE_VERSION:
+        return {}
+    return data.get("bags", {})
+
+
+def save_bag_states(states, path=BAG_STATE_FILE):
+    """
+    Save bag positions; failures only print a warning.
+
+    Args:
+        states: Bucket key to state
+        path: Path of the state file
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(tmp_path, 'w') as file:
+            json.dump({"version": BAG_STATE_VERSION, "bags": states}, file)
+        os.replace(tmp_path, path)
+    except OSError as error:
+        print(f"Warning: Could not save word bag state '{path}': {error}")
@@ -0,0 +1,279 @@
+"""
+This module saves and resumes games through an append-only session log.
+
+Every checkpoint of a session is one fixed-size, struct-packed record
+appended to the log, holding the word, the guesses as a 26-bit mask and
+the number of wrong guesses, the difficulty, the category and whether
+the round is played in evil mode. Writing a checkpoint never rewrites
+earlier data, so it costs one small buffered write. Opening a log
+replays it, the last record of each session winning.
+
+The word and the category are stored UTF-8 encoded in fixed fields of
+48 and 16 bytes, so longer ones can't be saved: ``pack_record()``
+raises ValueError for them, and the game plays such rounds unsaved.
+
+Records carry a CRC, so after a crash a torn or partly written tail is
+detected and cut off, and recovery keeps every complete checkpoint
+before it. Once most records are superseded, the log is compacted by
+writing the live records to a new file and swapping it in.
+"""
+import os
+import struct
+import time
+import zlib
+from src.engine import HangmanEngine
+
+# Next to the game, so saves don't depend on the working directory
+SAVE_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'hangman.sav')
+
+# File header: magic, format version, record size
+HEADER = struct.Struct('<4sHH')
+MAGIC = b'HGSV'
+SAVE_VERSION = 1
+
+# Record: session id, saved at (unix seconds), guessed mask, wrong guesses,
+# max wrong guesses, difficulty, flags, word, category, CRC of the rest
+RECORD = struct.Struct('<QIIBBBB48s16sI')
+BODY_SIZE = RECORD.size - 4
+
+DIFFICULTY_CODES = {None: 0, 'easy': 1, 'medium': 2, 'hard': 3}
+DIFFICULTY_NAMES = {code: name for name, code in DIFFICULTY_CODES.items()}
+
+# Record flags
+DELETED = 1
+EVIL = 2
+
+
+def pack_record(session_id, engine, difficulty=None, category=None, flags=0):
+    """
+    Pack a checkpoint of a game into a fixed-size record.
+
+    Args:
+        session_id: Integer id of the session, 0 to 2**64 - 1
+        engine: The session's HangmanEngine
+        difficulty: 'easy', 'medium', 'hard' or None
+        category: Category name or None
+        flags: Record flags, e.g. DELETED or EVIL
+
+    Returns:
+        bytes: The record
+
+    Raises:
+        ValueError: If the word or category doesn't fit in its field
+    """
+    word = engine.word.encode('utf-8')
+    category_bytes = (category or '').encode('utf-8')
+    if len(word) > 48 or len(category_bytes) > 16:
+        raise ValueError(f"Word or category too long to save: {engine.word!r}, {category!r}")
+    body = RECORD.pack(session_id, int(time.time()), engine.guessed_mask,
+                       engine.wrong_guesses, engine.max_wrong_guesses,
+                       DIFFICULTY_CODES.get(difficulty, 0), flags,
+                       word, category_bytes, 0)[:BODY_SIZE]
+    return body + struct.pack('<I', zlib.crc32(body))
+
+
+def unpack_record(record):
+    """
+    Unpack a record.
+
+    Args:
+        record: Bytes of one record
+
+    Returns:
+        dict: session_id, saved_at, guessed_mask, wrong_guesses,
+              max_wrong_guesses, difficulty, flags, word and category,
+              or None if the record is corrupt
+    """
+    (session_id, saved_at, guessed_mask, wrong_guesses, max_wrong_guesses,
+     difficulty, flags, word, category, crc) = RECORD.unpack(record)
+    if zlib.crc32(record[:BODY_SIZE]) != crc:
+        return None
+    return {
+        "session_id": session_id,
+        "saved_at": saved_at,
+        "guessed_mask": guessed_mask,
+        "wrong_guesses": wrong_guesses,
+        "max_wrong_guesses": max_wrong_guesses,
+        "difficulty": DIFFICULTY_NAMES.get(difficulty),
+        "flags": flags,
+        "word": word.rstrip(b'\0').decode('utf-8'),
+        "category": category.rstrip(b'\0').decode('utf-8') or None,
+    }
+
+
+class SaveLog:
+    """
+    An append-only log of game checkpoints, keyed by session id.
+    """
+
+    def __init__(self, path=SAVE_FILE, compact_ratio=4, min_compact=1024, sync=False):
+        """
+        Open a log, recovering its sessions; a missing log is created.
+
+        Args:
+            path: Path of the log file
+            compact_ratio: Compact once the log holds this many records per live session
+            min_compact: Never compact logs with fewer records than this
+            sync: ``os.fsync()`` on every ``flush()``, to survive power loss
+                  and not only a crash of the game
+        """
+        self.path = path
+        self.compact_ratio = compact_ratio
+        self.min_compact = min_compact
+        self.sync = sync
+        self.records = {}
+        self.count = 0
+        self.file = None
+        self.recover()
+
+    def recover(self):
+        """
+        Replay the log into the latest record of every session.
+
+        A corrupt or partial tail, left by a crash during a write, is
+        truncated so new records follow the last complete one.
+        """
+        self.records = {}
+        self.count = 0
+        size = RECORD.size
+        valid_end = HEADER.size
+        try:
+            with open(self.path, 'rb') as file:
+                data = file.read()
+        except FileNotFoundError:
+            data = b''
+
+        if len(data) < HEADER.size or HEADER.unpack_from(data) != (MAGIC, SAVE_VERSION, size):
+            if data:
+                print(f"Warning: '{self.path}' is not a compatible save log, starting a new one")
+            self.rewrite({})
+            return
+
+        records = self.records
+        for offset in range(HEADER.size, len(data) - size + 1, size):
+            record = data[offset:offset + size]
+            if zlib.crc32(record[:BODY_SIZE]) != int.from_bytes(record[BODY_SIZE:], 'little'):
+                break
+            session_id = int.from_bytes(record[:8], 'little')
+            if record[19] & DELETED:
+                records.pop(session_id, None)
+            else:
+                records[session_id] = record
+            self.count += 1
+            valid_end = offset + size
+
+        self.file = open(self.path, 'r+b')
+        if valid_end < len(data):
+            print(f"Warning: Dropped {len(data) - valid_end} bytes of a torn write in '{self.path}'")
+            self.file.truncate(valid_end)
+        self.file.seek(valid_end)
+
+    def save(self, session_id, engine, difficulty=None, category=None, evil=False):
+        """
+        Checkpoint a game; buffered until ``flush()``.
+
+        Args:
+            session_id: Integer id of the session
+            engine: The session's HangmanEngine
+            difficulty: 'easy', 'medium', 'hard' or None
+            category: Category name or None
+            evil: Whether the round is played in evil mode
+        """
+        record = pack_record(session_id, engine, difficulty, category, EVIL if evil else 0)
+        self.records[session_id] = record
+        self.append(record)
+
+    def delete(self, session_id):
+        """
+        Forget a session, e.g. when its game is over; buffered until ``flush()``.
+
+        Args:
+            session_id: Integer id of the session
+        """
+        if self.records.pop(session_id, None) is not None:
+            self.append(pack_record(session_id, HangmanEngine(), flags=DELETED))
+
+    def append(self, record):
+        """
+        Append one record, compacting the log if it has grown too large.
+
+        Args:
+            record: The packed record
+        """
+        self.file.write(record)
+        self.count += 1
+        if self.count >= self.min_compact and self.count > self.compact_ratio * len(self.records):
+            self.compact()
+
+    def flush(self):
+        """
+        Write buffered records to the file.
+        """
+        self.file.flush()
+        if self.sync:
+            os.fsync(self.file.fileno())
+
+    def load(self, session_id):
+        """
+        Get the latest checkpoint of a session.
+
+        Args:
+            session_id: Integer id of the session
+
+        Returns:
+            dict: The record as returned by ``unpack_record()``, or None
+        """
+        record = self.records.get(session_id)
+        return unpack_record(record) if record else None
+
+    def resume(self, session_id, engine):
+        """
+        Restore a saved game into an engine.
+
+        Args:
+            session_id: Integer id of the session
+            engine: HangmanEngine to continue the game in
+
+        Returns:
+            dict: The saved record, or None if the session has no save
+        """
+        saved = self.load(session_id)
+        if saved:
+            engine.max_wrong_guesses = saved["max_wrong_guesses"]
+            engine.restore(saved["word"], saved["guessed_mask"], saved["wrong_guesses"])
+        return saved
+
+    def compact(self):
+        """
+        Rewrite the log with only the latest record of every live session.
+        """
+        self.rewrite(self.records)
+
+    def rewrite(self, records):
+        """
+        Replace the log file atomically with a header and the given records.
+
+        Args:
+            records: Dict of session id to packed record
+        """
+        if self.file:
+            self.file.close()
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, SAVE_VERSION, RECORD.size))
+            file.write(b''.join(records.values()))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
+        self.count = len(records)
+        self.file = open(self.path, 'r+b')
+        self.file.seek(0, os.SEEK_END)
+
+    def close(self):
+        """
+        Flush and close the log.
+        """
+        if self.file:
+            self.flush()
+            self.file.close()
+            self.file = None
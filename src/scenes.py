@@ -0,0 +1,302 @@
+"""
+This module defines the screens of the Hangman game as scenes.
+
+A single main loop in ``HangmanGame.run()`` feeds events to the active
+scene, fires due timers and lets the scene draw. No scene ever sleeps or
+runs its own event loop, so input is handled within one frame at every
+point in the game. Timed transitions, like the title screen's delay before
+"press any key" appears, go through the ``TimerQueue``.
+"""
+import heapq
+import itertools
+import pygame
+from src.profiling import GAME_OVER
+
+
+class TimerQueue:
+    """
+    A priority queue of callbacks to run at a given time.
+    """
+
+    def __init__(self, clock=pygame.time.get_ticks):
+        """
+        Initialize an empty timer queue.
+
+        Args:
+            clock: Function returning the current time in milliseconds
+        """
+        self.timers = []
+        self.counter = itertools.count()
+        self.clock = clock
+
+    def schedule(self, delay, callback, owner=None):
+        """
+        Schedule a callback to run after a delay.
+
+        Args:
+            delay: Delay in milliseconds
+            callback: Function to call with no arguments
+            owner: Optional object the timer belongs to, for ``cancel()``
+        """
+        due = self.clock() + delay
+        heapq.heappush(self.timers, (due, next(self.counter), callback, owner))
+
+    def cancel(self, owner):
+        """
+        Cancel every pending timer that belongs to an owner.
+
+        Args:
+            owner: The owner passed to ``schedule()``
+        """
+        self.timers = [timer for timer in self.timers if timer[3] is not owner]
+        heapq.heapify(self.timers)
+
+    def time_until_next(self, default):
+        """
+        Get how long the main loop may sleep before the next timer is due.
+
+        Args:
+            default: Value to return if no timer is pending
+
+        Returns:
+            int: Milliseconds until the next timer, never more than ``default``
+        """
+        if not self.timers:
+            return default
+        remaining = self.timers[0][0] - self.clock()
+        return max(0, min(remaining, default))
+
+    def run_due(self):
+        """
+        Run every callback whose time has come, in order.
+
+        Returns:
+            int: Number of callbacks run
+        """
+        now = self.clock()
+        count = 0
+        while self.timers and self.timers[0][0] <= now:
+            _, _, callback, _ = heapq.heappop(self.timers)
+            callback()
+            count += 1
+        return count
+
+
+class Scene:
+    """
+    Base class for a screen of the game.
+    """
+
+    def __init__(self, game):
+        """
+        Initialize the scene.
+
+        Args:
+            game: The HangmanGame the scene belongs to
+        """
+        self.game = game
+
+    def enter(self):
+        """
+        Called when the scene becomes active.
+        """
+
+    def exit(self):
+        """
+        Called when the scene stops being active.
+        """
+
+    def handle_event(self, event):
+        """
+        Handle one input event.
+
+        Args:
+            event: A pygame event
+        """
+
+    def draw(self):
+        """
+        Draw whatever changed since the last frame.
+        """
+
+
+class StartScene(Scene):
+    """
+    The title screen, which shows "press any key" after a short delay.
+    """
+
+    PROMPT_DELAY = 2000
+
+    def enter(self):
+        self.game.draw_start_screen()
+        self.game.timers.schedule(self.PROMPT_DELAY, self.game.draw_press_any_key, owner=self)
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
+            # Pick up an interrupted round where it was left
+            self.game.ensure_loaded()
+            if self.game.has_saved_game():
+                self.game.change_scene(PlayScene(self.game, resume=True))
+            else:
+                self.game.change_scene(DifficultyScene(self.game))
+        elif self.game.pacer.needs_redraw(event):
+            pygame.display.update()
+
+
+class DifficultyScene(Scene):
+    """
+    The difficulty and category selection screen.
+    """
+
+    def enter(self):
+        self.game.ensure_loaded()
+        # Other screens drew over the window
+        self.game.difficulty_selector.refresh_categories()
+        self.game.difficulty_selector.needs_full_redraw = True
+        self.dirty = True
+
+    def handle_event(self, event):
+        selector = self.game.difficulty_selector
+        if selector.is_click(event):
+            result = selector.handle_click(event.pos)
+            if result == "stats":
+                self.game.change_scene(StatsScene(self.game))
+            elif result:
+                self.game.difficulty, self.game.category, self.game.evil = result
+                self.game.change_scene(PlayScene(self.game))
+            else:
+                self.dirty = True
+        elif selector.handle_scroll(event):
+            self.dirty = True
+        elif self.game.pacer.needs_redraw(event):
+            selector.needs_full_redraw = True
+            self.dirty = True
+
+    def draw(self):
+        if self.dirty:
+            self.game.difficulty_selector.draw()
+            self.dirty = False
+
+
+class PlayScene(Scene):
+    """
+    One round of guessing letters.
+    """
+
+    def __init__(self, game, resume=False):
+        """
+        Initialize the play scene.
+
+        Args:
+            game: The HangmanGame the scene belongs to
+            resume: Continue the saved round instead of starting a new one
+        """
+        super().__init__(game)
+        self.resume = resume
+
+    def enter(self):
+        if not (self.resume and self.game.resume_game()):
+            self.game.reset_game()
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            self.game.handle_mouse_click(event.pos)
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_F1:
+                self.game.show_hint()
+            elif event.key == pygame.K_F3:
+                self.game.show_frame_stats = not self.game.show_frame_stats
+            else:
+                self.game.handle_key(event.key)
+        elif self.game.pacer.needs_redraw(event):
+            self.game.needs_full_redraw = True
+
+    def draw(self):
+        self.game.draw()
+
+        result = self.game.check_game_over()
+        self.game.frame_stats.lap(GAME_OVER)
+        if result != 0:
+            self.game.change_scene(GameOverScene(self.game, result))
+
+
+class GameOverScene(Scene):
+    """
+    The win/lose message, which shows "try again" after a short delay.
+    """
+
+    PROMPT_DELAY = 1300
+
+    def __init__(self, game, result):
+        """
+        Initialize the game over scene.
+
+        Args:
+            game: The HangmanGame the scene belongs to
+            result: 1 for win, -1 for lose
+        """
+        super().__init__(game)
+        self.result = result
+
+    def enter(self):
+        self.ready = False
+        self.game.record_result(self.result)
+        self.game.draw_game_over(self.result)
+        # "Try again" usually starts a round just like this one
+        self.game.prefetch_round()
+        self.game.timers.schedule(self.PROMPT_DELAY, self.show_prompt, owner=self)
+
+    def show_prompt(self):
+        """
+        Show "try again" and start accepting input.
+
+        Clicks made before the prompt appears are ignored, so the last
+        guess of a round can't skip past the result by accident.
+        """
+        self.game.draw_try_again()
+        self.ready = True
+
+    def handle_event(self, event):
+        if not self.ready:
+            if self.game.pacer.needs_redraw(event):
+                pygame.display.update()
+            return
+        if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
+            self.game.change_scene(DifficultyScene(self.game))
+        elif self.game.pacer.needs_redraw(event):
+            pygame.display.update()
+
+
+class StatsScene(Scene):
+    """
+    Win rates and streaks, read from the stats store without blocking.
+    """
+
+    POLL_INTERVAL = 20
+
+    def enter(self):
+        stats = self.game.stats
+        self.summary = stats.get_summary() if stats else None
+        self.game.draw_stats_screen(None)
+        self.poll()
+
+    def poll(self):
+        """
+        Draw the statistics once the stats store has answered.
+        """
+        if self.summary is None:
+            self.game.draw_stats_screen([])
+        elif self.summary.done():
+            try:
+                self.game.draw_stats_screen(self.summary.result())
+            except Exception as error:
+                print(f"Warning: Could not read statistics: {error}")
+                self.game.draw_stats_screen([])
+        else:
+            self.game.timers.schedule(self.POLL_INTERVAL, self.poll, owner=self)
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
+            self.game.change_scene(DifficultyScene(self.game))
+        elif self.game.pacer.needs_redraw(event):
+            pygame.display.update()
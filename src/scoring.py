@@ -0,0 +1,357 @@
+"""
+Module for data-driven word difficulty.
+
+Every word of a word list is played several times by a reference solver
+(the candidate-filtering strategy, with random tie-breaks) that knows the
+list. Since the solver knows every word, it finds most words without a
+miss, long ones included, so a word's score is its mean number of wrong
+guesses plus ``LENGTH_WEIGHT`` per letter. Words are then split into
+easy, medium and hard levels at the scores a third and two thirds of the
+way through, and each level is described to the player by its typical
+word length and expected misses.
+
+Scores are computed offline with ``score_words.py`` and saved in one JSON
+artifact. Each source file is identified by its size and SHA-1, so the
+artifact stays valid after a checkout but is ignored as soon as a word
+list is edited.
+"""
+import hashlib
+import json
+import os
+import random
+import zlib
+from src.engine import HangmanEngine
+from src.strategies import CandidateStrategy
+
+SCORES_VERSION = 2
+WORDLISTS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'wordlists')
+SCORES_FILE = os.path.join(WORDLISTS_DIR, 'difficulty_scores.json')
+DIFFICULTIES = ('easy', 'medium', 'hard')
+
+# Expected misses a letter of word length counts as in a word's score
+LENGTH_WEIGHT = 0.25
+
+# Loaded artifact and validated sources, cached for this process
+_artifact = None
+_artifact_stamp = None
+_sources = {}
+
+# Solvers built by worker processes, keyed by source path
+_worker_solvers = {}
+
+
+class DifficultyScores:
+    """
+    Difficulty levels of the words of one word list, based on solver scores.
+    """
+
+    def __init__(self, digest, levels, thresholds, scores=None):
+        """
+        Initialize the scores of one word list.
+
+        Args:
+            digest: SHA-1 of the word list the scores were computed for
+            levels: Dictionary of word to difficulty name
+            thresholds: [easy/medium, medium/hard] split points of the scores
+            scores: Optional dictionary of word to expected misses
+        """
+        self.digest = digest
+        self.levels = levels
+        self.thresholds = thresholds
+        self.scores = scores or {}
+
+        # Identifies the levels, so an index built from older scores of
+        # the same word list is rebuilt
+        listing = '\n'.join(f"{word} {level}" for word, level in sorted(levels.items()))
+        self.tag = f"{digest}-{zlib.crc32(listing.encode('utf-8')):08x}"
+
+    def difficulties_for(self, word, mask=None):
+        """
+        List the difficulty levels a word belongs to.
+
+        Args:
+            word: The word to classify
+            mask: Unused; accepted so this can replace ``wordindex.difficulties_for``
+
+        Returns:
+            list: The word's difficulty, or nothing if the word was not scored
+        """
+        level = self.levels.get(word)
+        return [level] if level else []
+
+    def get_descriptions(self):
+        """
+        Describe each difficulty by its mean word length and expected misses.
+
+        Returns:
+            dict: Difficulty name to description
+        """
+        lengths = {level: [] for level in DIFFICULTIES}
+        misses = {level: 0.0 for level in DIFFICULTIES}
+        for word, level in self.levels.items():
+            lengths[level].append(len(word))
+            misses[level] += self.scores.get(word, 0.0)
+
+        descriptions = {}
+        for level in DIFFICULTIES:
+            count = len(lengths[level])
+            if count:
+                descriptions[level] = (f"~{sum(lengths[level]) / count:.0f} letters, "
+                                       f"{misses[level] / count:.1f} expected misses")
+            else:
+                descriptions[level] = "No words"
+        return descriptions
+
+
+def get_file_digest(path):
+    """
+    Get the SHA-1 of a file.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        str: Hex digest of the file's contents
+    """
+    digest = hashlib.sha1()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def get_source_key(path):
+    """
+    Get the name a word list is stored under in the artifact.
+
+    Args:
+        path: Path to the word list
+
+    Returns:
+        str: The file name for lists in ``assets/wordlists``, else the absolute path
+    """
+    path = os.path.abspath(path)
+    if os.path.dirname(path) == os.path.abspath(WORDLISTS_DIR):
+        return os.path.basename(path)
+    return path
+
+
+def play_word(word, strategy, engine, rounds):
+    """
+    Compute a word's expected number of misses against the solver.
+
+    Args:
+        word: The word to score
+        strategy: The reference CandidateStrategy
+        engine: A HangmanEngine to play on
+        rounds: Number of games to average over
+
+    Returns:
+        float: Mean wrong guesses
+    """
+    misses = 0
+    for _ in range(rounds):
+        engine.reset(word)
+        strategy.start(engine)
+        while not engine.result:
+            index = strategy.choose(engine)
+            if index is None or engine.guess_index(index) is None:
+                break
+        misses += engine.wrong_guesses
+    return misses / rounds
+
+
+def score_chunk(source_path, words, rounds, seed):
+    """
+    Score some words of a word list; runs in a worker process.
+
+    Args:
+        source_path: Path to the word list, which is the solver's dictionary
+        words: The words to score
+        rounds: Number of games to average over per word
+        seed: Seed for the solver's tie-breaks
+
+    Returns:
+        dict: Word to score
+    """
+    from src.randomword import load_words_from_file
+
+    strategy = _worker_solvers.get(source_path)
+    if strategy is None:
+        strategy = CandidateStrategy(load_words_from_file(source_path))
+        _worker_solvers[source_path] = strategy
+    strategy.rng = strategy.fallback.rng = random.Random(seed)
+
+    engine = HangmanEngine()
+    return {word: play_word(word, strategy, engine, rounds) for word in words}
+
+
+def difficulty_score(word, misses):
+    """
+    Combine a word's expected misses and its length into one score.
+
+    Args:
+        word: The word
+        misses: The word's expected misses against the solver
+
+    Returns:
+        float: The score; higher is harder
+    """
+    return misses + LENGTH_WEIGHT * len(word)
+
+
+def split_by_score(scores):
+    """
+    Split scored words into easy, medium and hard levels by score.
+
+    The split points are the scores a third and two thirds of the way
+    through the ranking. A word is easy up to the first, medium up to
+    the second and hard above it, so words with equal scores always
+    share a level. Levels are only roughly equal in size when many words
+    share a score. If both split points fall on the same score, the
+    second moves up to the next higher score, so medium isn't empty
+    while there are higher scores.
+
+    Args:
+        scores: Dictionary of word to score
+
+    Returns:
+        tuple: (dictionary of word to difficulty, [low, high] thresholds)
+    """
+    ranked = sorted(scores.values())
+    total = len(ranked)
+    if not total:
+        return {}, [0.0, 0.0]
+
+    low = ranked[(total - 1) // 3]
+    high = ranked[(2 * total - 1) // 3]
+    if high == low:
+        high = next((score for score in ranked if score > low), low)
+
+    levels = {}
+    for word, score in scores.items():
+        if score <= low:
+            levels[word] = 'easy'
+        elif score <= high:
+            levels[word] = 'medium'
+        else:
+            levels[word] = 'hard'
+    return levels, [low, high]
+
+
+def score_files(paths, rounds=8, workers=None, chunk_size=500, seed=0):
+    """
+    Score every word of several word lists across a process pool.
+
+    Args:
+        paths: Paths of the word lists to score
+        rounds: Number of games to average over per word
+        workers: Number of worker processes; defaults to the CPU count
+        chunk_size: Number of words per task sent to a worker
+        seed: Base seed for the solver's tie-breaks
+
+    Returns:
+        dict: The artifact, ready for ``write_scores()``
+    """
+    # Imported here so starting the game doesn't pay for the process pool
+    from concurrent.futures import ProcessPoolExecutor
+    from src.randomword import load_words_from_file
+
+    artifact = {"version": SCORES_VERSION, "rounds": rounds, "sources": {}}
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        jobs = []
+        for path in paths:
+            words = sorted(set(load_words_from_file(path)))
+            futures = [pool.submit(score_chunk, path, words[i:i + chunk_size], rounds, seed + i)
+                       for i in range(0, len(words), chunk_size)]
+            jobs.append((path, futures))
+
+        for path, futures in jobs:
+            scores = {}
+            for future in futures:
+                scores.update(future.result())
+            levels, thresholds = split_by_score({word: difficulty_score(word, misses)
+                                                 for word, misses in scores.items()})
+            artifact["sources"][get_source_key(path)] = {
+                "sha1": get_file_digest(path),
+                "thresholds": thresholds,
+                "scores": {word: [round(score, 3), levels[word]] for word, score in sorted(scores.items())},
+            }
+    return artifact
+
+
+def write_scores(artifact, path=SCORES_FILE):
+    """
+    Save a scores artifact.
+
+    Args:
+        artifact: The artifact from ``score_files()``
+        path: Where to save it
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as file:
+        json.dump(artifact, file, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def load_artifact(path=SCORES_FILE):
+    """
+    Load the scores artifact, reusing it while the file is unchanged.
+
+    Args:
+        path: Path to the artifact
+
+    Returns:
+        dict: The artifact, or None if it is missing or unreadable
+    """
+    global _artifact, _artifact_stamp
+
+    try:
+        info = os.stat(path)
+    except OSError:
+        return None
+    stamp = (path, info.st_mtime_ns, info.st_size)
+    if stamp != _artifact_stamp:
+        try:
+            with open(path) as file:
+                artifact = json.load(file)
+        except (OSError, ValueError) as error:
+            print(f"Warning: Could not read difficulty scores '{path}': {error}")
+            artifact = None
+        if artifact and artifact.get("version") != SCORES_VERSION:
+            artifact = None
+        _artifact, _artifact_stamp = artifact, stamp
+        _sources.clear()
+    return _artifact
+
+
+def get_difficulty_scores(source_path):
+    """
+    Get the solver-based difficulty levels of a word list.
+
+    Args:
+        source_path: Path to the word list
+
+    Returns:
+        DifficultyScores: The word list's scores, or None if it was not
+                          scored or was edited since
+    """
+    artifact = load_artifact()
+    if not artifact:
+        return None
+
+    info = os.stat(source_path)
+    stamp = (source_path, info.st_mtime_ns, info.st_size)
+    if stamp in _sources:
+        return _sources[stamp]
+
+    scores = None
+    entry = artifact["sources"].get(get_source_key(source_path))
+    if entry:
+        digest = get_file_digest(source_path)
+        if entry["sha1"] == digest:
+            levels = {word: level for word, (_, level) in entry["scores"].items()}
+            misses = {word: score for word, (score, _) in entry["scores"].items()}
+            scores = DifficultyScores(digest, levels, entry["thresholds"], misses)
+    _sources[stamp] = scores
+    return scores
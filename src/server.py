@@ -0,0 +1,279 @@
+"""
+This module serves Hangman to many players at once over a line protocol.
+
+Each TCP connection is one player session playing with the same word
+selection (``src.randomword``) and rules (``HangmanEngine``) as the game
+window. The whole server runs on one asyncio event loop, so a session
+costs a socket, a small coroutine and a ``Session``. Every request is
+one line and gets exactly one reply line:
+
+    NEW [difficulty|category]  ->  OK <pattern> <wrong>/<max>
+    GUESS <letter>             ->  HIT|MISS|REPEAT <pattern> <wrong>/<max>
+                                   WON|LOST <pattern> <wrong>/<max> <word>
+    STATE                      ->  OK <pattern> <wrong>/<max>
+    QUIT                       ->  BYE
+
+Requests and replies are UTF-8, since words may have accented letters.
+Errors are answered with ``ERR <reason>``, including unexpected errors
+while handling a request, which leave the session open. The server
+sends ``BYE idle`` and closes sessions that sent nothing for
+``idle_timeout`` seconds, and ``ERR busy`` to connections beyond
+``max_sessions``.
+"""
+import asyncio
+import time
+from src.engine import LOST, WON, HangmanEngine, MAX_NUM_OF_GUESSES
+from src.randomword import get_category_catalog, get_random_word, get_random_word_from_category
+
+DIFFICULTIES = ('easy', 'medium', 'hard')
+
+# Longest request line accepted, in bytes
+MAX_LINE = 64
+
+# Bytes buffered for a client before the server stops reading its requests
+WRITE_HIGH_WATER = 16 * 1024
+
+
+class Session:
+    """
+    The state of one connected player.
+    """
+
+    __slots__ = ('engine', 'writer', 'last_active')
+
+    def __init__(self, writer):
+        """
+        Initialize a session without a game.
+
+        Args:
+            writer: The asyncio StreamWriter of the connection
+        """
+        self.engine = None
+        self.writer = writer
+        self.last_active = time.monotonic()
+
+
+def pick_word(choice):
+    """
+    Pick a word for a new game.
+
+    Args:
+        choice: A difficulty, a category name or None for a word of any difficulty
+
+    Returns:
+        str: The word, or None if ``choice`` is neither a difficulty nor a category
+    """
+    if not choice:
+        return get_random_word()
+    if choice in DIFFICULTIES:
+        return get_random_word(choice)
+    if choice in get_category_catalog():
+        return get_random_word_from_category(choice)
+    return None
+
+
+def format_state(status, engine):
+    """
+    Format a reply describing a game.
+
+    Args:
+        status: The reply's first word
+        engine: The session's HangmanEngine
+
+    Returns:
+        str: The reply line, without the newline
+    """
+    reply = f"{status} {engine.get_pattern()} {engine.wrong_guesses}/{engine.max_wrong_guesses}"
+    if engine.result:
+        reply += f" {engine.word}"
+    return reply
+
+
+def handle_request(session, line):
+    """
+    Apply one request to a session.
+
+    Args:
+        session: The requesting Session
+        line: The request, without the newline
+
+    Returns:
+        str: The reply line, without the newline
+    """
+    command, _, argument = line.strip().partition(' ')
+    command = command.upper()
+    argument = argument.strip()
+    engine = session.engine
+
+    if command == 'GUESS':
+        if engine is None:
+            return "ERR no game, send NEW"
+        # Letters like 'ß' are alphabetic but upper-case to two letters
+        if not (len(argument) == 1 and argument.isascii() and argument.isalpha()):
+            return "ERR guess one letter A-Z"
+        correct = engine.guess(argument)
+        if engine.result == WON:
+            return format_state("WON", engine)
+        if engine.result == LOST:
+            return format_state("LOST", engine)
+        if correct is None:
+            return format_state("REPEAT", engine)
+        return format_state("HIT" if correct else "MISS", engine)
+
+    if command == 'NEW':
+        word = pick_word(argument.lower())
+        if word is None:
+            return f"ERR unknown difficulty or category '{argument}'"
+        if engine is None:
+            engine = session.engine = HangmanEngine(max_wrong_guesses=MAX_NUM_OF_GUESSES)
+        engine.reset(word)
+        return format_state("OK", engine)
+
+    if command == 'STATE':
+        if engine is None:
+            return "ERR no game, send NEW"
+        return format_state("OK", engine)
+
+    return f"ERR unknown command '{command}'"
+
+
+class HangmanServer:
+    """
+    An asyncio TCP server running one Hangman session per connection.
+    """
+
+    def __init__(self, host='127.0.0.1', port=7777, max_sessions=20000,
+                 idle_timeout=300.0, sweep_interval=5.0):
+        """
+        Initialize the server.
+
+        Args:
+            host: Address to listen on
+            port: Port to listen on; 0 picks a free port
+            max_sessions: Most connections served at once
+            idle_timeout: Seconds without a request before a session is closed
+            sweep_interval: Seconds between checks for idle sessions
+        """
+        self.host = host
+        self.port = port
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.sweep_interval = sweep_interval
+        self.sessions = set()
+        self.tasks = set()
+        self.server = None
+        self.sweeper = None
+        self.stats = {"connections": 0, "rejected": 0, "evicted": 0, "requests": 0}
+
+    async def start(self):
+        """
+        Start listening and sweeping idle sessions.
+
+        Returns:
+            int: The port the server listens on
+        """
+        self.server = await asyncio.start_server(self.serve, self.host, self.port,
+                                                 limit=MAX_LINE, backlog=1024)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.sweeper = asyncio.ensure_future(self.sweep())
+        return self.port
+
+    async def close(self):
+        """
+        Stop the server and close every session.
+        """
+        if self.sweeper:
+            self.sweeper.cancel()
+        if self.server:
+            self.server.close()
+        for session in list(self.sessions):
+            session.writer.close()
+        # Sessions still waiting for a request would only end on their own
+        # when the client sends something
+        tasks = [task for task in self.tasks if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self.server:
+            await self.server.wait_closed()
+
+    async def serve_forever(self):
+        """
+        Run until cancelled.
+        """
+        await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.close()
+
+    async def serve(self, reader, writer):
+        """
+        Run one session until the client quits, goes idle or disconnects.
+
+        Replies are written before the next request is read, and the
+        writer is drained whenever the client falls behind, so a client
+        that doesn't read its replies stops being read from and TCP flow
+        control pushes back on it.
+
+        Args:
+            reader: The connection's StreamReader
+            writer: The connection's StreamWriter
+        """
+        if len(self.sessions) >= self.max_sessions:
+            self.stats["rejected"] += 1
+            writer.write(b"ERR busy\n")
+            writer.close()
+            return
+
+        writer.transport.set_write_buffer_limits(high=WRITE_HIGH_WATER)
+        session = Session(writer)
+        task = asyncio.current_task()
+        self.sessions.add(session)
+        self.tasks.add(task)
+        self.stats["connections"] += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    writer.write(b"ERR line too long\n")
+                    break
+                if not line:
+                    break
+                session.last_active = time.monotonic()
+                self.stats["requests"] += 1
+
+                request = line.decode('utf-8', 'replace')
+                if request.strip().upper() == 'QUIT':
+                    writer.write(b"BYE\n")
+                    break
+                try:
+                    reply = handle_request(session, request)
+                except Exception as error:
+                    print(f"Warning: Request {request.strip()!r} failed: {error!r}")
+                    reply = "ERR internal error"
+                writer.write(reply.encode('utf-8', 'replace') + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.sessions.discard(session)
+            self.tasks.discard(task)
+            writer.close()
+
+    async def sweep(self):
+        """
+        Periodically close sessions that have been idle for too long.
+
+        One pass over all sessions every ``sweep_interval`` seconds is far
+        cheaper than a timeout on every pending read.
+        """
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            deadline = time.monotonic() - self.idle_timeout
+            for session in [s for s in self.sessions if s.last_active < deadline]:
+                self.sessions.discard(session)
+                self.stats["evicted"] += 1
+                session.writer.write(b"BYE idle\n")
+                session.writer.close()
@@ -0,0 +1,189 @@
+"""
+Module for playing complete Hangman games without a window.
+
+Games are split into batches that run in a process pool. Each batch draws
+its words through the same functions as the game, plays them with a
+guessing strategy on a HangmanEngine and returns only summary counts, so
+results stay small no matter how many games are played.
+"""
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from src.engine import HangmanEngine, MAX_NUM_OF_GUESSES, WON
+from src.randomword import get_all_words, get_category_words, get_random_word, get_random_word_from_category
+from src.strategies import get_strategy
+
+DIFFICULTIES = ['easy', 'medium', 'hard']
+
+
+def new_stats():
+    """
+    Create empty result counters for one difficulty.
+
+    Returns:
+        dict: Games, wins, total guesses, and histograms of wrong and total guesses
+    """
+    return {"games": 0, "wins": 0, "guesses": 0,
+            "wrong": [0] * (MAX_NUM_OF_GUESSES + 1), "total": {}}
+
+
+def merge_stats(into, other):
+    """
+    Add the counters of one result into another.
+
+    Args:
+        into: Dictionary of difficulty to counters, updated in place
+        other: Dictionary of difficulty to counters to add
+    """
+    for difficulty, stats in other.items():
+        target = into.setdefault(difficulty, new_stats())
+        target["games"] += stats["games"]
+        target["wins"] += stats["wins"]
+        target["guesses"] += stats["guesses"]
+        for wrong, count in enumerate(stats["wrong"]):
+            target["wrong"][wrong] += count
+        for total, count in stats["total"].items():
+            target["total"][total] = target["total"].get(total, 0) + count
+
+
+def play_game(engine, strategy, word):
+    """
+    Play one game to the end.
+
+    Args:
+        engine: The HangmanEngine to play on
+        strategy: The Strategy that picks letters
+        word: The word to guess
+
+    Returns:
+        tuple: (won, number of guesses, number of wrong guesses)
+    """
+    engine.reset(word)
+    strategy.start(engine)
+    guesses = 0
+    while not engine.result:
+        index = strategy.choose(engine)
+        if index is None or engine.guess_index(index) is None:
+            break
+        guesses += 1
+    return engine.result == WON, guesses, engine.wrong_guesses
+
+
+def run_batch(strategy_name, games, difficulty=None, category=None, seed=None):
+    """
+    Play a batch of games in the current process.
+
+    Args:
+        strategy_name: Name of the guessing strategy
+        games: Number of games to play
+        difficulty: 'easy', 'medium', 'hard', or None to cycle through all three
+        category: Optional category to draw words from instead
+        seed: Optional seed for word selection and the strategy
+
+    Returns:
+        dict: Difficulty (or category) name to result counters
+    """
+    random.seed(seed)
+    if category:
+        words = get_category_words(category)
+    else:
+        words = get_all_words()
+    strategy = get_strategy(strategy_name, words, random.Random(seed))
+    engine = HangmanEngine()
+
+    results = {}
+    for i in range(games):
+        if category:
+            label = category
+            word = get_random_word_from_category(category)
+        else:
+            label = difficulty or DIFFICULTIES[i % len(DIFFICULTIES)]
+            word = get_random_word(label)
+
+        won, guesses, wrong = play_game(engine, strategy, word)
+
+        stats = results.get(label)
+        if stats is None:
+            stats = results[label] = new_stats()
+        stats["games"] += 1
+        stats["wins"] += won
+        stats["guesses"] += guesses
+        stats["wrong"][wrong] += 1
+        stats["total"][guesses] = stats["total"].get(guesses, 0) + 1
+    return results
+
+
+def simulate(strategy_name, games, difficulty=None, category=None,
+             workers=None, batch_size=1000, seed=None):
+    """
+    Play many games across a process pool.
+
+    Args:
+        strategy_name: Name of the guessing strategy
+        games: Total number of games to play
+        difficulty: 'easy', 'medium', 'hard', or None for all three
+        category: Optional category to draw words from instead
+        workers: Number of worker processes; defaults to the CPU count
+        batch_size: Number of games per task sent to a worker
+        seed: Optional base seed; batch ``i`` uses ``seed + i``
+
+    Returns:
+        tuple: (dictionary of label to merged counters, elapsed seconds)
+    """
+    workers = workers or os.cpu_count() or 1
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+
+    batches = []
+    remaining = games
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        batches.append(size)
+        remaining -= size
+
+    results = {}
+    start = time.perf_counter()
+    if workers == 1:
+        for i, size in enumerate(batches):
+            merge_stats(results, run_batch(strategy_name, size, difficulty, category, seed + i))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_batch, strategy_name, size, difficulty, category, seed + i)
+                       for i, size in enumerate(batches)]
+            for future in futures:
+                merge_stats(results, future.result())
+    return results, time.perf_counter() - start
+
+
+def format_report(results, elapsed):
+    """
+    Format simulation results as a plain-text report.
+
+    Args:
+        results: Dictionary of label to merged counters
+        elapsed: Wall time of the simulation in seconds
+
+    Returns:
+        str: The report
+    """
+    total_games = sum(stats["games"] for stats in results.values())
+    lines = [f"{total_games} games in {elapsed:.2f} s ({total_games / max(elapsed, 1e-9):,.0f} games/s)", ""]
+
+    header = f"{'':<12} {'games':>9} {'win rate':>9} {'guesses':>8}  " + " ".join(
+        f"{wrong}w".rjust(7) for wrong in range(MAX_NUM_OF_GUESSES + 1))
+    lines.append(header)
+    for label in sorted(results):
+        stats = results[label]
+        games = stats["games"]
+        wrong = " ".join(f"{count / games:>7.1%}" for count in stats["wrong"])
+        lines.append(f"{label:<12} {games:>9} {stats['wins'] / games:>9.1%} "
+                     f"{stats['guesses'] / games:>8.2f}  {wrong}")
+
+    lines.append("")
+    lines.append("Guesses per game:")
+    for label in sorted(results):
+        stats = results[label]
+        histogram = ", ".join(f"{total}: {count}" for total, count in sorted(stats["total"].items()))
+        lines.append(f"  {label}: {histogram}")
+    return "\n".join(lines)
@@ -0,0 +1,320 @@
+"""
+This module stores game results and statistics in SQLite.
+
+Results are queued by the game and written by a background thread in
+batches, one transaction per batch, so finishing a round never waits
+for the disk. Queries run on the same thread, behind any queued writes,
+and hand their answer back through a ``concurrent.futures.Future``.
+
+Every batch also updates a small ``totals`` table, in the same
+transaction, with running counts, wins and streaks overall, per
+difficulty and per category. Win rates and streaks are read from there
+instead of scanning every game, so they stay instant with millions of
+games stored.
+"""
+from concurrent.futures import Future
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+# Next to the game, so statistics don't depend on the working directory
+STATS_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'hangman_stats.db')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,
+    word TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    category TEXT NOT NULL,
+    won INTEGER NOT NULL,
+    wrong_guesses INTEGER NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_by_difficulty ON games (difficulty, won, duration);
+CREATE INDEX IF NOT EXISTS games_by_category ON games (category, won, duration);
+
+CREATE TABLE IF NOT EXISTS totals (
+    grouping TEXT NOT NULL,
+    name TEXT NOT NULL,
+    games INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    wrong_guesses INTEGER NOT NULL DEFAULT 0,
+    duration REAL NOT NULL DEFAULT 0,
+    streak INTEGER NOT NULL DEFAULT 0,
+    best_streak INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (grouping, name)
+) WITHOUT ROWID;
+"""
+
+INSERT_GAME = """
+INSERT INTO games (played_at, word, difficulty, category, won, wrong_guesses, duration)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+SAVE_TOTALS = """
+INSERT OR REPLACE INTO totals (grouping, name, games, wins, wrong_guesses, duration, streak, best_streak)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class StatsStore:
+    """
+    A SQLite store of game results, written from a background thread.
+    """
+
+    def __init__(self, path=STATS_FILE, batch_size=256, flush_interval=0.5):
+        """
+        Open the database and start the writer thread.
+
+        Args:
+            path: Path of the SQLite database; ':memory:' for a throwaway store
+            batch_size: Most results written in one transaction
+            flush_interval: Longest time a result waits before it is written, in seconds
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue()
+        self.ready = Future()
+        self.writer = threading.Thread(target=self.write_loop, name="stats writer", daemon=True)
+        self.writer.start()
+
+    def record(self, word, difficulty, category, won, wrong_guesses, duration):
+        """
+        Queue the result of a game; returns immediately.
+
+        Args:
+            word: The word of the game
+            difficulty: 'easy', 'medium', 'hard' or 'evil'
+            category: Category name or None
+            won: True if the game was won
+            wrong_guesses: Number of wrong guesses
+            duration: Length of the game in seconds
+        """
+        if self.failed():
+            return
+        self.queue.put((time.time(), word, difficulty, category or '', int(bool(won)),
+                        wrong_guesses, duration))
+
+    def query(self, func):
+        """
+        Run a read on the writer thread, after every result queued before it.
+
+        Args:
+            func: Function taking a sqlite3.Connection and returning the answer
+
+        Returns:
+            Future: Resolves to the answer of ``func``
+        """
+        future = Future()
+        if self.failed():
+            future.set_exception(self.ready.exception())
+        else:
+            self.queue.put((func, future))
+        return future
+
+    def failed(self):
+        """
+        Check whether the database could not be opened.
+
+        Returns:
+            bool: True if the writer thread gave up
+        """
+        return self.ready.done() and self.ready.exception() is not None
+
+    def get_summary(self):
+        """
+        Get games, wins, average misses and streaks, overall and per group.
+
+        Returns:
+            Future: Resolves to a list of dicts with keys grouping, name,
+                    games, wins, win_rate, avg_wrong, avg_duration,
+                    streak and best_streak; overall first
+        """
+        return self.query(read_summary)
+
+    def get_leaderboard(self, difficulty, limit=5):
+        """
+        Get the fastest wins at a difficulty.
+
+        Args:
+            difficulty: 'easy', 'medium', 'hard' or 'evil'
+            limit: Number of games to return
+
+        Returns:
+            Future: Resolves to a list of (word, wrong guesses, duration) tuples
+        """
+        return self.query(lambda db: db.execute(
+            "SELECT word, wrong_guesses, duration FROM games "
+            "WHERE difficulty = ? AND won = 1 ORDER BY duration LIMIT ?",
+            (difficulty, limit)).fetchall())
+
+    def flush(self, timeout=None):
+        """
+        Wait until every queued result is written.
+
+        Args:
+            timeout: Longest time to wait, in seconds
+        """
+        self.query(lambda db: None).result(timeout)
+
+    def close(self):
+        """
+        Write queued results and stop the writer thread.
+        """
+        if self.writer.is_alive():
+            self.queue.put(None)
+            self.writer.join()
+
+    def write_loop(self):
+        """
+        Write queued results in batches and answer queries, until closed.
+
+        Runs on the writer thread, which owns the database connection.
+        """
+        try:
+            db = sqlite3.connect(self.path)
+            db.execute("PRAGMA journal_mode = WAL")
+            db.execute("PRAGMA synchronous = NORMAL")
+            db.executescript(SCHEMA)
+        except sqlite3.Error as error:
+            print(f"Warning: Could not open stats database '{self.path}': {error}")
+            self.ready.set_exception(error)
+            self.fail_pending(error)
+            return
+        self.ready.set_result(True)
+
+        closing = False
+        while not closing:
+            item = self.queue.get()
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is None:
+                    closing = True
+                elif len(item) == 2:
+                    # Queries see every result queued before them
+                    self.write_batch(db, batch)
+                    batch = []
+                    self.answer(db, *item)
+                else:
+                    batch.append(item)
+
+                if closing or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self.queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            self.write_batch(db, batch)
+        db.close()
+
+    def write_batch(self, db, batch):
+        """
+        Insert a batch of results and update the totals, in one transaction.
+
+        Args:
+            db: The writer's sqlite3.Connection
+            batch: List of result tuples
+        """
+        if not batch:
+            return
+        try:
+            with db:
+                db.executemany(INSERT_GAME, batch)
+                update_totals(db, batch)
+        except sqlite3.Error as error:
+            print(f"Warning: Could not save {len(batch)} game results: {error}")
+
+    def answer(self, db, func, future):
+        """
+        Run a query and resolve its future.
+
+        Args:
+            db: The writer's sqlite3.Connection
+            func: The query function
+            future: The Future to resolve
+        """
+        try:
+            future.set_result(func(db))
+        except Exception as error:
+            future.set_exception(error)
+
+    def fail_pending(self, error):
+        """
+        Fail every queued query after the database could not be opened.
+
+        Args:
+            error: The exception to fail them with
+        """
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not None and len(item) == 2:
+                item[1].set_exception(error)
+
+
+def update_totals(db, batch):
+    """
+    Add a batch of results to the running totals.
+
+    The totals are updated here rather than by a trigger, since a few
+    rows per batch are much cheaper to write than a few rows per game.
+
+    Args:
+        db: A sqlite3.Connection inside a transaction
+        batch: List of result tuples, in the order the games were played
+    """
+    totals = {}
+    for _, _, difficulty, category, won, wrong_guesses, duration in batch:
+        for key in (('all', ''), ('difficulty', difficulty), ('category', category)):
+            total = totals.get(key)
+            if total is None:
+                row = db.execute(
+                    "SELECT games, wins, wrong_guesses, duration, streak, best_streak "
+                    "FROM totals WHERE grouping = ? AND name = ?", key).fetchone()
+                total = totals[key] = list(row or (0, 0, 0, 0.0, 0, 0))
+            total[0] += 1
+            total[1] += won
+            total[2] += wrong_guesses
+            total[3] += duration
+            total[4] = total[4] + 1 if won else 0
+            total[5] = max(total[5], total[4])
+    db.executemany(SAVE_TOTALS, [key + tuple(total) for key, total in totals.items()])
+
+
+def read_summary(db):
+    """
+    Read the running totals.
+
+    Args:
+        db: A sqlite3.Connection
+
+    Returns:
+        list: One dict per group, as described in ``StatsStore.get_summary()``
+    """
+    rows = db.execute(
+        "SELECT grouping, name, games, wins, wrong_guesses, duration, streak, best_streak "
+        "FROM totals WHERE name != '' OR grouping = 'all' "
+        "ORDER BY grouping != 'all', grouping != 'difficulty', "
+        "CASE name WHEN 'easy' THEN 0 WHEN 'medium' THEN 1 WHEN 'hard' THEN 2 END, name"
+    ).fetchall()
+    summary = []
+    for grouping, name, games, wins, wrong, duration, streak, best_streak in rows:
+        summary.append({
+            "grouping": grouping,
+            "name": name,
+            "games": games,
+            "wins": wins,
+            "win_rate": wins / games if games else 0.0,
+            "avg_wrong": wrong / games if games else 0.0,
+            "avg_duration": duration / games if games else 0.0,
+            "streak": streak,
+            "best_streak": best_streak,
+        })
+    return summary
@@ -0,0 +1,248 @@
+"""
+Module with letter-guessing strategies for simulated Hangman players.
+
+A strategy only looks at what a player could see: the masked word and
+which letters were already guessed. It never reads the hidden word.
+"""
+import random
+from src.engine import word_mask
+
+# Letters of English text, most common first
+FREQUENCY_ORDER = 'ETAOINSHRDLCUMWFGYPBVKJXQZ'
+
+
+class Strategy:
+    """
+    Base class for a guessing strategy.
+    """
+
+    name = None
+
+    def __init__(self, words=None, rng=None):
+        """
+        Initialize the strategy.
+
+        Args:
+            words: Optional list of words the hidden word may come from
+            rng: Optional random.Random instance to draw from
+        """
+        self.rng = rng or random.Random()
+
+    def start(self, engine):
+        """
+        Called once at the start of each game.
+
+        Args:
+            engine: The HangmanEngine of the new game
+        """
+
+    def choose(self, engine):
+        """
+        Pick the next letter to guess.
+
+        Args:
+            engine: The HangmanEngine of the game in progress
+
+        Returns:
+            int: Index of the letter to guess, 0 for 'A' up to 25 for 'Z'
+        """
+        raise NotImplementedError
+
+
+class RandomStrategy(Strategy):
+    """
+    Guesses unguessed letters in a random order.
+    """
+
+    name = 'random'
+
+    def choose(self, engine):
+        """
+        Pick a random unguessed letter.
+
+        Args:
+            engine: The HangmanEngine of the game in progress
+
+        Returns:
+            int: Index of the letter to guess, 0 for 'A' up to 25 for 'Z'
+        """
+        guessed = engine.guessed_mask
+        choices = [i for i in range(26) if not guessed >> i & 1]
+        return self.rng.choice(choices)
+
+
+class FrequencyStrategy(Strategy):
+    """
+    Guesses letters from most to least common in English.
+    """
+
+    name = 'frequency'
+    ORDER = [ord(letter) - 65 for letter in FREQUENCY_ORDER]
+
+    def choose(self, engine):
+        """
+        Pick the most common letter not guessed yet.
+
+        Args:
+            engine: The HangmanEngine of the game in progress
+
+        Returns:
+            int: Index of the letter to guess, or None if every letter was guessed
+        """
+        guessed = engine.guessed_mask
+        for index in self.ORDER:
+            if not guessed >> index & 1:
+                return index
+        return None
+
+
+class CandidateStrategy(Strategy):
+    """
+    Keeps the words that still match the masked word and guesses the
+    letter that appears in the most of them, breaking ties at random.
+
+    Falls back to frequency order once no known word matches.
+    """
+
+    name = 'candidate'
+
+    def __init__(self, words=None, rng=None):
+        """
+        Initialize the strategy, grouping the known words by length.
+
+        Args:
+            words: Optional list of words the hidden word may come from
+            rng: Optional random.Random instance to draw from
+        """
+        super().__init__(words, rng)
+        self.by_length = {}
+        for word in set(word.upper() for word in words or []):
+            self.by_length.setdefault(len(word), []).append((word, word_mask(word)))
+        self.fallback = FrequencyStrategy(rng=self.rng)
+
+    def start(self, engine):
+        """
+        Start from every known word as long as the masked word.
+
+        Args:
+            engine: The HangmanEngine of the new game
+        """
+        self.candidates = self.by_length.get(len(engine.word), [])
+        self.seen_mask = 0
+
+    def choose(self, engine):
+        """
+        Narrow the candidates to what was revealed and pick the letter in most of them.
+
+        Args:
+            engine: The HangmanEngine of the game in progress
+
+        Returns:
+            int: Index of the letter to guess, 0 for 'A' up to 25 for 'Z'
+        """
+        guessed = engine.guessed_mask
+        if guessed != self.seen_mask:
+            self.candidates = filter_candidates(self.candidates, engine.get_pattern(),
+                                                guessed, engine.wrong_mask)
+            self.seen_mask = guessed
+
+        best = best_letter(self.candidates, guessed, self.rng)
+        if best is None:
+            return self.fallback.choose(engine)
+        return best
+
+
+def matches_pattern(word, pattern, guessed_mask):
+    """
+    Check whether a word fits a masked word.
+
+    Revealed letters must be in the same places, and no unrevealed
+    position may hold a letter that was already guessed.
+
+    Args:
+        word: An uppercase candidate word
+        pattern: The masked word, with '_' for unrevealed letters
+        guessed_mask: Mask of the letters guessed so far
+
+    Returns:
+        bool: True if the word is consistent with what was revealed
+    """
+    for letter, shown in zip(word, pattern):
+        if shown == '_':
+            if guessed_mask >> (ord(letter) - 65) & 1:
+                return False
+        elif letter != shown:
+            return False
+    return True
+
+
+def filter_candidates(candidates, pattern, guessed_mask, wrong_mask):
+    """
+    Keep the candidates consistent with the masked word and wrong guesses.
+
+    Args:
+        candidates: List of (word, letter mask) pairs
+        pattern: The masked word, with '_' for unrevealed letters
+        guessed_mask: Mask of the letters guessed so far
+        wrong_mask: Mask of the guessed letters not in the word
+
+    Returns:
+        list: The remaining (word, letter mask) pairs
+    """
+    return [(word, mask) for word, mask in candidates
+            if not mask & wrong_mask and matches_pattern(word, pattern, guessed_mask)]
+
+
+def best_letter(candidates, guessed_mask, rng=None):
+    """
+    Find the unguessed letter contained in the most candidates.
+
+    Args:
+        candidates: List of (word, letter mask) pairs
+        guessed_mask: Mask of the letters guessed so far
+        rng: Optional random.Random used to break ties; without it the
+             first letter in alphabetical order wins
+
+    Returns:
+        int: Index of the best letter, or None if no candidate has an unguessed letter
+    """
+    counts = [0] * 26
+    for _, mask in candidates:
+        mask &= ~guessed_mask
+        while mask:
+            low = mask & -mask
+            counts[low.bit_length() - 1] += 1
+            mask ^= low
+
+    top = max(counts)
+    if not top:
+        return None
+    if rng is None:
+        return counts.index(top)
+    return rng.choice([index for index in range(26) if counts[index] == top])
+
+
+STRATEGIES = {
+    strategy.name: strategy
+    for strategy in (RandomStrategy, FrequencyStrategy, CandidateStrategy)
+}
+
+
+def get_strategy(name, words=None, rng=None):
+    """
+    Create a strategy by name.
+
+    Args:
+        name: 'random', 'frequency' or 'candidate'
+        words: Optional list of words the hidden word may come from
+        rng: Optional random.Random instance to draw from
+
+    Returns:
+        Strategy: The new strategy
+
+    Raises:
+        ValueError: If there is no strategy with that name
+    """
+    if name not in STRATEGIES:
+        raise ValueError(f"Unknown strategy '{name}', expected one of: {', '.join(STRATEGIES)}")
+    return STRATEGIES[name](words, rng)
@@ -0,0 +1,300 @@
+"""
+Module for building and caching a compiled index of a word list.
+
+The index groups words by length and by difficulty and stores a 26-bit
+letter mask for every word, so picking a word for a round is a single
+``random.choice`` on a prebuilt bucket. Indexes are saved next to the
+source word list and reused as long as the source's mtime and size are
+unchanged.
+"""
+import os
+import pickle
+import random
+
+INDEX_VERSION = 2
+INDEX_SUFFIX = '.idx'
+DIFFICULTIES = ('easy', 'medium', 'hard')
+UNCOMMON_LETTERS = 'jqxz'
+MIN_WORD_LENGTH = 3
+
+# Indexes already loaded in this process, keyed by source path
+_loaded = {}
+
+
+def is_valid_word(word):
+    """
+    Check whether a stripped, lowercased line of a word list is a playable word.
+
+    This is the filter shared by every way of reading word lists.
+
+    Args:
+        word: The candidate word
+
+    Returns:
+        bool: True if the word is alphabetic and at least ``MIN_WORD_LENGTH`` long
+    """
+    return len(word) >= MIN_WORD_LENGTH and word.isalpha()
+
+
+def letter_mask(word):
+    """
+    Compute the 26-bit letter-set mask of a lowercase word.
+
+    Args:
+        word: A lowercase word made of the letters a-z
+
+    Returns:
+        int: Bit ``i`` is set if the word contains ``chr(ord('a') + i)``
+    """
+    mask = 0
+    for letter in word:
+        mask |= 1 << (ord(letter) - 97)
+    return mask
+
+
+UNCOMMON_MASK = letter_mask(UNCOMMON_LETTERS)
+
+
+def difficulties_for(word, mask):
+    """
+    List the difficulty levels a word belongs to.
+
+    Easy words have 3-5 letters, medium words have 6-7 letters and no
+    uncommon letters, and hard words have 8+ letters or contain one of
+    j, q, x, z. A short word with an uncommon letter is both easy and hard.
+
+    Args:
+        word: The word to classify
+        mask: The word's letter mask
+
+    Returns:
+        list: Difficulty names the word belongs to
+    """
+    length = len(word)
+    uncommon = bool(mask & UNCOMMON_MASK)
+    levels = []
+    if 3 <= length <= 5:
+        levels.append('easy')
+    if 6 <= length <= 7 and not uncommon:
+        levels.append('medium')
+    if length >= 8 or uncommon:
+        levels.append('hard')
+    return levels
+
+
+class WordIndex:
+    """
+    A precompiled, read-only index over a list of words.
+    """
+
+    def __init__(self, words, masks, by_length, by_difficulty):
+        """
+        Initialize the index from already computed buckets.
+
+        Use ``WordIndex.build`` to compile an index from a plain word list.
+
+        Args:
+            words: All words, in source order
+            masks: Letter mask of each word, parallel to ``words``
+            by_length: Dictionary of word length to list of words
+            by_difficulty: Dictionary of difficulty name to list of words
+        """
+        self.words = words
+        self.masks = masks
+        self.by_length = by_length
+        self.by_difficulty = by_difficulty
+
+    @classmethod
+    def build(cls, words, classify=difficulties_for):
+        """
+        Compile an index from a list of words.
+
+        Args:
+            words: List of lowercase alphabetic words
+            classify: Function of (word, mask) returning the word's difficulty levels
+
+        Returns:
+            WordIndex: The compiled index
+        """
+        masks = []
+        by_length = {}
+        by_difficulty = {level: [] for level in DIFFICULTIES}
+
+        for word in words:
+            mask = letter_mask(word)
+            masks.append(mask)
+            by_length.setdefault(len(word), []).append(word)
+            for level in classify(word, mask):
+                by_difficulty[level].append(word)
+
+        return cls(list(words), masks, by_length, by_difficulty)
+
+    def get_words(self, difficulty=None):
+        """
+        Get the bucket of words for a difficulty level.
+
+        Args:
+            difficulty: 'easy', 'medium', 'hard', or None for every word
+
+        Returns:
+            list: The shared bucket list; callers must not modify it
+        """
+        if not difficulty:
+            return self.words
+        return self.by_difficulty.get(difficulty, self.by_difficulty['medium'])
+
+    def random_word(self, difficulty=None):
+        """
+        Pick a random word in constant time.
+
+        Args:
+            difficulty: Optional difficulty level ('easy', 'medium', 'hard')
+
+        Returns:
+            str: A random word, or None if the bucket is empty
+        """
+        bucket = self.get_words(difficulty)
+        if not bucket:
+            return None
+        return random.choice(bucket)
+
+    def to_state(self, stamp):
+        """
+        Serialize the index together with the source file stamp.
+
+        Args:
+            stamp: The (mtime_ns, size, tag) stamp of the source file
+
+        Returns:
+            tuple: A picklable snapshot of the index
+        """
+        return (INDEX_VERSION, stamp, self.words, self.masks,
+                self.by_length, self.by_difficulty)
+
+
+def get_file_stamp(path):
+    """
+    Get the modification stamp used to validate a saved index.
+
+    Args:
+        path: Path to the source word list
+
+    Returns:
+        tuple: (mtime_ns, size) of the file
+    """
+    info = os.stat(path)
+    return (info.st_mtime_ns, info.st_size)
+
+
+def get_index_paths(source_path):
+    """
+    List the places an index for a word list may be stored.
+
+    The index is kept next to the word list when that directory is
+    writable, and in the user's cache directory otherwise (for example
+    for ``/usr/share/dict/words``).
+
+    Args:
+        source_path: Path to the source word list
+
+    Returns:
+        list: Candidate index file paths, in order of preference
+    """
+    source_path = os.path.abspath(source_path)
+    cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'hangman')
+    cache_name = source_path.strip(os.sep).replace(os.sep, '_') + INDEX_SUFFIX
+    return [source_path + INDEX_SUFFIX, os.path.join(cache_dir, cache_name)]
+
+
+def read_index(index_path, stamp):
+    """
+    Read a saved index in one bulk read if it matches the source stamp.
+
+    Args:
+        index_path: Path to the saved index
+        stamp: The current (mtime_ns, size, tag) stamp of the source file
+
+    Returns:
+        WordIndex: The saved index, or None if missing, stale or corrupt
+    """
+    try:
+        with open(index_path, 'rb') as file:
+            state = pickle.loads(file.read())
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+
+    if not isinstance(state, tuple) or len(state) != 6:
+        return None
+    version, saved_stamp, words, masks, by_length, by_difficulty = state
+    if version != INDEX_VERSION or tuple(saved_stamp) != stamp:
+        return None
+    return WordIndex(words, masks, by_length, by_difficulty)
+
+
+def write_index(index, stamp, source_path):
+    """
+    Save an index next to its word list, or in the cache directory.
+
+    The file is written to a temporary name and then renamed, so a
+    concurrent reader never sees a partial index.
+
+    Args:
+        index: The WordIndex to save
+        stamp: The (mtime_ns, size, tag) stamp of the source file
+        source_path: Path to the source word list
+
+    Returns:
+        str: The path the index was saved to, or None if no location was writable
+    """
+    data = pickle.dumps(index.to_state(stamp), protocol=pickle.HIGHEST_PROTOCOL)
+    for index_path in get_index_paths(source_path):
+        tmp_path = f"{index_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            with open(tmp_path, 'wb') as file:
+                file.write(data)
+            os.replace(tmp_path, index_path)
+            return index_path
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    return None
+
+
+def load_index(source_path, loader, classify=difficulties_for, tag=None):
+    """
+    Get the compiled index for a word list, building it only when needed.
+
+    The index is looked up in this order: the in-process cache, a saved
+    index file whose stamp matches the source, and finally a fresh build
+    from ``loader(source_path)`` that is then saved for the next start.
+
+    Args:
+        source_path: Path to the source word list
+        loader: Function that reads the word list and returns its words
+        classify: Function of (word, mask) returning the word's difficulty levels
+        tag: Identifies ``classify``; an index built with another tag is rebuilt
+
+    Returns:
+        WordIndex: The index for the word list
+    """
+    stamp = get_file_stamp(source_path) + (tag,)
+
+    cached = _loaded.get(source_path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    index = None
+    for index_path in get_index_paths(source_path):
+        index = read_index(index_path, stamp)
+        if index:
+            break
+
+    if index is None:
+        index = WordIndex.build(loader(source_path), classify)
+        write_index(index, stamp, source_path)
+
+    _loaded[source_path] = (stamp, index)
+    return index
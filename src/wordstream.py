@@ -0,0 +1,135 @@
+"""
+Module for sampling random words straight from a memory-mapped word list.
+
+This is used for very large dictionaries, where building a list of every
+word just to return one of them would cost far more memory than the game
+itself. The file is never read into Python objects as a whole, so peak
+memory stays flat regardless of the dictionary size.
+"""
+import mmap
+import random
+from src.wordindex import difficulties_for, is_valid_word, letter_mask
+
+# Shortest line that can pass the filter: three letters and a newline
+MIN_LINE_BYTES = 4
+
+# Offset probes to try before falling back to a full reservoir scan
+MAX_OFFSET_ATTEMPTS = 10000
+
+
+def accept_line(line, difficulty=None):
+    """
+    Apply the word list filter to one raw line of a word list.
+
+    Uses the same rules as ``load_words_from_file``: the stripped,
+    lowercased line must be alphabetic and at least 3 letters long, and
+    it must belong to the requested difficulty.
+
+    Args:
+        line: The raw line as bytes
+        difficulty: Optional difficulty level ('easy', 'medium', 'hard')
+
+    Returns:
+        str: The normalized word, or None if the line is rejected
+    """
+    word = line.decode('utf-8', errors='replace').strip().lower()
+    if not is_valid_word(word):
+        return None
+    if difficulty and difficulty not in difficulties_for(word, letter_mask(word)):
+        return None
+    return word
+
+
+def reservoir_sample(data, difficulty=None, rng=random):
+    """
+    Pick a uniformly random matching word with one pass over the data.
+
+    Args:
+        data: A bytes-like object or mmap holding the word list
+        difficulty: Optional difficulty level ('easy', 'medium', 'hard')
+        rng: Random number generator to use
+
+    Returns:
+        str: A random matching word, or None if no line matches
+    """
+    chosen = None
+    seen = 0
+    start = 0
+    size = len(data)
+    while start < size:
+        end = data.find(b'\n', start)
+        if end == -1:
+            end = size
+        word = accept_line(data[start:end], difficulty)
+        if word:
+            seen += 1
+            if rng.randrange(seen) == 0:
+                chosen = word
+        start = end + 1
+    return chosen
+
+
+def offset_sample(data, difficulty=None, rng=random, attempts=MAX_OFFSET_ATTEMPTS):
+    """
+    Pick a uniformly random matching word by probing random byte offsets.
+
+    A random offset lands on a line with probability proportional to the
+    line's length, so each probed line is accepted with probability
+    ``MIN_LINE_BYTES / length`` to make every matching line equally likely.
+
+    Args:
+        data: A bytes-like object or mmap holding the word list
+        difficulty: Optional difficulty level ('easy', 'medium', 'hard')
+        rng: Random number generator to use
+        attempts: Number of offsets to probe before giving up
+
+    Returns:
+        str: A random matching word, or None if no probe succeeded
+    """
+    size = len(data)
+    if size == 0:
+        return None
+
+    for _ in range(attempts):
+        offset = rng.randrange(size)
+        start = data.rfind(b'\n', 0, offset) + 1
+        end = data.find(b'\n', offset)
+        if end == -1:
+            end = size
+        length = end - start + 1
+        if rng.random() * length >= MIN_LINE_BYTES:
+            continue
+        word = accept_line(data[start:end], difficulty)
+        if word:
+            return word
+    return None
+
+
+def sample_word_from_file(filename, difficulty=None, method='offset', rng=random):
+    """
+    Get a random word from a word list file without loading the whole file.
+
+    Args:
+        filename: Path to the word list file
+        difficulty: Optional difficulty level ('easy', 'medium', 'hard')
+        method: 'offset' for constant-time probing, with a reservoir scan
+                as fallback, or 'reservoir' for a single exact pass
+        rng: Random number generator to use
+
+    Returns:
+        str: A random matching word, or None if the file has no matching word
+    """
+    with open(filename, 'rb') as file:
+        try:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return None
+
+    with data:
+        word = None
+        if method == 'offset':
+            word = offset_sample(data, difficulty, rng)
+        if word is None:
+            word = reservoir_sample(data, difficulty, rng)
+        return word
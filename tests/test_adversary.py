@@ -0,0 +1,138 @@
+"""
+Tests for the evil mode engine, with NumPy and with the pure-Python fallback.
+"""
+import pytest
+import src.adversary as adversary
+from src.adversary import AdversaryEngine
+from src.engine import LOST, PLAYING, WON
+
+WORDS = ["CAT", "COT", "CUT", "BAT", "HAT", "HIT", "DOG", "DIG", "TOT", "TAT",
+         "EEL", "BEE", "SEE", "ZOO", "MOO", "APE", "AXE", "ICE", "TWO", "OWL",
+         "BIRD", "FISH"]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def mode(request, monkeypatch):
+    if request.param == "numpy":
+        if adversary.np is None:
+            pytest.skip("NumPy is not installed")
+    else:
+        monkeypatch.setattr(adversary, "np", None)
+    return request.param
+
+
+def consistent(engine, word):
+    """
+    Check that a word fits everything the player has seen.
+    """
+    if len(word) != len(engine.word):
+        return False
+    for letter in engine.guessed_letters:
+        for actual, shown in zip(word, engine.word):
+            if (actual == letter) != (shown == letter):
+                return False
+    return True
+
+
+def survivors(candidates):
+    """
+    List the words still in a candidate set.
+    """
+    if candidates.rows is None:
+        return list(candidates.words)
+    return [candidates.words[row] for row in candidates.rows.tolist()]
+
+
+def test_plays_like_hangman_without_candidates(mode):
+    engine = AdversaryEngine("CAT")
+    assert engine.guess("C") is True
+    assert engine.guess("Z") is False
+    assert engine.word == "CAT"
+
+
+def test_dodges_guesses(mode):
+    engine = AdversaryEngine("CAT")
+    engine.set_candidates(WORDS)
+    # Most three-letter words have no A, so the word moves away from it
+    assert engine.guess("A") is False
+    assert "A" not in engine.word
+    assert engine.check_game_over() == PLAYING
+
+
+def test_candidates_stay_consistent(mode):
+    engine = AdversaryEngine("CAT")
+    engine.set_candidates(WORDS)
+    for letter in "AOTEIC":
+        engine.guess(letter)
+        words = survivors(engine.candidates)
+        assert engine.word in words
+        assert all(consistent(engine, word) for word in words)
+        assert engine.wrong_guesses == bin(engine.wrong_mask).count("1")
+        if engine.result:
+            break
+
+
+def test_set_candidates_keeps_revealed_letters(mode):
+    engine = AdversaryEngine("CAT")
+    engine.guess("A")
+    engine.guess("O")
+    engine.set_candidates(WORDS)
+    assert len(engine.candidates) == 4  # CAT, BAT, HAT, TAT
+    assert engine.guess("T") is True
+    assert engine.get_pattern() == "_AT"
+
+
+def test_win_and_lose(mode):
+    engine = AdversaryEngine("CAT", max_wrong_guesses=len("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+    engine.set_candidates(WORDS)
+    for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
+        engine.guess(letter)
+    assert engine.check_game_over() == WON
+    assert engine.word in WORDS
+
+    engine = AdversaryEngine("CAT", max_wrong_guesses=2)
+    engine.set_candidates(WORDS)
+    for letter in "QJXZ":
+        engine.guess(letter)
+    assert engine.check_game_over() == LOST
+
+
+def test_modes_pick_the_same_families(monkeypatch):
+    if adversary.np is None:
+        pytest.skip("NumPy is not installed")
+    played = []
+    for module in (adversary.np, None):
+        monkeypatch.setattr(adversary, "np", module)
+        engine = AdversaryEngine("BIRD")
+        engine.set_candidates(WORDS + ["BARD", "BORE", "CORE", "CARD", "WORD"])
+        patterns = []
+        for letter in "ROADEB":
+            engine.guess(letter)
+            patterns.append(engine.get_pattern())
+        played.append(patterns)
+    assert played[0] == played[1]
+
+
+def test_resumed_round_keeps_dodging(mode, tmp_path):
+    from src.savegame import EVIL, SaveLog
+
+    engine = AdversaryEngine("CAT")
+    engine.set_candidates(WORDS)
+    engine.guess("A")
+    engine.guess("O")
+    log = SaveLog(str(tmp_path / "evil.sav"))
+    log.save(1, engine, evil=True)
+    log.close()
+
+    log = SaveLog(str(tmp_path / "evil.sav"))
+    resumed = AdversaryEngine()
+    saved = log.resume(1, resumed)
+    log.close()
+    assert saved["flags"] & EVIL
+    assert resumed.get_pattern() == engine.get_pattern()
+    resumed.set_candidates(WORDS)
+    assert all(consistent(resumed, word) for word in survivors(resumed.candidates))
+    resumed.guess("T")
+    words = survivors(resumed.candidates)
+    assert resumed.word in words
+    assert all(consistent(resumed, word) for word in words)
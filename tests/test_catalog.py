@@ -0,0 +1,112 @@
+"""
+Tests for the category catalog.
+"""
+import os
+import pytest
+import src.catalog as catalog_module
+from src.catalog import CategoryCatalog
+
+
+def write_category(directory, name, words, header=None, mtime_ns=None):
+    path = directory / f"{name}.txt"
+    text = f'"""\n{header}\n"""\n' if header else ""
+    path.write_text(text + "\n".join(words) + "\n")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    paths = []
+    read_category = catalog_module.read_category
+
+    def counting(path):
+        paths.append(os.path.basename(path))
+        return read_category(path)
+
+    monkeypatch.setattr(catalog_module, "read_category", counting)
+    return paths
+
+
+@pytest.fixture
+def directory(tmp_path):
+    write_category(tmp_path, "animals", ["cat", "Dog", "o'clock", "ab"],
+                   header="Category: Wild Animals\nFurry and\nfriendly.")
+    write_category(tmp_path, "ice_cream", ["vanilla", "chocolate"])
+    write_category(tmp_path, "wordlist", ["main", "list"])
+    return tmp_path
+
+
+def test_manifest(directory):
+    catalog = CategoryCatalog(str(directory))
+    assert catalog.names() == ["animals", "ice_cream"]
+    animals, ice_cream = catalog.get_entries()
+    assert (animals.title, animals.description, animals.word_count) == \
+        ("Wild Animals", "Furry and friendly.", 2)
+    assert ice_cream.title == "Ice Cream"
+    assert "animals" in catalog and "wordlist" not in catalog
+    assert catalog.get("animals") == ["cat", "dog"]
+    assert catalog.get("missing") is None
+
+
+def test_each_file_is_read_once(directory, reads):
+    catalog = CategoryCatalog(str(directory))
+    catalog.names()
+    first = catalog.get("animals")
+    catalog.get("ice_cream")
+    assert sorted(reads) == ["animals.txt", "ice_cream.txt"]
+    assert catalog.get("animals") is first
+    assert not catalog.refresh()
+    assert len(reads) == 2
+
+
+def test_hot_reload(directory, reads):
+    catalog = CategoryCatalog(str(directory))
+    first = catalog.get("animals")
+    write_category(directory, "animals", ["cat", "dog", "emu"], mtime_ns=10**18)
+    second = catalog.get("animals")
+    assert second == ["cat", "dog", "emu"] and second is not first
+    assert catalog.get_entries()[0].word_count == 3
+    assert catalog.get("animals") is second
+
+    write_category(directory, "birds", ["owl"])
+    os.remove(directory / "ice_cream.txt")
+    assert catalog.refresh()
+    assert catalog.names() == ["animals", "birds"]
+    assert not catalog.is_loaded("ice_cream")
+    assert catalog.get("ice_cream") is None
+
+
+def test_removed_file(directory):
+    catalog = CategoryCatalog(str(directory))
+    catalog.get("animals")
+    os.remove(directory / "animals.txt")
+    assert catalog.get("animals") is None
+    assert "animals" not in catalog
+
+
+def test_least_recently_used_is_evicted(directory, reads):
+    write_category(directory, "birds", ["owl"])
+    catalog = CategoryCatalog(str(directory), max_loaded=2)
+    catalog.refresh()
+    catalog.get("animals")
+    catalog.get("birds")
+    assert not catalog.is_loaded("ice_cream")
+    del reads[:]
+    assert catalog.get("ice_cream") == ["vanilla", "chocolate"]
+    assert reads == ["ice_cream.txt"]
+    assert not catalog.is_loaded("animals") and catalog.is_loaded("birds")
+
+
+def test_nothing_kept_loaded(directory):
+    catalog = CategoryCatalog(str(directory), max_loaded=0)
+    assert catalog.get("animals") == ["cat", "dog"]
+    assert catalog.get("animals") == ["cat", "dog"]
+    assert not catalog.is_loaded("animals")
+
+
+def test_missing_directory(tmp_path):
+    catalog = CategoryCatalog(str(tmp_path / "missing"))
+    assert catalog.names() == []
+    assert catalog.get("animals") is None
@@ -0,0 +1,60 @@
+"""
+Tests for the display-independent game rules.
+"""
+from src.engine import HangmanEngine, LOST, PLAYING, WON
+
+
+def test_correct_and_wrong_guesses():
+    engine = HangmanEngine("python")
+    assert engine.word == "PYTHON"
+    assert engine.guess("p") is True
+    assert engine.guess("z") is False
+    assert engine.wrong_guesses == 1
+    assert engine.get_pattern() == "P_____"
+    assert engine.guessed_letters == ["P", "Z"]
+
+
+def test_repeated_guess_is_ignored():
+    engine = HangmanEngine("PYTHON")
+    engine.guess("Z")
+    assert engine.guess("Z") is None
+    assert engine.guess("z") is None
+    assert engine.wrong_guesses == 1
+
+
+def test_win():
+    engine = HangmanEngine("LEVEL")
+    for letter in "LEV":
+        assert engine.check_game_over() == PLAYING
+        assert engine.guess(letter) is True
+    assert engine.check_game_over() == WON
+    assert engine.get_pattern() == "LEVEL"
+    assert engine.guess("X") is None
+
+
+def test_lose():
+    engine = HangmanEngine("CAT", max_wrong_guesses=3)
+    engine.guess("A")
+    for letter in "XYZ":
+        engine.guess(letter)
+    assert engine.check_game_over() == LOST
+    assert engine.wrong_guesses == 3
+    assert engine.guess("C") is None
+
+
+def test_unguessable_characters_are_shown():
+    engine = HangmanEngine("ICE-CREAM")
+    assert engine.get_pattern() == "___-_____"
+    for letter in "ICERAM":
+        engine.guess(letter)
+    assert engine.check_game_over() == WON
+
+
+def test_restore():
+    engine = HangmanEngine()
+    engine.restore("DOG", 0b1000, 0)
+    assert engine.get_pattern() == "D__"
+    engine.restore("DOG", (1 << 3) | (1 << 14) | (1 << 6), 2)
+    assert engine.check_game_over() == WON
+    engine.restore("DOG", 0, 6)
+    assert engine.check_game_over() == LOST
@@ -0,0 +1,60 @@
+"""
+Tests for the hint solver, with NumPy and with the pure-Python fallback.
+"""
+import random
+import pytest
+import src.hint as hint
+from src.engine import HangmanEngine
+from src.hint import HintSolver
+from src.randomword import get_all_words
+
+WORDS = ["CAT", "COT", "CUT", "BAT", "HAT", "HIT", "DOG", "DIG", "TOT", "TAT"]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def mode(request, monkeypatch):
+    if request.param == "numpy":
+        if hint.np is None:
+            pytest.skip("NumPy is not installed")
+    else:
+        monkeypatch.setattr(hint, "np", None)
+    return request.param
+
+
+def test_suggests_an_unguessed_letter_of_a_candidate(mode):
+    solver = HintSolver(WORDS)
+    engine = HangmanEngine("DOG")
+    engine.guess("O")
+    engine.guess("T")
+    letter = solver.suggest(engine.get_pattern(), engine.guessed_mask, engine.wrong_mask)
+    assert letter in "DG"
+
+
+def test_no_candidates(mode):
+    solver = HintSolver(WORDS)
+    assert solver.suggest("____", 0, 0) is None
+    assert solver.suggest("Q__", 1 << 16, 0) is None
+
+
+def test_numpy_and_python_agree(monkeypatch):
+    if hint.np is None:
+        pytest.skip("NumPy is not installed")
+    numpy = hint.np
+    words = get_all_words()
+    solvers = {}
+    for module in (numpy, None):
+        monkeypatch.setattr(hint, "np", module)
+        solvers[module] = HintSolver(words)
+
+    def suggest(module, engine):
+        monkeypatch.setattr(hint, "np", module)
+        return solvers[module].suggest(engine.get_pattern(), engine.guessed_mask, engine.wrong_mask)
+
+    rng = random.Random(3)
+    for word in rng.sample(words, 60):
+        engine = HangmanEngine(word)
+        while not engine.result:
+            letter = suggest(None, engine)
+            assert suggest(numpy, engine) == letter
+            # Mix in wrong guesses so misses are probed as well
+            engine.guess(letter if rng.random() < 0.7 else rng.choice("QXZJVKW"))
@@ -0,0 +1,98 @@
+"""
+Tests for building word lists from corpus files.
+"""
+import os
+from src.catalog import CategoryCatalog
+from src.ingest import (clean_block, get_category_name, get_file_name, ingest, normalize_text,
+                        read_blocks, split_sections, write_word_lists)
+
+CORPUS = '''"""
+Word list file for Hangman game.
+One word per line.
+"""
+Apple
+banana
+apple
+o'clock
+ab
+"""
+Category: Big Cats
+Felines.
+"""
+lion
+Tiger
+lion
+"""
+Category: Words
+"""
+alpha
+'''
+
+
+def write_corpus(tmp_path, name="corpus.txt", text=CORPUS):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_normalize_text():
+    assert normalize_text("plain") == "plain"
+    assert normalize_text("ｃａｆé") == "café"
+    assert normalize_text("ﬁsh") == "fish"
+    assert normalize_text("Café", fold_accents=True) == "Cafe"
+
+
+def test_get_category_name():
+    assert get_category_name("\nCategory: Big Cats\nFelines.\n") == "big_cats"
+    assert get_category_name("category :  Sci-Fi!  ") == "sci-fi"
+    assert get_category_name("Word list file.\n") is None
+    assert get_category_name("Category: ???") is None
+
+
+def test_read_blocks_end_on_lines(tmp_path):
+    path = write_corpus(tmp_path, text="one\ntwo\nthree\nfour")
+    blocks = list(read_blocks(path, block_size=5))
+    assert all(block.endswith(b"\n") for block in blocks)
+    assert b"".join(blocks) == b"one\ntwo\nthree\nfour\n"
+
+
+def test_headers_split_across_blocks(tmp_path):
+    path = write_corpus(tmp_path)
+    for block_size in (7, 64, 1 << 20):
+        words = {}
+        for category, data in split_sections([path], block_size):
+            words.setdefault(category, set()).update(clean_block(category, data)[1])
+        assert words == {None: {"apple", "banana"}, "big_cats": {"lion", "tiger"}, "words": {"alpha"}}
+
+
+def test_each_file_starts_without_a_category(tmp_path):
+    first = write_corpus(tmp_path, "a.txt", '"""\nCategory: Fruit\n"""\npear\n')
+    second = write_corpus(tmp_path, "b.txt", "plum\n")
+    categories, stats = ingest([first, second], workers=1, block_size=8)
+    assert categories == {"fruit": {"pear"}, None: {"plum"}}
+    assert stats["words"] == 2
+
+
+def test_ingest_and_write(tmp_path):
+    categories, stats = ingest([write_corpus(tmp_path)], workers=2, block_size=16)
+    assert stats["words"] == 5
+    output = tmp_path / "wordlists"
+    written = write_word_lists(categories, str(output))
+    assert sorted(os.path.basename(path) for path in written) == \
+        ["big_cats.txt", "category_words.txt", "wordlist.txt"]
+    assert (output / "wordlist.txt").read_text().splitlines()[-2:] == ["apple", "banana"]
+
+    # The game finds every category, including the renamed one
+    catalog = CategoryCatalog(str(output))
+    assert catalog.names() == ["big_cats", "category_words"]
+    assert catalog.get("category_words") == ["alpha"]
+    assert catalog.get_entries()[0].title == "Big Cats"
+
+
+def test_categories_named_like_main_lists():
+    assert get_file_name(None) == "wordlist.txt"
+    assert get_file_name(None, "main.txt") == "main.txt"
+    assert get_file_name("animals") == "animals.txt"
+    assert get_file_name("wordlist") == "category_wordlist.txt"
+    assert get_file_name("words") == "category_words.txt"
+    assert get_file_name("main", "main.txt") == "category_main.txt"
@@ -0,0 +1,66 @@
+"""
+Tests for the hit map and input latency tracking.
+"""
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from src.input import HitMap, InputLatency
+
+
+def test_rect_buttons():
+    hits = HitMap((100, 80))
+    rect = pygame.Rect(10, 20, 30, 15)
+    hits.add_rect(rect, "start")
+    for x in range(100):
+        for y in range(80):
+            expected = "start" if rect.collidepoint(x, y) else None
+            assert hits.lookup((x, y)) == expected
+
+
+def test_circle_buttons():
+    hits = HitMap((60, 60))
+    hits.add_circle((30, 30), 10, "A")
+    for x in range(60):
+        for y in range(60):
+            inside = (x - 30) ** 2 + (y - 30) ** 2 < 10 ** 2
+            assert hits.lookup((x, y)) == ("A" if inside else None)
+
+
+def test_later_buttons_cover_earlier_ones():
+    hits = HitMap((50, 50))
+    hits.add_rect(pygame.Rect(0, 0, 30, 30), "back")
+    hits.add_rect(pygame.Rect(20, 20, 30, 30), "front")
+    assert hits.lookup((10, 10)) == "back"
+    assert hits.lookup((25, 25)) == "front"
+    hits.clear()
+    assert hits.lookup((25, 25)) is None
+
+
+def test_clipping_and_out_of_bounds():
+    hits = HitMap((40, 30))
+    hits.add_rect(pygame.Rect(-10, -10, 20, 20), "corner")
+    hits.add_circle((39, 29), 5, "edge")
+    assert hits.lookup((0, 0)) == "corner"
+    assert hits.lookup((9, 9)) == "corner"
+    assert hits.lookup((10, 10)) is None
+    assert hits.lookup((39, 29)) == "edge"
+    for pos in ((-1, 0), (0, -1), (40, 0), (0, 30)):
+        assert hits.lookup(pos) is None
+
+
+def test_input_latency():
+    latency = InputLatency(history=2)
+    assert latency.get_stats() == {"count": 0, "mean_ms": 0.0, "max_ms": 0.0}
+    latency.frame_shown()
+    assert latency.get_stats()["count"] == 0
+
+    for _ in range(3):
+        event = pygame.event.Event(pygame.KEYDOWN)
+        latency.stamp([event])
+        assert event.received == latency.pending
+        latency.frame_shown()
+    stats = latency.get_stats()
+    assert stats["count"] == 2
+    assert 0 <= stats["mean_ms"] <= stats["max_ms"]
@@ -0,0 +1,60 @@
+"""
+Tests for preparing the next round in the background.
+"""
+import src.randomword as randomword
+from src.prefetch import RoundPrefetcher
+
+
+def make_prefetcher():
+    discarded = []
+    prefetcher = RoundPrefetcher(lambda settings: f"round {settings}",
+                                 lambda settings, result: discarded.append((settings, result)))
+    return prefetcher, discarded
+
+
+def test_take_matching_round():
+    prefetcher, discarded = make_prefetcher()
+    prefetcher.start("easy")
+    assert prefetcher.take("easy") == "round easy"
+    assert prefetcher.take("easy") is None
+    assert discarded == []
+
+
+def test_round_for_other_settings_is_discarded():
+    prefetcher, discarded = make_prefetcher()
+    prefetcher.start("easy")
+    assert prefetcher.take("hard") is None
+    assert discarded == [("easy", "round easy")]
+
+
+def test_replaced_and_dropped_rounds_are_discarded():
+    prefetcher, discarded = make_prefetcher()
+    prefetcher.start("easy")
+    prefetcher.start("hard")
+    prefetcher.drop()
+    prefetcher.drop()
+    assert discarded == [("easy", "round easy"), ("hard", "round hard")]
+
+
+def test_failed_prepare():
+    def prepare(settings):
+        raise RuntimeError("no words")
+
+    discarded = []
+    prefetcher = RoundPrefetcher(prepare, lambda *args: discarded.append(args))
+    prefetcher.start("easy")
+    assert prefetcher.take("easy") is None
+    prefetcher.start("easy")
+    prefetcher.drop()
+    assert discarded == []
+
+
+def test_discarded_word_stays_in_the_bag(monkeypatch):
+    monkeypatch.setattr(randomword, "_samplers", {})
+    monkeypatch.setattr(randomword, "_bag_states", {})
+    monkeypatch.setattr(randomword, "_bag_state_file", None)
+    word = randomword.get_random_word("easy", no_repeat=True)
+    randomword.put_back_word(word.upper(), "easy")
+    assert randomword.get_random_word("easy", no_repeat=True) == word
+    randomword.put_back_word(word, "hard")
+    assert randomword.get_random_word("easy", no_repeat=True) != word
@@ -0,0 +1,62 @@
+"""
+Tests for the rendered text cache.
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+import pytest
+from src.render import TextCache
+
+BLACK = (0, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def font():
+    pygame.font.init()
+    yield pygame.font.Font(None, 24)
+    pygame.font.quit()
+
+
+def test_render_is_cached(font):
+    cache = TextCache()
+    first = cache.render(font, "Hello", BLACK)
+    assert cache.render(font, "Hello", [0, 0, 0]) is first
+    assert cache.render(font, "Hello", (255, 0, 0)) is not first
+    assert cache.get_stats() == {"hits": 1, "misses": 2, "size": 2}
+
+
+def test_least_recently_used_is_evicted(font):
+    cache = TextCache(max_size=2)
+    a = cache.render(font, "a", BLACK)
+    cache.render(font, "b", BLACK)
+    cache.render(font, "a", BLACK)
+    cache.render(font, "c", BLACK)
+    assert cache.render(font, "a", BLACK) is a
+    assert cache.get_stats()["size"] == 2
+    misses = cache.misses
+    cache.render(font, "b", BLACK)
+    assert cache.misses == misses + 1
+
+
+def test_put_keeps_an_existing_surface(font):
+    cache = TextCache()
+    surface = font.render("x", True, BLACK)
+    cache.put(font, "x", BLACK, surface)
+    assert cache.render(font, "x", BLACK) is surface
+    cache.put(font, "x", BLACK, font.render("x", True, BLACK))
+    assert cache.render(font, "x", BLACK) is surface
+
+
+def test_blit_glyphs(font):
+    cache = TextCache()
+    screen = pygame.Surface((200, 50))
+    area = cache.blit_glyphs(screen, font, "_A_A", BLACK, (10, 5))
+    assert area.topleft == (10, 5)
+    assert area.width == sum(font.size(char)[0] for char in "_A_A")
+    # Two distinct glyphs, the repeats are hits
+    assert cache.get_stats() == {"hits": 2, "misses": 2, "size": 2}
+    cache.clear()
+    assert cache.get_stats() == {"hits": 0, "misses": 0, "size": 0}
@@ -0,0 +1,105 @@
+"""
+Tests for alias-table and shuffled-bag word sampling.
+"""
+import random
+import pytest
+from src.sampler import (AliasTable, WordSampler, difficulty_weights, load_bag_states,
+                         save_bag_states)
+
+WORDS = ["cat", "dog", "emu", "fox", "gnu", "yak"]
+
+
+def test_alias_table_matches_the_weights():
+    weights = [1.0, 2.0, 0.0, 4.0, 1.0]
+    table = AliasTable(weights)
+    rng = random.Random(11)
+    draws = 50000
+    counts = [0] * len(weights)
+    for _ in range(draws):
+        counts[table.draw(rng)] += 1
+    assert counts[2] == 0
+    for count, weight in zip(counts, weights):
+        assert count / draws == pytest.approx(weight / sum(weights), abs=0.01)
+
+
+def test_alias_table_needs_a_positive_weight():
+    with pytest.raises(ValueError):
+        AliasTable([])
+    with pytest.raises(ValueError):
+        AliasTable([0.0, 0.0])
+
+
+def test_difficulty_weights():
+    scores = {"cat": 0.0, "dog": 3.0}
+    assert difficulty_weights(["cat", "dog"], "medium", scores) is None
+    assert difficulty_weights(["cat", "dog"], "easy", None) is None
+    assert difficulty_weights(["cat", "dog", "new"], "easy", scores) == [1.0, 0.25, 1.0]
+    assert difficulty_weights(["cat", "dog", "new"], "hard", scores) == [1.0, 4.0, 1.0]
+
+
+@pytest.mark.parametrize("weights", [None, [1.0, 5.0, 1.0, 0.5, 2.0, 1.0]])
+def test_bag_returns_every_word_before_repeating(weights):
+    sampler = WordSampler(WORDS, weights, rng=random.Random(2))
+    for _ in range(5):
+        bag = [sampler.next() for _ in WORDS]
+        assert sorted(bag) == sorted(WORDS)
+
+
+def test_bag_does_not_repeat_across_reshuffles():
+    for seed in range(50):
+        sampler = WordSampler(["cat", "dog"], rng=random.Random(seed))
+        picks = [sampler.next() for _ in range(20)]
+        assert all(a != b for a, b in zip(picks, picks[1:]))
+
+
+def test_empty_sampler():
+    sampler = WordSampler([])
+    assert sampler.draw() is None
+    assert sampler.next() is None
+    assert sampler.get_state() is None
+
+
+def test_bag_state_round_trip(tmp_path):
+    sampler = WordSampler(WORDS, rng=random.Random(4))
+    played = [sampler.next() for _ in range(3)]
+    path = str(tmp_path / "bags" / "word_bags.json")
+    save_bag_states({"easy/": sampler.get_state()}, path)
+
+    restored = WordSampler(WORDS, rng=random.Random(99))
+    assert restored.set_state(load_bag_states(path)["easy/"])
+    rest = [restored.next() for _ in range(3)]
+    assert sorted(played + rest) == sorted(WORDS)
+    assert rest == [sampler.next() for _ in range(3)]
+
+
+def test_bag_state_of_other_words_is_ignored():
+    sampler = WordSampler(WORDS, rng=random.Random(4))
+    sampler.next()
+    other = WordSampler(WORDS + ["owl"])
+    assert not other.set_state(sampler.get_state())
+    assert not other.set_state(None)
+
+
+def test_unreadable_bag_states(tmp_path):
+    assert load_bag_states(str(tmp_path / "missing.json")) == {}
+    path = tmp_path / "bad.json"
+    path.write_text("{not json")
+    assert load_bag_states(str(path)) == {}
+    path.write_text('{"version": 0, "bags": {"easy/": {}}}')
+    assert load_bag_states(str(path)) == {}
+
+
+def test_put_back():
+    sampler = WordSampler(WORDS, rng=random.Random(6))
+    assert not sampler.put_back("cat")
+    first = sampler.next()
+    second = sampler.next()
+    assert not sampler.put_back(first)
+    assert sampler.put_back(second.upper())
+    assert sampler.next() == second
+    # A bag that was just reshuffled can have its first word put back too
+    for _ in WORDS[2:]:
+        sampler.next()
+    word = sampler.next()
+    assert sampler.position == 1 and sampler.put_back(word)
+    assert sampler.next() == word
@@ -0,0 +1,120 @@
+"""
+Tests for the append-only save log.
+"""
+import os
+import pytest
+from src.engine import HangmanEngine
+from src.savegame import EVIL, HEADER, RECORD, SAVE_FILE, SaveLog, pack_record
+
+
+def make_engine(word, letters):
+    engine = HangmanEngine(word)
+    for letter in letters:
+        engine.guess(letter)
+    return engine
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "test.sav")
+    log = SaveLog(path)
+    log.save(1, make_engine("PYTHON", "PZ"), "hard", "animals")
+    log.save(2, make_engine("CAFÉ", "C"), evil=True)
+    log.save(1, make_engine("PYTHON", "PZY"), "hard", "animals")
+    log.close()
+
+    log = SaveLog(path)
+    saved = log.load(1)
+    assert saved["word"] == "PYTHON"
+    assert saved["difficulty"] == "hard"
+    assert saved["category"] == "animals"
+    assert saved["wrong_guesses"] == 1
+    assert not saved["flags"] & EVIL
+
+    engine = HangmanEngine()
+    assert log.resume(2, engine)["flags"] & EVIL
+    assert engine.get_pattern() == "C__É"
+    assert log.load(2)["category"] is None
+    log.close()
+
+
+def test_delete(tmp_path):
+    path = str(tmp_path / "test.sav")
+    log = SaveLog(path)
+    log.save(1, make_engine("CAT", "C"))
+    log.save(2, make_engine("DOG", "D"))
+    log.delete(1)
+    log.close()
+
+    log = SaveLog(path)
+    assert log.load(1) is None
+    assert log.load(2)["word"] == "DOG"
+    log.close()
+
+
+def test_compaction_keeps_live_sessions(tmp_path):
+    path = str(tmp_path / "test.sav")
+    log = SaveLog(path, compact_ratio=2, min_compact=8)
+    for letter in "ABCDEFGHIJ":
+        log.save(7, make_engine("JUMBLE", letter))
+    log.close()
+    assert os.path.getsize(path) < HEADER.size + 10 * RECORD.size
+
+    log = SaveLog(path)
+    assert log.load(7)["guessed_mask"] == make_engine("JUMBLE", "J").guessed_mask
+    log.close()
+
+
+@pytest.mark.parametrize("damage", ["torn", "corrupt"])
+def test_recovers_from_a_damaged_tail(tmp_path, damage):
+    path = str(tmp_path / "test.sav")
+    log = SaveLog(path)
+    log.save(1, make_engine("CAT", "C"))
+    log.save(2, make_engine("DOG", "D"))
+    log.close()
+    complete = os.path.getsize(path)
+
+    with open(path, "ab") as file:
+        record = pack_record(1, make_engine("CAT", "CA"))
+        if damage == "torn":
+            file.write(record[:RECORD.size // 2])
+        else:
+            file.write(record[:-1] + bytes([record[-1] ^ 0xFF]))
+
+    log = SaveLog(path)
+    assert os.path.getsize(path) == complete
+    assert log.load(1)["guessed_mask"] == make_engine("CAT", "C").guessed_mask
+    assert log.load(2)["word"] == "DOG"
+
+    # New records follow the last complete one
+    log.save(3, make_engine("EEL", "E"))
+    log.close()
+    log = SaveLog(path)
+    assert log.load(3)["word"] == "EEL"
+    assert log.load(1)["word"] == "CAT"
+    log.close()
+
+
+def test_incompatible_file_starts_a_new_log(tmp_path):
+    path = str(tmp_path / "test.sav")
+    with open(path, "wb") as file:
+        file.write(b"not a save log")
+    log = SaveLog(path)
+    assert log.load(1) is None
+    log.save(1, make_engine("CAT", ""))
+    log.close()
+    log = SaveLog(path)
+    assert log.load(1)["word"] == "CAT"
+    log.close()
+
+
+def test_long_word_is_rejected():
+    with pytest.raises(ValueError):
+        pack_record(1, HangmanEngine("X" * 49))
+    with pytest.raises(ValueError):
+        pack_record(1, HangmanEngine("CAT"), category="c" * 17)
+
+
+def test_save_file_is_next_to_the_package():
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    assert os.path.isabs(SAVE_FILE)
+    assert os.path.dirname(SAVE_FILE) == package_dir
@@ -0,0 +1,71 @@
+"""
+Tests for splitting scored words into difficulty levels.
+"""
+from src.randomword import find_word_list_file
+from src.scoring import difficulty_score, get_difficulty_scores, split_by_score
+
+
+def test_even_split():
+    scores = {f"w{i}": float(i) for i in range(9)}
+    levels, thresholds = split_by_score(scores)
+    assert thresholds == [2.0, 5.0]
+    assert [levels[f"w{i}"] for i in range(9)] == ["easy"] * 3 + ["medium"] * 3 + ["hard"] * 3
+
+
+def test_ties_share_a_level():
+    scores = {"a": 0.0, "b": 0.0, "c": 0.0, "d": 0.0, "e": 1.0, "f": 1.0, "g": 1.0, "h": 2.0, "i": 3.0}
+    levels, thresholds = split_by_score(scores)
+    by_score = {}
+    for word, score in scores.items():
+        by_score.setdefault(score, set()).add(levels[word])
+    assert all(len(found) == 1 for found in by_score.values())
+    assert thresholds == [0.0, 1.0]
+    assert levels["a"] == "easy" and levels["e"] == "medium" and levels["i"] == "hard"
+
+
+def test_mostly_equal_scores_keep_medium():
+    scores = {f"w{i}": 0.0 for i in range(8)}
+    scores.update({"x": 1.0, "y": 2.0})
+    levels, thresholds = split_by_score(scores)
+    assert thresholds == [0.0, 1.0]
+    assert levels["w0"] == "easy"
+    assert levels["x"] == "medium"
+    assert levels["y"] == "hard"
+
+
+def test_all_equal_scores():
+    levels, _ = split_by_score({"a": 0.5, "b": 0.5, "c": 0.5})
+    assert set(levels.values()) == {"easy"}
+
+
+def test_empty():
+    assert split_by_score({}) == ({}, [0.0, 0.0])
+
+
+def test_longer_words_score_harder():
+    assert difficulty_score("acknowledgement", 0.0) > difficulty_score("cat", 0.0)
+    assert difficulty_score("cat", 2.0) > difficulty_score("cats", 0.0)
+
+
+def test_easy_does_not_get_the_longest_words():
+    words = ["cat", "dog", "emu", "horse", "zebra", "giraffe", "elephant",
+             "crocodile", "hippopotamus", "rhinoceros", "acknowledgement", "ant"]
+    # The solver knows the list, so it finds nearly every word without a miss
+    misses = {word: 0.0 for word in words}
+    misses["emu"] = 1.0
+    levels, _ = split_by_score({word: difficulty_score(word, score) for word, score in misses.items()})
+    longest = sorted(words, key=len)[-3:]
+    assert all(levels[word] == "hard" for word in longest)
+    assert levels["cat"] == "easy"
+
+
+def test_bundled_scores():
+    scores = get_difficulty_scores(find_word_list_file())
+    assert scores is not None, "difficulty_scores.json is stale, re-run score_words.py"
+    lengths = {level: [len(word) for word, found in scores.levels.items() if found == level]
+               for level in ("easy", "medium", "hard")}
+    assert max(lengths["easy"]) < max(lengths["hard"])
+    assert sum(lengths["easy"]) / len(lengths["easy"]) < sum(lengths["hard"]) / len(lengths["hard"])
+    descriptions = scores.get_descriptions()
+    assert descriptions["easy"] != descriptions["hard"]
+    assert "letters" in descriptions["easy"]
@@ -0,0 +1,59 @@
+"""
+Tests for the line-protocol server.
+"""
+import asyncio
+import pytest
+from src.server import HangmanServer, Session, handle_request
+
+
+def new_session(word):
+    session = Session(None)
+    handle_request(session, "NEW")
+    session.engine.reset(word)
+    return session
+
+
+def test_new_and_state():
+    session = Session(None)
+    assert handle_request(session, "STATE") == "ERR no game, send NEW"
+    assert handle_request(session, "NEW easy").startswith("OK ")
+    assert handle_request(session, "NEW nonsense") == "ERR unknown difficulty or category 'nonsense'"
+    assert handle_request(session, "DANCE") == "ERR unknown command 'DANCE'"
+
+
+def test_guesses():
+    session = new_session("CAT")
+    assert handle_request(session, "GUESS c") == "HIT C__ 0/6"
+    assert handle_request(session, "GUESS C") == "REPEAT C__ 0/6"
+    assert handle_request(session, "GUESS z") == "MISS C__ 1/6"
+    assert handle_request(session, "GUESS A") == "HIT CA_ 1/6"
+    assert handle_request(session, "GUESS T") == "WON CAT 1/6 CAT"
+
+
+@pytest.mark.parametrize("letter", ["ß", "ﬀ", "é", "Ω", "1", "", "AB", "-"])
+def test_guess_rejects_anything_but_one_ascii_letter(letter):
+    session = new_session("CAT")
+    assert handle_request(session, f"GUESS {letter}") == "ERR guess one letter A-Z"
+    assert session.engine.guessed_mask == 0
+
+
+def test_session_over_tcp():
+    async def play():
+        server = HangmanServer(port=0)
+        port = await server.start()
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        replies = []
+        for request in ("GUESS A", "NEW easy", "GUESS ß", "NEW café", "QUIT"):
+            writer.write(request.encode('utf-8') + b"\n")
+            replies.append((await reader.readline()).decode('utf-8'))
+        writer.close()
+        await server.close()
+        return replies, server.tasks
+
+    replies, tasks = asyncio.run(play())
+    assert replies[0] == "ERR no game, send NEW\n"
+    assert replies[1].startswith("OK ")
+    assert replies[2] == "ERR guess one letter A-Z\n"
+    assert replies[3] == "ERR unknown difficulty or category 'café'\n"
+    assert replies[4] == "BYE\n"
+    assert not tasks
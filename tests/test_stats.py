@@ -0,0 +1,106 @@
+"""
+Tests for the SQLite statistics store.
+"""
+import os
+import sqlite3
+import pytest
+from src.stats import STATS_FILE, StatsStore
+
+GAMES = [
+    # word, difficulty, category, won, wrong guesses, duration
+    ("cat", "easy", None, True, 1, 10.0),
+    ("dog", "easy", None, True, 0, 5.0),
+    ("zebra", "hard", "animals", False, 6, 30.0),
+    ("emu", "easy", "animals", True, 2, 8.0),
+    ("lynx", "hard", None, True, 3, 20.0),
+    ("yak", "evil", None, True, 4, 40.0),
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    # Small batches, so the totals are carried across several transactions
+    store = StatsStore(str(tmp_path / "stats.db"), batch_size=2, flush_interval=0.05)
+    yield store
+    store.close()
+
+
+def by_group(summary):
+    return {(row["grouping"], row["name"]): row for row in summary}
+
+
+def test_totals_and_streaks(store):
+    for game in GAMES:
+        store.record(*game)
+    summary = store.get_summary().result(5)
+    assert summary[0]["grouping"] == "all"
+    groups = by_group(summary)
+
+    overall = groups[("all", "")]
+    assert (overall["games"], overall["wins"]) == (6, 5)
+    assert overall["avg_wrong"] == pytest.approx(16 / 6)
+    assert (overall["streak"], overall["best_streak"]) == (3, 3)
+
+    easy = groups[("difficulty", "easy")]
+    assert (easy["games"], easy["wins"], easy["best_streak"]) == (3, 3, 3)
+    assert easy["avg_duration"] == pytest.approx(23 / 3)
+    hard = groups[("difficulty", "hard")]
+    assert (hard["games"], hard["win_rate"], hard["streak"]) == (2, 0.5, 1)
+    animals = groups[("category", "animals")]
+    assert (animals["games"], animals["wins"], animals["streak"]) == (2, 1, 1)
+    # Games without a category only count towards the other groups
+    assert ("category", "") not in groups
+
+
+def test_totals_match_the_games_table(store):
+    for _ in range(7):
+        for game in GAMES:
+            store.record(*game)
+    store.flush(5)
+
+    def count(db):
+        return db.execute("SELECT difficulty, COUNT(*), SUM(won), SUM(wrong_guesses) "
+                          "FROM games GROUP BY difficulty").fetchall()
+
+    groups = by_group(store.get_summary().result(5))
+    for difficulty, games, wins, wrong in store.query(count).result(5):
+        row = groups[("difficulty", difficulty)]
+        assert (row["games"], row["wins"], row["avg_wrong"] * row["games"]) == \
+            (games, wins, pytest.approx(wrong))
+
+
+def test_leaderboard(store):
+    for game in GAMES:
+        store.record(*game)
+    assert store.get_leaderboard("easy").result(5) == [("dog", 0, 5.0), ("emu", 2, 8.0), ("cat", 1, 10.0)]
+    assert store.get_leaderboard("easy", limit=1).result(5) == [("dog", 0, 5.0)]
+    assert store.get_leaderboard("hard").result(5) == [("lynx", 3, 20.0)]
+
+
+def test_close_writes_queued_results(tmp_path):
+    path = str(tmp_path / "stats.db")
+    store = StatsStore(path, flush_interval=60)
+    for game in GAMES:
+        store.record(*game)
+    store.close()
+
+    with sqlite3.connect(path) as db:
+        assert db.execute("SELECT COUNT(*) FROM games").fetchone() == (6,)
+    store = StatsStore(path)
+    store.record(*GAMES[0])
+    assert by_group(store.get_summary().result(5))[("all", "")]["games"] == 7
+    store.close()
+
+
+def test_unopenable_database(tmp_path):
+    store = StatsStore(str(tmp_path))
+    with pytest.raises(sqlite3.Error):
+        store.get_summary().result(5)
+    assert store.failed()
+    store.record(*GAMES[0])
+    store.close()
+
+
+def test_stats_file_is_next_to_the_package():
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    assert os.path.dirname(STATS_FILE) == package_dir
@@ -0,0 +1,82 @@
+"""
+Tests for the compiled, cached word list index.
+"""
+import os
+import pytest
+import src.wordindex as wordindex
+from src.wordindex import WordIndex, get_file_stamp, letter_mask, load_index, read_index
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(wordindex, "_loaded", {})
+
+
+def write_words(path, words, mtime_ns=None):
+    with open(path, "w") as file:
+        file.write("\n".join(words) + "\n")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def counting_loader(calls):
+    def loader(path):
+        calls.append(path)
+        with open(path) as file:
+            return [line.strip() for line in file if line.strip()]
+    return loader
+
+
+def test_build_buckets():
+    index = WordIndex.build(["cat", "zebra", "horse", "jazz"])
+    assert index.by_length[5] == ["zebra", "horse"]
+    assert index.masks[0] == letter_mask("cat")
+    assert index.get_words() == ["cat", "zebra", "horse", "jazz"]
+    assert set(index.get_words("hard")) >= {"jazz"}
+    assert index.random_word("easy") in index.get_words("easy")
+
+
+def test_saved_index_is_reused(tmp_path):
+    path = str(tmp_path / "words.txt")
+    write_words(path, ["cat", "dog", "horse"])
+    calls = []
+    first = load_index(path, counting_loader(calls))
+    assert os.path.exists(path + ".idx")
+
+    # A new process finds the saved index instead of reading the list
+    wordindex._loaded.clear()
+    second = load_index(path, counting_loader(calls))
+    assert calls == [path]
+    assert second.words == first.words
+    assert load_index(path, counting_loader(calls)) is second
+
+
+@pytest.mark.parametrize("change", ["mtime", "size", "tag"])
+def test_stale_index_is_rebuilt(tmp_path, change):
+    path = str(tmp_path / "words.txt")
+    write_words(path, ["cat", "dog"], mtime_ns=10**18)
+    calls = []
+    load_index(path, counting_loader(calls), tag="a")
+    wordindex._loaded.clear()
+
+    tag = "a"
+    if change == "mtime":
+        write_words(path, ["cow", "pig"], mtime_ns=2 * 10**18)
+    elif change == "size":
+        write_words(path, ["cat", "dog", "emu"], mtime_ns=10**18)
+    else:
+        tag = "b"
+    index = load_index(path, counting_loader(calls), tag=tag)
+    assert len(calls) == 2
+    assert index.words == counting_loader([])(path)
+
+
+def test_corrupt_index_is_ignored(tmp_path):
+    path = str(tmp_path / "words.txt")
+    write_words(path, ["cat", "dog"])
+    with open(path + ".idx", "wb") as file:
+        file.write(b"not a pickle")
+    stamp = get_file_stamp(path) + (None,)
+    assert read_index(path + ".idx", stamp) is None
+    assert load_index(path, counting_loader([])).words == ["cat", "dog"]
+    assert read_index(path + ".idx", stamp) is not None
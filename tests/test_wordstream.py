@@ -0,0 +1,85 @@
+"""
+Tests for sampling words straight from a word list file.
+"""
+import random
+from collections import OrderedDict
+import pytest
+import src.randomword as randomword
+from src.wordindex import difficulties_for, letter_mask
+from src.wordstream import accept_line, offset_sample, reservoir_sample, sample_word_from_file
+
+WORDS = ["apple", "banana", "cherry", "jazz", "quixotic", "dog"]
+DATA = b"apple\nBanana \no'clock\nab\ncherry\n\njazz\nquixotic\ndog"
+
+
+def test_accept_line():
+    assert accept_line(b"Banana \r") == "banana"
+    assert accept_line(b"o'clock") is None
+    assert accept_line(b"ab") is None
+    assert accept_line(b"Caf\xc3\xa9") == "café"
+
+
+@pytest.mark.parametrize("sample", [offset_sample, reservoir_sample])
+def test_samples_only_valid_words(sample):
+    rng = random.Random(5)
+    picks = {sample(DATA, rng=rng) for _ in range(2000)}
+    assert picks == set(WORDS)
+
+
+@pytest.mark.parametrize("sample", [offset_sample, reservoir_sample])
+def test_samples_uniformly(sample):
+    # Lines of very different lengths must still be equally likely
+    data = b"\n".join([b"cat", b"d" * 40, b"emu", b"f" * 25])
+    rng = random.Random(9)
+    counts = {}
+    for _ in range(8000):
+        word = sample(data, rng=rng)
+        counts[word] = counts.get(word, 0) + 1
+    assert len(counts) == 4
+    assert all(1600 < count < 2400 for count in counts.values())
+
+
+def test_difficulty_filter():
+    rng = random.Random(1)
+    for difficulty in ("easy", "medium", "hard"):
+        allowed = {word for word in WORDS if difficulty in difficulties_for(word, letter_mask(word))}
+        picks = {reservoir_sample(DATA, difficulty, rng) for _ in range(300)}
+        assert picks == (allowed or {None})
+
+
+def test_sample_word_from_file(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_bytes(DATA)
+    assert sample_word_from_file(str(path)) in WORDS
+    assert sample_word_from_file(str(path), method="reservoir") in WORDS
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert sample_word_from_file(str(empty)) is None
+    assert offset_sample(b"") is None
+
+
+@pytest.fixture
+def streamed_list(tmp_path, monkeypatch):
+    path = tmp_path / "wordlist.txt"
+    path.write_text("\n".join(f"word{chr(97 + i)}{chr(97 + j)}" for i in range(26) for j in range(26)))
+    monkeypatch.setattr(randomword, "WORD_LIST_FILES", [str(tmp_path / "missing.txt"), str(path)])
+    monkeypatch.setattr(randomword, "STREAMING_THRESHOLD", path.stat().st_size)
+    monkeypatch.setattr(randomword, "_recent_words", OrderedDict())
+    return path
+
+
+def test_streamed_no_repeat(streamed_list):
+    picks = [randomword.get_random_word(no_repeat=True) for _ in range(300)]
+    assert all(word.startswith("word") for word in picks)
+    assert len(set(picks)) == len(picks)
+
+
+def test_list_growing_past_the_threshold_is_streamed(streamed_list, monkeypatch):
+    monkeypatch.setattr(randomword, "STREAMING_THRESHOLD", streamed_list.stat().st_size + 100)
+    assert randomword.find_word_list()[0] == str(streamed_list)
+    monkeypatch.setattr(randomword, "sample_word_from_file", lambda *args: "streamed")
+    assert randomword.get_random_word() != "streamed"
+
+    with open(streamed_list, "a") as file:
+        file.write("\n" + "\n".join(["extra"] * 50))
+    assert randomword.get_random_word() == "streamed"